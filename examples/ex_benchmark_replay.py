@@ -0,0 +1,69 @@
+"""Benchmark the ESPN-backed pipelines offline against recorded responses
+
+Record the responses once, with network access:
+
+    python examples/ex_benchmark_replay.py --record --cassette-dir cassettes
+
+Then benchmark as often as needed, without the network:
+
+    python examples/ex_benchmark_replay.py --cassette-dir cassettes --repeat 5
+"""
+import argparse
+import statistics
+import time
+
+import sportsdataverse as sdv
+from sportsdataverse.dl_utils import RecordingTransport, ReplayTransport, set_transport
+
+CFB_GAME_IDS = [401301025, 401403867]
+
+
+def bench(name, func, repeat, units=None):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func()
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    rate = f"  {count / median:,.0f} {units}/s" if units else ""
+    print(f"{name:<28} median {median * 1000:8.1f} ms  best {min(timings) * 1000:8.1f} ms{rate}")
+
+
+def cfb_pipeline():
+    plays = 0
+    for game_id in CFB_GAME_IDS:
+        processor = sdv.cfb.CFBPlayProcess(gameId=game_id)
+        processor.espn_cfb_pbp()
+        processor.run_processing_pipeline()
+        plays += len(processor.plays_json)
+    return plays
+
+
+def cfb_schedule():
+    return sdv.cfb.espn_cfb_schedule(dates=2022, week=1).height
+
+
+def cfb_rosters():
+    return sum(sdv.cfb.espn_cfb_game_rosters(game_id=game_id).height for game_id in CFB_GAME_IDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette-dir", default="cassettes")
+    parser.add_argument("--record", action="store_true", help="Record responses from the network")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.record:
+        set_transport(RecordingTransport(args.cassette_dir))
+        cfb_pipeline(), cfb_schedule(), cfb_rosters()
+        print(f"Recorded responses to {args.cassette_dir}")
+        return
+    set_transport(ReplayTransport(args.cassette_dir))
+    bench("CFB processing pipeline", cfb_pipeline, args.repeat, units="plays")
+    bench("CFB schedule parsing", cfb_schedule, args.repeat, units="games")
+    bench("CFB roster assembly", cfb_rosters, args.repeat, units="players")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ extras = {
         "pytest-xdist>=2.1.0",
     ],
     "docs": ["sphinx"],
+    "fastjson": ["orjson>=3.6.0", "msgspec>=0.18.0"],
     "models": [
         "beautifulsoup4>=4.4.0",
         "inflection>=0.5.1",
@@ -40,7 +41,7 @@ extras = {
     ],
 }
 
-extras["all"] = extras["tests"] + extras["docs"] + extras["models"]
+extras["all"] = extras["tests"] + extras["docs"] + extras["models"] + extras["fastjson"]
 
 setup(
     name="sportsdataverse",
@@ -138,9 +139,9 @@ setup(
     # To provide executable scripts, use entry points in preference to the
     # "scripts" keyword. Entry points provide cross-platform support and allow
     # pip to create the appropriate form of executable for the target platform.
-    # entry_points={
-    #    'console_scripts': [
-    #        'sample=sample:main',
-    #    ],
-    # },
+    entry_points={
+        "console_scripts": [
+            "sportsdataverse=sportsdataverse.cli:main",
+        ],
+    },
 )
@@ -1,7 +1,6 @@
-from typing import List
+from typing import Iterator, List
 
 import polars as pl
-from tqdm import tqdm
 
 from sportsdataverse.config import (
     CFB_BASE_URL,
@@ -11,10 +10,19 @@ from sportsdataverse.config import (
     CFB_TEAM_LOGO_URL,
     CFB_TEAM_SCHEDULE_URL,
 )
-from sportsdataverse.errors import SeasonNotFoundError
-
-
-def load_cfb_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+from sportsdataverse.loader_utils import as_return_type, iter_seasons, load_file, load_seasons
+
+
+def load_cfb_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    compact=False,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load college football play by play data going back to 2003
 
     Example:
@@ -23,25 +31,86 @@ def load_cfb_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 2003 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "regular"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        compact (bool): If True, low-cardinality string columns are returned as `pl.Categorical` and
+            integer-valued columns such as downs, yard lines and flags are downcast to the smallest integer
+            type that holds them. Cannot be combined with `return_as="lazy"`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
 
+    Raises:
+        ValueError: If `season` is less than 2003.
+        ValueError: If `compact` is True and `return_as` is "lazy".
+    """
+    data = load_seasons(
+        CFB_BASE_URL,
+        seasons,
+        min_season=2003,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        compact=compact,
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def iter_cfb_pbp(
+    seasons: List[int], batch="season", columns=None, filters=None, return_as_pandas=False
+) -> Iterator[pl.DataFrame]:
+    """Iterate over college football play by play data going back to 2003, one batch at a time
+
+    Only one season is held in memory at a time while the next season's file is
+    downloaded in the background.
+
+    Example:
+        `for cfb_df in sportsdataverse.cfb.iter_cfb_pbp(seasons=range(2003,2021)):`
+
+    Args:
+        seasons (list): Used to define different seasons. 2003 is the earliest available season.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one dataframe
+            per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "regular"}` or a list of `(column, op, value)` tuples.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+
+    Yields:
+        pl.DataFrame: Polars dataframe containing one season or row group of the play-by-plays.
+
     Raises:
         ValueError: If `season` is less than 2003.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2003:
-            raise SeasonNotFoundError("season cannot be less than 2003")
-        i_data = pl.read_parquet(CFB_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    return iter_seasons(
+        CFB_BASE_URL,
+        seasons,
+        min_season=2003,
+        batch=batch,
+        columns=columns,
+        filters=filters,
+        return_as_pandas=return_as_pandas,
+    )
+
+
+def load_cfb_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load college football schedule data
 
     Example:
@@ -50,6 +119,15 @@ def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "regular"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -57,19 +135,28 @@ def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(CFB_TEAM_SCHEDULE_URL.format(season=i), use_pyarrow=True, columns=None)
-        # data = data.append(i_data)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        CFB_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=2002,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_cfb_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load roster data
 
     Example:
@@ -78,6 +165,15 @@ def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame
     Args:
         seasons (list): Used to define different seasons. 2014 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "regular"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing rosters available for the requested seasons.
@@ -85,18 +181,28 @@ def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame
     Raises:
         ValueError: If `season` is less than 2014.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2004:
-            raise SeasonNotFoundError("season cannot be less than 2004")
-        i_data = pl.read_parquet(CFB_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        CFB_ROSTER_URL,
+        seasons,
+        min_season=2004,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_cfb_team_info(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load college football team info
 
     Example:
@@ -105,6 +211,15 @@ def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFra
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "regular"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the team info available for the requested seasons.
@@ -112,21 +227,21 @@ def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFra
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        try:
-            i_data = pl.read_parquet(CFB_TEAM_INFO_URL.format(season=i), use_pyarrow=True, columns=None)
-        except Exception:
-            print(f"We don't seem to have data for the {i} season.")
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_cfb_betting_lines(return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        CFB_TEAM_INFO_URL,
+        seasons,
+        min_season=2002,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+        missing_ok=True,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_cfb_betting_lines(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load college football betting lines information
 
     Example:
@@ -134,21 +249,22 @@ def load_cfb_betting_lines(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing betting lines available for the available seasons.
     """
 
-    return (
-        pl.read_parquet(CFB_BETTING_LINES_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(CFB_BETTING_LINES_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(CFB_BETTING_LINES_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def get_cfb_teams(return_as_pandas=False) -> pl.DataFrame:
+def get_cfb_teams(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load college football team ID information and logos
 
     Example:
@@ -156,13 +272,16 @@ def get_cfb_teams(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"conference": "SEC"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing teams available.
     """
 
-    return (
-        pl.read_parquet(CFB_TEAM_LOGO_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(CFB_TEAM_LOGO_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(CFB_TEAM_LOGO_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
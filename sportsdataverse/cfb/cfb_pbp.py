@@ -34,7 +34,8 @@ from sportsdataverse.cfb.model_vars import (
     wp_start_columns,
     wp_start_touchback_columns,
 )
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import download, run_async, stack_frames
+from sportsdataverse.play_text import play_text_tokens, text_has, text_yards
 
 ep_model_file = resource_filename("sportsdataverse", "cfb/models/ep_model.model")
 wp_spread_file = resource_filename("sportsdataverse", "cfb/models/wp_spread.model")
@@ -52,6 +53,9 @@ qbr_model.load_model(qbr_model_file)
 logger = logging.getLogger("sdv.cfb_pbp")
 logger.addHandler(logging.NullHandler())
 
+# Summary keys read by the cleaning methods of the play processor
+SUMMARY_KEYS_REQUIRED = ["header", "drives", "pickcenter"]
+
 
 class CFBPlayProcess(object):
     gameId = 0
@@ -71,7 +75,7 @@ class CFBPlayProcess(object):
         self.path_to_json = path_to_json
         self.return_keys = return_keys
 
-    def espn_cfb_pbp(self, **kwargs):
+    def espn_cfb_pbp(self, keys=None, **kwargs):
         """espn_cfb_pbp() - Pull the game by id. Data from API endpoints: `college-football/playbyplay`,
         `college-football/summary`
 
@@ -79,6 +83,9 @@ class CFBPlayProcess(object):
             game_id (int): Unique game_id, can be obtained from cfb_schedule().
             raw (bool): If True, returns the raw json from the API endpoint. If False, returns a
             cleaned dictionary of datasets.
+            keys (list): Top-level keys of the summary to decode, e.g. `["drives", "boxscore"]`. The keys
+             the cleaning needs ("header", "drives", "pickcenter") are always decoded; the others are skipped
+             without being parsed and returned empty. If None, every key is decoded.
 
         Returns:
             Dict: Dictionary of game data with keys - "gameId", "plays", "boxscore", "header", "broadcasts",
@@ -93,7 +100,8 @@ class CFBPlayProcess(object):
         pbp_txt = {"timeouts": {}}
         # summary endpoint for pickcenter array
         summary_url = f"http://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={self.gameId}&{cache_buster}"
-        summary_resp = download(url=summary_url, **kwargs)
+        json_keys = None if keys is None else [*keys, *SUMMARY_KEYS_REQUIRED]
+        summary_resp = download(url=summary_url, json_keys=json_keys, **kwargs)
         summary = summary_resp.json()
         incoming_keys_expected = [
             "boxscore",
@@ -164,6 +172,15 @@ class CFBPlayProcess(object):
 
         return self.json
 
+    async def aespn_cfb_pbp(self, **kwargs):
+        """aespn_cfb_pbp() - Coroutine version of `espn_cfb_pbp()`, run under the shared limit
+        set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+        Example:
+            `cfb_df = await sportsdataverse.cfb.CFBPlayProcess(gameId=game_id).aespn_cfb_pbp()`
+        """
+        return await run_async(self.espn_cfb_pbp, **kwargs)
+
     def cfb_pbp_disk(self):
         with open(os.path.join(self.path_to_json, f"{self.gameId}.json")) as json_file:
             pbp_txt = json.load(json_file)
@@ -460,88 +477,31 @@ class CFBPlayProcess(object):
             .get_column("id")
             .to_list()
         )
-        # end_timeouts = pbp_txt["plays"].select(
-        #     (
-        #         3
-        #         - pl.struct(["id", "period.number"]).apply(
-        #             lambda x: (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") <= 2)
-        #                     for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["1"]
-        #                 )
-        #             )
-        #             | (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") > 2)
-        #                     for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["2"]
-        #                 )
-        #             ),
-        #             return_dtype=pl.Int64,
-        #         )
-        #     ).alias("end.homeTeamTimeouts"),
-        #     (
-        #         3
-        #         - pl.struct(["id", "period.number"]).apply(
-        #             lambda x: (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") <= 2)
-        #                     for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["1"]
-        #                 )
-        #             )
-        #             | (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") > 2)
-        #                     for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["2"]
-        #                 )
-        #             ),
-        #             return_dtype=pl.Int64,
-        #         )
-        #     ).alias("end.awayTeamTimeouts"),
-        # )
-        # pbp_txt["plays"] = pbp_txt["plays"].join(end_timeouts, on=["id", "period.number"], how="left")
         pbp_txt["plays"] = (
             pbp_txt["plays"]
+            # plays are sorted by id, so a running count per half gives the timeouts called up to each play;
+            # plays sharing an id all see the timeouts called under that id
             .with_columns(
-                (
-                    3
-                    - pl.struct(["id", "period.number"]).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["2"]
-                            )
-                        ),
-                        return_dtype=pl.Int64,
-                    )
-                ).alias("end.homeTeamTimeouts"),
-                (
-                    3
-                    - pl.struct(["id", "period.number"]).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["2"]
-                            )
-                        ),
-                        return_dtype=pl.Int64,
-                    )
-                ).alias("end.awayTeamTimeouts"),
+                (3 - pl.col("homeTimeoutCalled").cast(pl.Int64).cumsum().over(["game_id", "half"])).alias(
+                    "end.homeTeamTimeouts"
+                ),
+                (3 - pl.col("awayTimeoutCalled").cast(pl.Int64).cumsum().over(["game_id", "half"])).alias(
+                    "end.awayTeamTimeouts"
+                ),
             )
             .with_columns(
-                pl.col("end.homeTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.homeTeamTimeouts"),
-                pl.col("end.awayTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.awayTeamTimeouts"),
+                pl.col("end.homeTeamTimeouts").min().over(["game_id", "half", "id"]),
+                pl.col("end.awayTeamTimeouts").min().over(["game_id", "half", "id"]),
+            )
+            .with_columns(
+                pl.col("end.homeTeamTimeouts")
+                .shift_and_fill(periods=1, fill_value=3)
+                .over("game_id")
+                .alias("start.homeTeamTimeouts"),
+                pl.col("end.awayTeamTimeouts")
+                .shift_and_fill(periods=1, fill_value=3)
+                .over("game_id")
+                .alias("start.awayTeamTimeouts"),
                 pl.col("start.TimeSecsRem").shift(periods=1).alias("end.TimeSecsRem"),
                 pl.col("start.adj_TimeSecsRem").shift(periods=1).alias("end.adj_TimeSecsRem"),
             )
@@ -834,10 +794,12 @@ class CFBPlayProcess(object):
             * id, drive_id, game_id
             * down, ydstogo (distance), game_half, period
         """
-        play_df = play_df.sort(by=["id", "start.adj_TimeSecsRem"])
+        play_df = play_df.sort(by=["game_id", "id", "start.adj_TimeSecsRem"])
 
         play_df = play_df.unique(
-            subset=["text", "id", "type.text", "start.down", "sequenceNumber"], keep="last", maintain_order=True
+            subset=["game_id", "text", "id", "type.text", "start.down", "sequenceNumber"],
+            keep="last",
+            maintain_order=True,
         )
         play_df = play_df.filter(
             pl.col("type.text").str.contains("(?i)end of|(?i)coin toss|(?i)end period|(?i)wins toss") == False
@@ -848,8 +810,8 @@ class CFBPlayProcess(object):
                 half=pl.when(pl.col("period.number") <= 2).then(1).otherwise(2),
             )
             .with_columns(
-                lead_half=pl.col("half").shift(-1),
-                lag_scoringPlay=pl.col("scoringPlay").shift(1),
+                lead_half=pl.col("half").shift(-1).over("game_id"),
+                lag_scoringPlay=pl.col("scoringPlay").shift(1).over("game_id"),
             )
             .with_columns(
                 pl.when(pl.col("lead_half").is_null()).then(2).otherwise(pl.col("lead_half")).alias("lead_half"),
@@ -867,6 +829,20 @@ class CFBPlayProcess(object):
 
         return play_df
 
+    def __add_text_tokens(self, play_df):
+        """
+        Creates the following columns in play_df:
+            * text_tokens: every flag and yardage the later stages read from the play text,
+              matched once against the lowercased text (see `sportsdataverse.play_text`)
+        """
+        play_df = (
+            play_df.with_columns(text_lower=pl.col("text").str.to_lowercase())
+            .with_columns(play_text_tokens(pl.col("text_lower")))
+            .drop("text_lower")
+        )
+
+        return play_df
+
     def __add_play_type_flags(self, play_df):
         """
         Creates the following columns in play_df:
@@ -876,61 +852,51 @@ class CFBPlayProcess(object):
         play_df = (
             play_df.with_columns(
                 scoring_play=pl.when(pl.col("type.text").is_in(scores_vec)).then(True).otherwise(False),
-                td_play=pl.col("text").str.contains("(?i)touchdown|(?i)for a TD"),
+                td_play=text_has("touchdown|for a td"),
                 touchdown=pl.col("type.text").str.contains("(?i)touchdown"),
                 ## Portion of touchdown check for plays where touchdown is not listed in the play_type--
-                td_check=pl.col("text").str.contains("(?i)touchdown"),
-                safety=pl.col("text").str.contains("(?i)safety"),
-                fumble_vec=pl.when(pl.col("text").str.contains("(?i)fumble"))
+                td_check=text_has("touchdown"),
+                safety=text_has("safety"),
+                fumble_vec=pl.when(text_has("fumble"))
                 .then(True)
                 .when(
-                    (pl.col("text").str.contains("(?i)fumble")).and_(
+                    (text_has("fumble")).and_(
                         pl.col("type.text") == "Rush", pl.col("start.pos_team.id") != pl.col("end.pos_team.id")
                     )
                 )
                 .then(True)
                 .when(
-                    (pl.col("text").str.contains("(?i)fumble")).and_(
+                    (text_has("fumble")).and_(
                         pl.col("type.text") == "Sack", pl.col("start.pos_team.id") != pl.col("end.pos_team.id")
                     )
                 )
                 .then(True)
                 .otherwise(False),
-                forced_fumble=pl.when(pl.col("text").str.contains("(?i)forced by")).then(True).otherwise(False),
+                forced_fumble=pl.when(text_has("forced by")).then(True).otherwise(False),
                 # --- Kicks----
                 kickoff_play=pl.col("type.text").is_in(kickoff_vec),
             )
             .with_columns(
-                kickoff_tb=pl.when((pl.col("text").str.contains("(?i)touchback")).and_(pl.col("kickoff_play") == True))
+                kickoff_tb=pl.when(text_has("touchback").and_(pl.col("kickoff_play") == True))
                 .then(True)
-                .when((pl.col("text").str.contains("(?i)kickoff$")).and_(pl.col("kickoff_play") == True))
+                .when(text_has("kickoff$").and_(pl.col("kickoff_play") == True))
                 .then(True)
                 .otherwise(False),
-                kickoff_onside=pl.when(
-                    (pl.col("text").str.contains("(?i)on-side|(?i)onside|(?i)on side")).and_(
-                        pl.col("kickoff_play") == True
-                    )
-                )
+                kickoff_onside=pl.when((text_has("on-side|onside|on side")).and_(pl.col("kickoff_play") == True))
                 .then(True)
                 .otherwise(False),
-                kickoff_oob=pl.when(
-                    (pl.col("text").str.contains("(?i)out-of-bounds|(?i)out of bounds")).and_(
-                        pl.col("kickoff_play") == True
-                    )
-                )
+                kickoff_oob=pl.when((text_has("out-of-bounds|out of bounds")).and_(pl.col("kickoff_play") == True))
                 .then(True)
                 .otherwise(False),
-                kickoff_fair_catch=pl.when(
-                    (pl.col("text").str.contains("(?i)fair catch|(?i)fair caught")).and_(pl.col("kickoff_play") == True)
-                )
+                kickoff_fair_catch=pl.when((text_has("fair catch|fair caught")).and_(pl.col("kickoff_play") == True))
                 .then(True)
                 .otherwise(False),
-                kickoff_downed=pl.when((pl.col("text").str.contains("(?i)downed")).and_(pl.col("kickoff_play") == True))
+                kickoff_downed=pl.when(text_has("downed").and_(pl.col("kickoff_play") == True))
                 .then(True)
                 .otherwise(False),
-                kick_play=pl.col("text").str.contains("(?i)kick|(?i)kickoff"),
+                kick_play=text_has("kick|kickoff"),
                 kickoff_safety=pl.when(
-                    (pl.col("text").str.contains("(?i)kickoff")).and_(
+                    (text_has("kickoff")).and_(
                         pl.col("safety") == True, pl.col("type.text").is_in(["Blocked Punt", "Penalty"]) == False
                     )
                 )
@@ -938,31 +904,19 @@ class CFBPlayProcess(object):
                 .otherwise(False),
                 # --- Punts----
                 punt=pl.col("type.text").is_in(punt_vec),
-                punt_play=pl.col("text").str.contains("(?i)punt"),
+                punt_play=text_has("punt"),
             )
             .with_columns(
-                punt_tb=pl.when((pl.col("text").str.contains("(?i)touchback")).and_(pl.col("punt") == True))
-                .then(True)
-                .otherwise(False),
-                punt_oob=pl.when(
-                    (pl.col("text").str.contains("(?i)out-of-bounds|(?i)out of bounds")).and_(pl.col("punt") == True)
-                )
-                .then(True)
-                .otherwise(False),
-                punt_fair_catch=pl.when(
-                    (pl.col("text").str.contains("(?i)fair catch|(?i)fair caught")).and_(pl.col("punt") == True)
-                )
+                punt_tb=pl.when(text_has("touchback").and_(pl.col("punt") == True)).then(True).otherwise(False),
+                punt_oob=pl.when((text_has("out-of-bounds|out of bounds")).and_(pl.col("punt") == True))
                 .then(True)
                 .otherwise(False),
-                punt_downed=pl.when((pl.col("text").str.contains("(?i)downed")).and_(pl.col("punt") == True))
-                .then(True)
-                .otherwise(False),
-                punt_safety=pl.when((pl.col("text").str.contains("(?i)punt")).and_(pl.col("safety") == True))
-                .then(True)
-                .otherwise(False),
-                punt_blocked=pl.when((pl.col("text").str.contains("(?i)blocked")).and_(pl.col("punt") == True))
+                punt_fair_catch=pl.when((text_has("fair catch|fair caught")).and_(pl.col("punt") == True))
                 .then(True)
                 .otherwise(False),
+                punt_downed=pl.when(text_has("downed").and_(pl.col("punt") == True)).then(True).otherwise(False),
+                punt_safety=pl.when(text_has("punt").and_(pl.col("safety") == True)).then(True).otherwise(False),
+                punt_blocked=pl.when(text_has("blocked").and_(pl.col("punt") == True)).then(True).otherwise(False),
                 penalty_safety=pl.when((pl.col("type.text").is_in(["Penalty"])).and_(pl.col("safety") == True))
                 .then(True)
                 .otherwise(False),
@@ -1077,7 +1031,7 @@ class CFBPlayProcess(object):
                                     "Fumble Return Touchdown",
                                 ]
                             )
-                        ).and_(pl.col("text").str.contains("(?i)sacked"), pl.col("pass") == True)
+                        ).and_(text_has("sacked"), pl.col("pass") == True)
                     )
                 )
                 .then(True)
@@ -1104,8 +1058,8 @@ class CFBPlayProcess(object):
             .with_columns(
                 is_home=pl.col("pos_team") == pl.col("homeTeamId"),
                 # --- Team Score variables ------
-                lag_homeScore=pl.col("homeScore").shift(1),
-                lag_awayScore=pl.col("awayScore").shift(1),
+                lag_homeScore=pl.col("homeScore").shift(1).over("game_id"),
+                lag_awayScore=pl.col("awayScore").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_HA_score_diff=pl.col("lag_homeScore") - pl.col("lag_awayScore"),
@@ -1158,8 +1112,8 @@ class CFBPlayProcess(object):
             )
             .drop(["lag_homeScore", "lag_awayScore"])
             .with_columns(
-                lag_homeScore=pl.col("homeScore").shift(1),
-                lag_awayScore=pl.col("awayScore").shift(1),
+                lag_homeScore=pl.col("homeScore").shift(1).over("game_id"),
+                lag_awayScore=pl.col("awayScore").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_homeScore=pl.when(pl.col("lag_homeScore").is_null()).then(0).otherwise(pl.col("lag_homeScore")),
@@ -1208,19 +1162,19 @@ class CFBPlayProcess(object):
             )
             .with_columns(
                 (pl.col("end.pos_team_score") - pl.col("end.def_pos_team_score")).alias("end.pos_score_diff"),
-                pl.col("pos_team").shift(1).alias("lag_pos_team"),
+                pl.col("pos_team").shift(1).over("game_id").alias("lag_pos_team"),
             )
             .with_columns(
                 pl.when(pl.col("lag_pos_team").is_null())
                 .then(pl.col("pos_team"))
                 .otherwise(pl.col("lag_pos_team"))
                 .alias("lag_pos_team"),
-                pl.col("pos_team").shift(-1).alias("lead_pos_team"),
-                pl.col("pos_team").shift(-2).alias("lead_pos_team2"),
+                pl.col("pos_team").shift(-1).over("game_id").alias("lead_pos_team"),
+                pl.col("pos_team").shift(-2).over("game_id").alias("lead_pos_team2"),
                 (pl.col("pos_team_score") - pl.col("def_pos_team_score")).alias("pos_score_diff"),
             )
             .with_columns(
-                pl.col("pos_score_diff").shift(1).alias("lag_pos_score_diff"),
+                pl.col("pos_score_diff").shift(1).over("game_id").alias("lag_pos_score_diff"),
             )
             .with_columns(
                 pl.when(pl.col("lag_pos_score_diff").is_null())
@@ -1393,17 +1347,13 @@ class CFBPlayProcess(object):
                 .alias("type.text"),
             )
             .with_columns(
-                pl.when(
-                    (pl.col("type.text").is_in(["Blocked Field Goal"])).and_(
-                        pl.col("text").str.contains("(?i)for a TD")
-                    )
-                )
+                pl.when((pl.col("type.text").is_in(["Blocked Field Goal"])).and_(text_has("for a td")))
                 .then(pl.lit("Blocked Field Goal Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
-                pl.when((pl.col("type.text").is_in(["Blocked Punt"])).and_(pl.col("text").str.contains("(?i)for a TD")))
+                pl.when((pl.col("type.text").is_in(["Blocked Punt"])).and_(text_has("for a td")))
                 .then(pl.lit("Blocked Punt Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1416,18 +1366,14 @@ class CFBPlayProcess(object):
             )
             .with_columns(
                 # -- Fix Pass Interception Return TD play_type labels----
-                pl.when(pl.col("text").str.contains("(?i)pass intercepted for a TD"))
+                pl.when(text_has("pass intercepted for a td"))
                 .then(pl.lit("Interception Return Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
                 # -- Fix Sack/Fumbles Touchdown play_type labels----
-                pl.when(
-                    (pl.col("text").str.contains("(?i)sacked"))
-                    .and_(pl.col("text").str.contains("(?i)fumbled"))
-                    .and_(pl.col("text").str.contains("(?i)TD"))
-                )
+                pl.when((text_has("sacked")).and_(text_has("fumbled")).and_(text_has("td")))
                 .then(pl.lit("Fumble Recovery (Opponent) Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1435,39 +1381,35 @@ class CFBPlayProcess(object):
             .with_columns(
                 # -- Fix generic pass plays ----
                 ##-- first one looks for complete pass
-                pl.when((pl.col("type.text") == "Pass").and_(pl.col("text").str.contains("(?i)pass complete")))
+                pl.when((pl.col("type.text") == "Pass").and_(text_has("pass complete")))
                 .then(pl.lit("Pass Completion"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
                 ##-- second one looks for incomplete pass
-                pl.when((pl.col("type.text") == "Pass").and_(pl.col("text").str.contains("(?i)pass incomplete")))
+                pl.when((pl.col("type.text") == "Pass").and_(text_has("pass incomplete")))
                 .then(pl.lit("Pass Incompletion"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
                 ##-- third one looks for interceptions
-                pl.when((pl.col("type.text") == "Pass").and_(pl.col("text").str.contains("(?i)pass intercepted")))
+                pl.when((pl.col("type.text") == "Pass").and_(text_has("pass intercepted")))
                 .then(pl.lit("Pass Interception"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
                 ##-- fourth one looks for sacked
-                pl.when((pl.col("type.text") == "Pass").and_(pl.col("text").str.contains("(?i)sacked")))
+                pl.when((pl.col("type.text") == "Pass").and_(text_has("sacked")))
                 .then(pl.lit("Sack"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
                 ##-- fifth one play type is Passing Touchdown, but its intercepted
-                pl.when(
-                    (pl.col("type.text") == "Passing Touchdown").and_(
-                        pl.col("text").str.contains("(?i)pass intercepted for a TD")
-                    )
-                )
+                pl.when((pl.col("type.text") == "Passing Touchdown").and_(text_has("pass intercepted for a td")))
                 .then(pl.lit("Interception Return Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1493,11 +1435,7 @@ class CFBPlayProcess(object):
                     .and_(pl.col("fumble_vec") == False)
                 )
                 .then(pl.lit("Kickoff Return Touchdown"))
-                .when(
-                    (pl.col("type.text") == "Kickoff")
-                    .and_(pl.col("text").str.contains("(?i)for a TD"))
-                    .and_(pl.col("fumble_vec") == False)
-                )
+                .when((pl.col("type.text") == "Kickoff").and_(text_has("for a td")).and_(pl.col("fumble_vec") == False))
                 .then(pl.lit("Kickoff Return Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1519,11 +1457,7 @@ class CFBPlayProcess(object):
                     .and_(pl.col("change_of_poss") == 1)
                 )
                 .then(pl.lit("Punt Return Touchdown"))
-                .when(
-                    (pl.col("type.text") == "Punt")
-                    .and_(pl.col("text").str.contains("(?i)for a TD"))
-                    .and_(pl.col("change_of_poss") == 1)
-                )
+                .when((pl.col("type.text") == "Punt").and_(text_has("for a td")).and_(pl.col("change_of_poss") == 1))
                 .then(pl.lit("Punt Return Touchdown"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1596,15 +1530,13 @@ class CFBPlayProcess(object):
                 .alias("type.text"),
             )
             .with_columns(
-                pl.when((pl.col("type.text") == "Extra Point Good").and_(pl.col("text").str.contains("(?i)Two-Point")))
+                pl.when((pl.col("type.text") == "Extra Point Good").and_(text_has("two-point")))
                 .then(pl.lit("Two-Point Conversion Good"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
             )
             .with_columns(
-                pl.when(
-                    (pl.col("type.text") == "Extra Point Missed").and_(pl.col("text").str.contains("(?i)Two-Point"))
-                )
+                pl.when((pl.col("type.text") == "Extra Point Missed").and_(text_has("two-point")))
                 .then(pl.lit("Two-Point Conversion Missed"))
                 .otherwise(pl.col("type.text"))
                 .alias("type.text"),
@@ -1628,44 +1560,36 @@ class CFBPlayProcess(object):
         play_df = (
             play_df.with_columns(
                 # -- T/F flag conditions penalty_flag
-                penalty_flag=pl.when((pl.col("type.text") == "Penalty").or_(pl.col("text").str.contains("(?i)penalty")))
+                penalty_flag=pl.when((pl.col("type.text") == "Penalty").or_(text_has("penalty")))
                 .then(True)
                 .otherwise(False),
                 # -- T/F flag conditions penalty_declined
-                penalty_declined=pl.when(
-                    (pl.col("type.text") == "Penalty").and_(pl.col("text").str.contains("(?i)declined"))
-                )
+                penalty_declined=pl.when((pl.col("type.text") == "Penalty").and_(text_has("declined")))
                 .then(True)
                 .otherwise(False),
                 # -- T/F flag conditions penalty_no_play
-                penalty_no_play=pl.when(
-                    (pl.col("type.text") == "Penalty").and_(pl.col("text").str.contains("(?i)no play"))
-                )
+                penalty_no_play=pl.when((pl.col("type.text") == "Penalty").and_(text_has("no play")))
                 .then(True)
                 .otherwise(False),
                 # -- T/F flag conditions penalty_offset
-                penalty_offset=pl.when(
-                    (pl.col("type.text") == "Penalty").and_(pl.col("text").str.contains("(?i)off-setting"))
-                )
+                penalty_offset=pl.when((pl.col("type.text") == "Penalty").and_(text_has("off-setting")))
                 .then(True)
-                .when((pl.col("text").str.contains("(?i)penalty")).and_(pl.col("text").str.contains("(?i)off-setting")))
+                .when(text_has("penalty").and_(text_has("off-setting")))
                 .then(True)
                 .otherwise(False),
                 # -- T/F flag conditions penalty_1st_conv
-                penalty_1st_conv=pl.when(
-                    (pl.col("type.text") == "Penalty").and_(pl.col("text").str.contains("(?i)1st down"))
-                )
+                penalty_1st_conv=pl.when((pl.col("type.text") == "Penalty").and_(text_has("1st down")))
                 .then(True)
-                .when((pl.col("text").str.contains("(?i)penalty")).and_(pl.col("text").str.contains("(?i)1st down")))
+                .when(text_has("penalty").and_(text_has("1st down")))
                 .then(True)
                 .otherwise(False),
                 # -- T/F flag for penalty text but not penalty play type --
                 penalty_in_text=pl.when(
-                    (pl.col("text").str.contains("(?i)penalty")).and_(
+                    (text_has("penalty")).and_(
                         pl.col("type.text") != "Penalty",
-                        pl.col("text").str.contains("(?i)declined") == False,
-                        pl.col("text").str.contains("(?i)off-setting") == False,
-                        pl.col("text").str.contains("(?i)no play") == False,
+                        text_has("declined") == False,
+                        text_has("off-setting") == False,
+                        text_has("no play") == False,
                     )
                 )
                 .then(True)
@@ -1676,115 +1600,115 @@ class CFBPlayProcess(object):
                 .then(pl.lit("Offsetting"))
                 .when(pl.col("penalty_declined") == 1)
                 .then(pl.lit("Declined"))
-                .when(pl.col("text").str.contains("(?i)roughing passer"))
+                .when(text_has("roughing passer"))
                 .then(pl.lit("Roughing the Passer"))
-                .when(pl.col("text").str.contains("(?i)offensive holding"))
+                .when(text_has("offensive holding"))
                 .then(pl.lit("Offensive Holding"))
-                .when(pl.col("text").str.contains("(?i)pass interference"))
+                .when(text_has("pass interference"))
                 .then(pl.lit("Pass Interference"))
-                .when(pl.col("text").str.contains("(?i)encroachment"))
+                .when(text_has("encroachment"))
                 .then(pl.lit("Encroachment"))
-                .when(pl.col("text").str.contains("(?i)defensive pass interference"))
+                .when(text_has("defensive pass interference"))
                 .then(pl.lit("Defensive Pass Interference"))
-                .when(pl.col("text").str.contains("(?i)offensive pass interference"))
+                .when(text_has("offensive pass interference"))
                 .then(pl.lit("Offensive Pass Interference"))
-                .when(pl.col("text").str.contains("(?i)illegal procedure"))
+                .when(text_has("illegal procedure"))
                 .then(pl.lit("Illegal Procedure"))
-                .when(pl.col("text").str.contains("(?i)defensive holding"))
+                .when(text_has("defensive holding"))
                 .then(pl.lit("Defensive Holding"))
-                .when(pl.col("text").str.contains("(?i)holding"))
+                .when(text_has("holding"))
                 .then(pl.lit("Holding"))
-                .when(pl.col("text").str.contains("(?i)offensive offside|(?i)offside offense"))
+                .when(text_has("offensive offside|offside offense"))
                 .then(pl.lit("Offensive Offside"))
-                .when(pl.col("text").str.contains("(?i)defensive offside|(?i)offside defense"))
+                .when(text_has("defensive offside|offside defense"))
                 .then(pl.lit("Defensive Offside"))
-                .when(pl.col("text").str.contains("(?i)offside"))
+                .when(text_has("offside"))
                 .then(pl.lit("Offside"))
-                .when(pl.col("text").str.contains("(?i)illegal fair catch signal"))
+                .when(text_has("illegal fair catch signal"))
                 .then(pl.lit("Illegal Fair Catch Signal"))
-                .when(pl.col("text").str.contains("(?i)illegal batting"))
+                .when(text_has("illegal batting"))
                 .then(pl.lit("Illegal Batting"))
-                .when(pl.col("text").str.contains("(?i)neutral zone infraction"))
+                .when(text_has("neutral zone infraction"))
                 .then(pl.lit("Neutral Zone Infraction"))
-                .when(pl.col("text").str.contains("(?i)ineligible downfield"))
+                .when(text_has("ineligible downfield"))
                 .then(pl.lit("Ineligible Downfield"))
-                .when(pl.col("text").str.contains("(?i)illegal use of hands"))
+                .when(text_has("illegal use of hands"))
                 .then(pl.lit("Illegal Use of Hands"))
-                .when(pl.col("text").str.contains("(?i)kickoff out of bounds|(?i)kickoff out-of-bounds"))
+                .when(text_has("kickoff out of bounds|kickoff out-of-bounds"))
                 .then(pl.lit("Kickoff Out of Bounds"))
-                .when(pl.col("text").str.contains("(?i)12 men on the field"))
+                .when(text_has("12 men on the field"))
                 .then(pl.lit("12 Men on the Field"))
-                .when(pl.col("text").str.contains("(?i)illegal block"))
+                .when(text_has("illegal block"))
                 .then(pl.lit("Illegal Block"))
-                .when(pl.col("text").str.contains("(?i)personal foul"))
+                .when(text_has("personal foul"))
                 .then(pl.lit("Personal Foul"))
-                .when(pl.col("text").str.contains("(?i)false start"))
+                .when(text_has("false start"))
                 .then(pl.lit("False Start"))
-                .when(pl.col("text").str.contains("(?i)substitution infraction"))
+                .when(text_has("substitution infraction"))
                 .then(pl.lit("Substitution Infraction"))
-                .when(pl.col("text").str.contains("(?i)illegal formation"))
+                .when(text_has("illegal formation"))
                 .then(pl.lit("Illegal Formation"))
-                .when(pl.col("text").str.contains("(?i)illegal touching"))
+                .when(text_has("illegal touching"))
                 .then(pl.lit("Illegal Touching"))
-                .when(pl.col("text").str.contains("(?i)sideline interference"))
+                .when(text_has("sideline interference"))
                 .then(pl.lit("Sideline Interference"))
-                .when(pl.col("text").str.contains("(?i)clipping"))
+                .when(text_has("clipping"))
                 .then(pl.lit("Clipping"))
-                .when(pl.col("text").str.contains("(?i)sideline infraction"))
+                .when(text_has("sideline infraction"))
                 .then(pl.lit("Sideline Infraction"))
-                .when(pl.col("text").str.contains("(?i)crackback"))
+                .when(text_has("crackback"))
                 .then(pl.lit("Crackback"))
-                .when(pl.col("text").str.contains("(?i)illegal snap"))
+                .when(text_has("illegal snap"))
                 .then(pl.lit("Illegal Snap"))
-                .when(pl.col("text").str.contains("(?i)illegal helmet contact"))
+                .when(text_has("illegal helmet contact"))
                 .then(pl.lit("Illegal Helmet Contact"))
-                .when(pl.col("text").str.contains("(?i)roughing holder"))
+                .when(text_has("roughing holder"))
                 .then(pl.lit("Roughing the Holder"))
-                .when(pl.col("text").str.contains("(?i)horse collar tackle"))
+                .when(text_has("horse collar tackle"))
                 .then(pl.lit("Horse Collar Tackle"))
-                .when(pl.col("text").str.contains("(?i)illegal participation"))
+                .when(text_has("illegal participation"))
                 .then(pl.lit("Illegal Participation"))
-                .when(pl.col("text").str.contains("(?i)tripping"))
+                .when(text_has("tripping"))
                 .then(pl.lit("Tripping"))
-                .when(pl.col("text").str.contains("(?i)illegal shift"))
+                .when(text_has("illegal shift"))
                 .then(pl.lit("Illegal Shift"))
-                .when(pl.col("text").str.contains("(?i)illegal motion"))
+                .when(text_has("illegal motion"))
                 .then(pl.lit("Illegal Motion"))
-                .when(pl.col("text").str.contains("(?i)roughing the kicker"))
+                .when(text_has("roughing the kicker"))
                 .then(pl.lit("Roughing the Kicker"))
-                .when(pl.col("text").str.contains("(?i)delay of game"))
+                .when(text_has("delay of game"))
                 .then(pl.lit("Delay of Game"))
-                .when(pl.col("text").str.contains("(?i)targeting"))
+                .when(text_has("targeting"))
                 .then(pl.lit("Targeting"))
-                .when(pl.col("text").str.contains("(?i)face mask"))
+                .when(text_has("face mask"))
                 .then(pl.lit("Face Mask"))
-                .when(pl.col("text").str.contains("(?i)illegal forward pass"))
+                .when(text_has("illegal forward pass"))
                 .then(pl.lit("Illegal Forward Pass"))
-                .when(pl.col("text").str.contains("(?i)intentional grounding"))
+                .when(text_has("intentional grounding"))
                 .then(pl.lit("Intentional Grounding"))
-                .when(pl.col("text").str.contains("(?i)illegal kicking"))
+                .when(text_has("illegal kicking"))
                 .then(pl.lit("Illegal Kicking"))
-                .when(pl.col("text").str.contains("(?i)illegal conduct"))
+                .when(text_has("illegal conduct"))
                 .then(pl.lit("Illegal Conduct"))
-                .when(pl.col("text").str.contains("(?i)kick catching interference"))
+                .when(text_has("kick catching interference"))
                 .then(pl.lit("Kick Catch Interference"))
-                .when(pl.col("text").str.contains("(?i)kick catch interference"))
+                .when(text_has("kick catch interference"))
                 .then(pl.lit("Kick Catch Interference"))
-                .when(pl.col("text").str.contains("(?i)unnecessary roughness"))
+                .when(text_has("unnecessary roughness"))
                 .then(pl.lit("Unnecessary Roughness"))
-                .when(pl.col("text").str.contains("(?i)Penalty, UR"))
+                .when(text_has("penalty, ur"))
                 .then(pl.lit("Unnecessary Roughness"))
-                .when(pl.col("text").str.contains("(?i)roughing the snapper"))
+                .when(text_has("roughing the snapper"))
                 .then(pl.lit("Roughing the Snapper"))
-                .when(pl.col("text").str.contains("(?i)illegal blindside block"))
+                .when(text_has("illegal blindside block"))
                 .then(pl.lit("Illegal Blindside Block"))
-                .when(pl.col("text").str.contains("(?i)unsportsmanlike conduct"))
+                .when(text_has("unsportsmanlike conduct"))
                 .then(pl.lit("Unsportsmanlike Conduct"))
-                .when(pl.col("text").str.contains("(?i)running into kicker"))
+                .when(text_has("running into kicker"))
                 .then(pl.lit("Running Into Kicker"))
-                .when(pl.col("text").str.contains("(?i)failure to wear required equipment"))
+                .when(text_has("failure to wear required equipment"))
                 .then(pl.lit("Failure to Wear Required Equipment"))
-                .when(pl.col("text").str.contains("(?i)player disqualification"))
+                .when(text_has("player disqualification"))
                 .then(pl.lit("Player Disqualification"))
                 .when(pl.col("penalty_flag") == True)
                 .then(pl.lit("Missing"))
@@ -1805,9 +1729,7 @@ class CFBPlayProcess(object):
             )
             .with_columns(
                 yds_penalty=pl.when(
-                    (pl.col("penalty_flag") == True).and_(
-                        pl.col("yds_penalty").is_null(), pl.col("text").str.contains(r"(?i)ards\)")
-                    )
+                    (pl.col("penalty_flag") == True).and_(pl.col("yds_penalty").is_null(), text_has(r"ards\)"))
                 )
                 .then(
                     pl.col("text")
@@ -1839,10 +1761,10 @@ class CFBPlayProcess(object):
                         )
                     )
                     .and_(pl.col("pass") == True)
-                    .and_(pl.col("text").str.contains("(?i)sacked"))
+                    .and_(text_has("sacked"))
                 )
                 .then(True)
-                .when((pl.col("type.text").is_in(["Safety"])).and_(pl.col("text").str.contains("(?i)sacked")))
+                .when((pl.col("type.text").is_in(["Safety"])).and_(text_has("sacked")))
                 .then(True)
                 .otherwise(False),
                 # --- Interceptions ------
@@ -1865,7 +1787,7 @@ class CFBPlayProcess(object):
                         )
                     )
                     .and_(pl.col("pass") == True)
-                    .and_(pl.col("text").str.contains("(?i)sacked") == False)
+                    .and_(text_has("sacked") == False)
                 )
                 .then(True)
                 .otherwise(False),
@@ -1887,10 +1809,10 @@ class CFBPlayProcess(object):
                         )
                     )
                     .and_(pl.col("pass") == True)
-                    .and_(pl.col("text").str.contains("(?i)sacked") == False)
+                    .and_(text_has("sacked") == False)
                 )
                 .then(True)
-                .when((pl.col("pass") == True).and_(pl.col("text").str.contains("(?i)sacked") == False))
+                .when((pl.col("pass") == True).and_(text_has("sacked") == False))
                 .then(True)
                 .otherwise(False),
                 target=pl.when(
@@ -1911,13 +1833,13 @@ class CFBPlayProcess(object):
                         )
                     )
                     .and_(pl.col("pass") == True)
-                    .and_(pl.col("text").str.contains("(?i)sacked") == False)
+                    .and_(text_has("sacked") == False)
                 )
                 .then(True)
-                .when((pl.col("pass") == True).and_(pl.col("text").str.contains("(?i)sacked") == False))
+                .when((pl.col("pass") == True).and_(text_has("sacked") == False))
                 .then(True)
                 .otherwise(False),
-                pass_breakup=pl.when(pl.col("text").str.contains("(?i)broken up by")).then(True).otherwise(False),
+                pass_breakup=pl.when(text_has("broken up by")).then(True).otherwise(False),
                 # --- Pass/Rush TDs ------
                 pass_td=pl.when(pl.col("type.text").is_in(["Passing Touchdown"]))
                 .then(True)
@@ -1943,13 +1865,9 @@ class CFBPlayProcess(object):
                 .otherwise(False),
                 # --- Touchdowns ----
                 scoring_play=pl.col("type.text").is_in(scores_vec),
-                yds_punted=pl.col("text").str.extract(r"(?i)(punt for \d+)").str.extract(r"(\d+)").cast(pl.Int32),
+                yds_punted=text_yards(r"(punt for \d+)"),
                 yds_punt_gained=pl.when(pl.col("punt") == True).then(pl.col("statYardage")).otherwise(None),
-                fg_attempt=pl.when(
-                    (pl.col("type.text").str.contains(r"(?i)Field Goal")).or_(
-                        pl.col("text").str.contains(r"(?i)Field Goal")
-                    )
-                )
+                fg_attempt=pl.when((pl.col("type.text").str.contains(r"(?i)Field Goal")).or_(text_has("field goal")))
                 .then(True)
                 .otherwise(False),
                 fg_made=pl.col("type.text") == "Field Goal Good",
@@ -2003,7 +1921,7 @@ class CFBPlayProcess(object):
                 .then(pl.lit("Defense"))
                 .otherwise(pl.lit("Defense")),
                 # --- Lags/Leads play type ----
-                lead_play_type=pl.col("type.text").shift(-1),
+                lead_play_type=pl.col("type.text").shift(-1).over("game_id"),
                 sp=pl.when(
                     (pl.col("fg_attempt") == True).or_(pl.col("punt") == True).or_(pl.col("kickoff_play") == True)
                 )
@@ -2091,84 +2009,52 @@ class CFBPlayProcess(object):
 
     def __add_yardage_cols(self, play_df):
         play_df = play_df.with_columns(
-            yds_rushed=pl.when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)run for no gain")))
+            yds_rushed=pl.when((pl.col("rush") == True).and_(text_has("run for no gain")))
             .then(0)
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)for no gain")))
+            .when((pl.col("rush") == True).and_(text_has("for no gain")))
             .then(0)
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)run for a loss of")))
-            .then(-1 * pl.col("text").str.extract(r"(?i)run for a loss of (\d+)").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)rush for a loss of")))
-            .then(-1 * pl.col("text").str.extract(r"(?i)rush for a loss of (\d+)").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)run for")))
-            .then(pl.col("text").str.extract(r"(?i)run for (\d+)").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)rush for")))
-            .then(pl.col("text").str.extract(r"(?i)rush for (\d+)").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)Yd Run")))
-            .then(pl.col("text").str.extract(r"(?i)(\d+) Yd Run").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)Yd Rush")))
-            .then(pl.col("text").str.extract(r"(?i)(\d+) Yd Rush").cast(pl.Int32))
-            .when((pl.col("rush") == True).and_(pl.col("text").str.contains("(?i)Yard Rush")))
-            .then(pl.col("text").str.extract(r"(?i)(\d+) Yard Rush").cast(pl.Int32))
-            .when(
-                (pl.col("rush") == True)
-                .and_(pl.col("text").str.contains("(?i)rushed"))
-                .and_(pl.col("text").str.contains("(?i)touchdown") == False)
-            )
-            .then(pl.col("text").str.extract(r"(?i)for (\d+) yards").cast(pl.Int32))
-            .when(
-                (pl.col("rush") == True)
-                .and_(pl.col("text").str.contains("(?i)rushed"))
-                .and_(pl.col("text").str.contains("(?i)touchdown") == True)
-            )
-            .then(pl.col("text").str.extract(r"(?i)for a (\d+) yard").cast(pl.Int32))
+            .when((pl.col("rush") == True).and_(text_has("run for a loss of")))
+            .then(-1 * text_yards(r"run for a loss of (\d+)"))
+            .when((pl.col("rush") == True).and_(text_has("rush for a loss of")))
+            .then(-1 * text_yards(r"rush for a loss of (\d+)"))
+            .when((pl.col("rush") == True).and_(text_has("run for")))
+            .then(text_yards(r"run for (\d+)"))
+            .when((pl.col("rush") == True).and_(text_has("rush for")))
+            .then(text_yards(r"rush for (\d+)"))
+            .when((pl.col("rush") == True).and_(text_has("yd run")))
+            .then(text_yards(r"(\d+) yd run"))
+            .when((pl.col("rush") == True).and_(text_has("yd rush")))
+            .then(text_yards(r"(\d+) yd rush"))
+            .when((pl.col("rush") == True).and_(text_has("yard rush")))
+            .then(text_yards(r"(\d+) yard rush"))
+            .when((pl.col("rush") == True).and_(text_has("rushed")).and_(text_has("touchdown") == False))
+            .then(text_yards(r"for (\d+) yards"))
+            .when((pl.col("rush") == True).and_(text_has("rushed")).and_(text_has("touchdown") == True))
+            .then(text_yards(r"for a (\d+) yard"))
             .otherwise(None),
-            yds_receiving=pl.when(
-                (pl.col("pass") == True)
-                .and_(pl.col("text").str.contains(r"(?i)complete to"))
-                .and_(pl.col("text").str.contains(r"(?i)for no gain"))
-            )
+            yds_receiving=pl.when((pl.col("pass") == True).and_(text_has("complete to")).and_(text_has("for no gain")))
             .then(0)
-            .when(
-                (pl.col("pass") == True)
-                .and_(pl.col("text").str.contains(r"(?i)complete to"))
-                .and_(pl.col("text").str.contains(r"(?i)for a loss of"))
-            )
-            .then(-1 * pl.col("text").str.extract(r"(?i)for a loss of (\d+)").cast(pl.Int32))
-            .when((pl.col("pass") == True).and_(pl.col("text").str.contains(r"(?i)complete to")))
-            .then(pl.col("text").str.extract(r"(?i)for (\d+)").cast(pl.Int32))
-            .when(
-                (pl.col("pass") == True).and_(
-                    pl.col("text").str.contains(r"(?i)incomplete|(?i) sacked|(?i)intercepted|(?i)pass defensed")
-                )
-            )
+            .when((pl.col("pass") == True).and_(text_has("complete to")).and_(text_has("for a loss of")))
+            .then(-1 * text_yards(r"for a loss of (\d+)"))
+            .when((pl.col("pass") == True).and_(text_has("complete to")))
+            .then(text_yards(r"for (\d+)"))
+            .when((pl.col("pass") == True).and_(text_has("incomplete| sacked|intercepted|pass defensed")))
             .then(0)
-            .when((pl.col("pass") == True).and_(pl.col("text").str.contains(r"(?i)incompletion")))
+            .when((pl.col("pass") == True).and_(text_has("incompletion")))
             .then(0)
-            .when((pl.col("pass") == True).and_(pl.col("text").str.contains(r"(?i)Yd pass")))
-            .then(pl.col("text").str.extract(r"(?i)(\d+) Yd pass").cast(pl.Int32))
+            .when((pl.col("pass") == True).and_(text_has("yd pass")))
+            .then(text_yards(r"(\d+) yd pass"))
             .otherwise(None),
             yds_int_return=pl.when(
-                (pl.col("pass") == True)
-                .and_(pl.col("int_td") == True)
-                .and_(pl.col("text").str.contains(r"(?i)Yd Interception Return"))
-            )
-            .then(pl.col("text").str.extract(r"(?i)(.+)Yd Interception Return").str.extract(r"(\d+)").cast(pl.Int32))
-            .when(
-                (pl.col("pass") == True)
-                .and_(pl.col("int") == True)
-                .and_(pl.col("text").str.contains(r"(?i)for no gain"))
+                (pl.col("pass") == True).and_(pl.col("int_td") == True).and_(text_has("yd interception return"))
             )
+            .then(text_yards("(.+)yd interception return"))
+            .when((pl.col("pass") == True).and_(pl.col("int") == True).and_(text_has("for no gain")))
             .then(0)
-            .when(
-                (pl.col("pass") == True)
-                .and_(pl.col("int") == True)
-                .and_(pl.col("text").str.contains(r"(?i)for a loss of"))
-            )
-            .then(-1 * pl.col("text").str.extract(r"(?i)for a loss of (\d+)").cast(pl.Int32))
-            .when(
-                (pl.col("pass") == True).and_(pl.col("int") == True).and_(pl.col("text").str.contains(r"(?i)for a TD"))
-            )
-            .then(pl.col("text").str.extract(r"(?i)return for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .when((pl.col("pass") == True).and_(pl.col("int") == True).and_(text_has("for a loss of")))
+            .then(-1 * text_yards(r"for a loss of (\d+)"))
+            .when((pl.col("pass") == True).and_(pl.col("int") == True).and_(text_has("for a td")))
+            .then(text_yards("return for (.+)"))
             .when((pl.col("pass") == True).and_(pl.col("int") == True))
             .then(
                 pl.col("text")
@@ -2178,9 +2064,7 @@ class CFBPlayProcess(object):
                 .cast(pl.Int32)
             )
             .otherwise(None),
-            yds_kickoff=pl.when(pl.col("kickoff_play") == True)
-            .then(pl.col("text").str.extract(r"(?i)kickoff for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
-            .otherwise(None),
+            yds_kickoff=pl.when(pl.col("kickoff_play") == True).then(text_yards("kickoff for (.+)")).otherwise(None),
             yds_kickoff_return=pl.when(
                 (pl.col("kickoff_play") == True).and_(pl.col("kickoff_tb") == True).and_(pl.col("season") > 2013)
             )
@@ -2190,30 +2074,30 @@ class CFBPlayProcess(object):
             .when(
                 (pl.col("kickoff_play") == True)
                 .and_(pl.col("fumble_vec") == False)
-                .and_(pl.col("text").str.contains(r"(?i)for no gain|fair catch|fair caught"))
+                .and_(text_has("for no gain|fair catch|fair caught"))
             )
             .then(0)
             .when(
                 (pl.col("kickoff_play") == True)
                 .and_(pl.col("fumble_vec") == False)
-                .and_(pl.col("text").str.contains(r"(?i)out-of-bounds|out of bounds"))
+                .and_(text_has("out-of-bounds|out of bounds"))
             )
             .then(40)
             .when((pl.col("kickoff_downed") == True).or_(pl.col("kickoff_fair_catch") == True))
             .then(0)
-            .when((pl.col("kickoff_play") == True).and_(pl.col("text").str.contains(r"(?i)returned by")))
-            .then(pl.col("text").str.extract(r"(?i)returned by (.+)").str.extract(r"(\d+)").cast(pl.Int32))
-            .when((pl.col("kickoff_play") == True).and_(pl.col("text").str.contains(r"(?i)return for")))
-            .then(pl.col("text").str.extract(r"(?i)return for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .when((pl.col("kickoff_play") == True).and_(text_has("returned by")))
+            .then(text_yards("returned by (.+)"))
+            .when((pl.col("kickoff_play") == True).and_(text_has("return for")))
+            .then(text_yards("return for (.+)"))
             .otherwise(None),
             yds_punted=pl.when((pl.col("punt") == True).and_(pl.col("punt_blocked") == True))
             .then(0)
             .when(pl.col("punt") == True)
-            .then(pl.col("text").str.extract(r"(?i)punt for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .then(text_yards("punt for (.+)"))
             .otherwise(None),
             yds_punt_return=pl.when((pl.col("punt") == True).and_(pl.col("punt_tb") == True))
             .then(20)
-            .when((pl.col("punt") == True).and_(pl.col("text").str.contains(r"(?i)fair catch|fair caught")))
+            .when((pl.col("punt") == True).and_(text_has("fair catch|fair caught")))
             .then(0)
             .when(
                 (pl.col("punt") == True).and_(
@@ -2223,21 +2107,19 @@ class CFBPlayProcess(object):
                 )
             )
             .then(0)
-            .when((pl.col("punt") == True).and_(pl.col("text").str.contains(r"(?i)no return|no gain")))
+            .when((pl.col("punt") == True).and_(text_has("no return|no gain")))
             .then(0)
-            .when((pl.col("punt") == True).and_(pl.col("text").str.contains(r"(?i)returned \d+ yards")))
-            .then(pl.col("text").str.extract(r"(?i)returned (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .when((pl.col("punt") == True).and_(text_has(r"returned \d+ yards")))
+            .then(text_yards("returned (.+)"))
             .when((pl.col("punt") == True).and_(pl.col("punt_blocked") == False))
-            .then(pl.col("text").str.extract(r"(?i)returns for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .then(text_yards("returns for (.+)"))
             .when((pl.col("punt") == True).and_(pl.col("punt_blocked") == True))
-            .then(pl.col("text").str.extract(r"(?i)return for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .then(text_yards("return for (.+)"))
             .otherwise(None),
             yds_fumble_return=pl.when((pl.col("fumble_vec") == True).and_(pl.col("kickoff_play") == False))
-            .then(pl.col("text").str.extract(r"(?i)return for (.+)").str.extract(r"(\d+)").cast(pl.Int32))
-            .otherwise(None),
-            yds_sacked=pl.when(pl.col("sack") == True)
-            .then(-1 * pl.col("text").str.extract(r"(?i)sacked (.+)").str.extract(r"(\d+)").cast(pl.Int32))
+            .then(text_yards("return for (.+)"))
             .otherwise(None),
+            yds_sacked=pl.when(pl.col("sack") == True).then(-1 * text_yards("sacked (.+)")).otherwise(None),
         ).with_columns(
             yds_penalty=pl.when(pl.col("penalty_detail").is_in(["Penalty Declined", "Penalty Offset"]))
             .then(0)
@@ -2361,13 +2243,11 @@ class CFBPlayProcess(object):
                 .then(pl.lit("TEAM"))
                 .otherwise(pl.col("pass_player")),
                 # --- WR Names -----
-                receiver_player=pl.when(
-                    (pl.col("pass") == True).and_(pl.col("text").str.contains(r"(?i)sacked") == False)
-                )
+                receiver_player=pl.when((pl.col("pass") == True).and_(text_has("sacked") == False))
                 .then(pl.col("text").str.extract(r"(?i)to (.+)"))
-                .when(pl.col("text").str.contains(r"(?i)Yd pass"))
+                .when(text_has("yd pass"))
                 .then(pl.col("text").str.extract(r"(?i)(.{0,25} )\d{0,2} Yd pass"))
-                .when(pl.col("text").str.contains(r"(?i)Yd TD pass"))
+                .when(text_has("yd td pass"))
                 .then(pl.col("text").str.extract(r"(?i)(.{0,25} )\d{0,2} Yd TD pass"))
                 .otherwise(None),
             )
@@ -2381,7 +2261,7 @@ class CFBPlayProcess(object):
                             pl.col("type.text").is_in(
                                 ["Fumble Recovery (Opponent) Touchdown", "Fumble Recovery (Opponent)"]
                             )
-                        ).and_(pl.col("text").str.contains(r"(?i)sacked"))
+                        ).and_(text_has("sacked"))
                     )
                 )
                 .then(None)
@@ -2539,9 +2419,7 @@ class CFBPlayProcess(object):
                 .otherwise(pl.col("punt_block_player")),
                 # --- Punt Block Returner Names ----
                 punt_block_return_player=pl.when(
-                    (pl.col("type.text").str.contains(r"Punt"))
-                    .and_(pl.col("text").str.contains(r"(?i)blocked"))
-                    .and_(pl.col("text").str.contains(r"(?i)return"))
+                    (pl.col("type.text").str.contains(r"Punt")).and_(text_has("blocked")).and_(text_has("return"))
                 )
                 .then(pl.col("text").str.extract(r"(?i)(.+) return"))
                 .otherwise(None),
@@ -2607,8 +2485,8 @@ class CFBPlayProcess(object):
                 # --- Field Goal Returner Names ----
                 fg_return_player=pl.when(
                     (pl.col("type.text").str.contains(r"(?i)Field Goal"))
-                    .and_(pl.col("text").str.contains(r"(?i)blocked by|missed"))
-                    .and_(pl.col("text").str.contains(r"(?i)return"))
+                    .and_(text_has("blocked by|missed"))
+                    .and_(text_has("return"))
                 )
                 .then(
                     pl.col("text")
@@ -2633,7 +2511,7 @@ class CFBPlayProcess(object):
                 )
                 .otherwise(pl.col("fg_return_player")),
                 # --- Fumble Recovery Names ----
-                fumble_player=pl.when(pl.col("text").str.contains(r"(?i)fumble"))
+                fumble_player=pl.when(text_has("fumble"))
                 .then(
                     pl.col("text")
                     .str.extract(r"(?i)(.{0,25} )fumble|(?i)(.{0,25} )fumble")
@@ -2655,9 +2533,7 @@ class CFBPlayProcess(object):
             .with_columns(
                 fumble_player=pl.when(pl.col("type.text") == "Penalty").then(None).otherwise(pl.col("fumble_player")),
                 # --- Forced Fumble Names ----
-                fumble_forced_player=pl.when(
-                    (pl.col("text").str.contains(r"(?i)fumble")).and_(pl.col("text").str.contains(r"(?i)forced by"))
-                )
+                fumble_forced_player=pl.when((text_has("fumble")).and_(text_has("forced by")))
                 .then(
                     pl.col("text")
                     .str.extract(r"(?i)forced by(.{0,25})")
@@ -2676,9 +2552,7 @@ class CFBPlayProcess(object):
                 .then(None)
                 .otherwise(pl.col("fumble_forced_player")),
                 # --- Fumble Recovered Names ----
-                fumble_recovered_player=pl.when(
-                    (pl.col("text").str.contains(r"(?i)fumble")).and_(pl.col("text").str.contains(r"(?i)recovered by"))
-                )
+                fumble_recovered_player=pl.when((text_has("fumble")).and_(text_has("recovered by")))
                 .then(
                     pl.col("text")
                     .str.extract(r"(?i)recovered by(.{0,30})")
@@ -3374,8 +3248,8 @@ class CFBPlayProcess(object):
                 .otherwise(pl.col("EP_end"))
             )
             .with_columns(
-                lag_EP_end=pl.col("EP_end").shift(1),
-                lag_change_of_pos_team=pl.col("change_of_pos_team").shift(1),
+                lag_EP_end=pl.col("EP_end").shift(1).over("game_id"),
+                lag_change_of_pos_team=pl.col("change_of_pos_team").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_change_of_pos_team=pl.when(pl.col("lag_change_of_pos_team").is_null())
@@ -3675,8 +3549,8 @@ class CFBPlayProcess(object):
                 .otherwise(pl.col("def_wp_before")),
             )
             .with_columns(
-                lead_wp_before=pl.col("wp_before").shift(-1),
-                lead_wp_before2=pl.col("wp_before").shift(-2),
+                lead_wp_before=pl.col("wp_before").shift(-1).over("game_id"),
+                lead_wp_before2=pl.col("wp_before").shift(-2).over("game_id"),
             )
             .with_columns(
                 wp_after=pl.when(pl.col("type.text").is_in(["Timeout"]))
@@ -3685,7 +3559,7 @@ class CFBPlayProcess(object):
                     (pl.col("status_type_completed") == True)
                     .and_(
                         (pl.col("lead_play_type").is_null()).or_(
-                            pl.col("game_play_number") == pl.col("game_play_number").max()
+                            pl.col("game_play_number") == pl.col("game_play_number").max().over("game_id")
                         )
                     )
                     .and_(pl.col("pos_score_diff_end") > 0)
@@ -3695,7 +3569,7 @@ class CFBPlayProcess(object):
                     (pl.col("status_type_completed") == True)
                     .and_(
                         (pl.col("lead_play_type").is_null()).or_(
-                            pl.col("game_play_number") == pl.col("game_play_number").max()
+                            pl.col("game_play_number") == pl.col("game_play_number").max().over("game_id")
                         )
                     )
                     .and_(pl.col("pos_score_diff_end") < 0)
@@ -3781,20 +3655,20 @@ class CFBPlayProcess(object):
                 drive_start=pl.col("drive_start").cast(pl.Float32),
             )
             .with_columns(
-                drive_play_index=pl.col("scrimmage_play").cumsum().over("drive.id"),
+                drive_play_index=pl.col("scrimmage_play").cumsum().over(["game_id", "drive.id"]),
             )
             .with_columns(
                 drive_offense_plays=pl.when((pl.col("sp") == False).and_(pl.col("scrimmage_play") == True))
                 .then(pl.col("play").cast(pl.Int32))
                 .otherwise(0),
-                prog_drive_EPA=pl.col("EPA_scrimmage").cumsum().over("drive.id"),
-                prog_drive_WPA=pl.col("wpa").cumsum().over("drive.id"),
+                prog_drive_EPA=pl.col("EPA_scrimmage").cumsum().over(["game_id", "drive.id"]),
+                prog_drive_WPA=pl.col("wpa").cumsum().over(["game_id", "drive.id"]),
                 drive_offense_yards=pl.when((pl.col("sp") == False).and_(pl.col("scrimmage_play") == True))
                 .then(pl.col("statYardage"))
                 .otherwise(0),
             )
             .with_columns(
-                drive_total_yards=pl.col("drive_offense_yards").cumsum().over("drive.id"),
+                drive_total_yards=pl.col("drive_offense_yards").cumsum().over(["game_id", "drive.id"]),
             )
         )
         return play_df
@@ -4537,94 +4411,160 @@ class CFBPlayProcess(object):
             "drives": json.loads(drives_data.write_json(row_oriented=True)),
         }
 
+    def __prepare_plays(self, play_df):
+        """Run the stages before the EP/WP models as one lazy query, collected once
+
+        Polars optimises the plan as a whole: repeated expressions within a stage are computed once,
+        independent columns are computed in parallel and intermediate frames are not materialised.
+        """
+        return (
+            play_df.lazy()
+            .pipe(self.__add_downs_data)
+            .pipe(self.__add_text_tokens)
+            .pipe(self.__add_play_type_flags)
+            .pipe(self.__add_rush_pass_flags)
+            .pipe(self.__add_team_score_variables)
+            .pipe(self.__add_new_play_types)
+            .pipe(self.__setup_penalty_data)
+            .pipe(self.__add_play_category_flags)
+            .pipe(self.__add_yardage_cols)
+            .pipe(self.__add_player_cols)
+            .pipe(self.__after_cols)
+            .pipe(self.__add_spread_time)
+            .drop("text_tokens")
+            .collect()
+        )
+
+    def __process_plays(self, play_df):
+        return (
+            self.__prepare_plays(play_df)
+            .pipe(self.__process_epa)
+            .pipe(self.__process_wpa)
+            .pipe(self.__add_drive_data)
+            .pipe(self.__process_qbr)
+        )
+
+    def __prepare_pipeline(self):
+        pbp_txt = self.__helper_cfb_pbp_drives(self.json)
+        self.plays_json = pbp_txt["plays"]
+
+        pbp_json = {
+            "gameId": int(self.gameId),
+            "plays": self.plays_json.to_dicts(),
+            "season": pbp_txt["season"],
+            "week": pbp_txt["header"]["week"],
+            "gameInfo": pbp_txt["gameInfo"],
+            "teamInfo": pbp_txt["header"]["competitions"][0],
+            "playByPlaySource": pbp_txt.get("header").get("competitions")[0].get("playByPlaySource"),
+            "drives": pbp_txt["drives"],
+            "boxscore": pbp_txt["boxscore"],
+            "header": pbp_txt["header"],
+            "standings": pbp_txt["standings"],
+            "leaders": np.array(pbp_txt["leaders"]).tolist(),
+            "timeouts": pbp_txt["timeouts"],
+            "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
+            "gameSpread": pbp_txt["gameSpread"],
+            "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
+            "overUnder": pbp_txt["overUnder"],
+            "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
+            "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
+            "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
+            "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
+            "videos": np.array(pbp_txt["videos"]).tolist(),
+        }
+        self.json = pbp_json
+        self.plays_json = pbp_txt["plays"]
+        return pbp_txt
+
+    def __pipeline_ready(self, pbp_txt):
+        return (self.json.get("header").get("competitions")[0].get("playByPlaySource") != "none") and (
+            len(pbp_txt["drives"]) > 0
+        )
+
+    def __finish_pipeline(self, pbp_txt):
+        advBoxScore = self.plays_json.pipe(self.create_box_score)
+        self.plays_json = self.plays_json.to_dicts()
+        pbp_json = {
+            "gameId": int(self.gameId),
+            "plays": self.plays_json,
+            "season": pbp_txt["season"],
+            "week": pbp_txt["header"]["week"],
+            "gameInfo": pbp_txt["gameInfo"],
+            "teamInfo": pbp_txt["header"]["competitions"][0],
+            "playByPlaySource": pbp_txt["playByPlaySource"],
+            "drives": pbp_txt["drives"],
+            "boxscore": pbp_txt["boxscore"],
+            "advBoxScore": advBoxScore,
+            "header": pbp_txt["header"],
+            "standings": pbp_txt["standings"],
+            "leaders": np.array(pbp_txt["leaders"]).tolist(),
+            "timeouts": pbp_txt["timeouts"],
+            "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
+            "gameSpread": pbp_txt["gameSpread"],
+            "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
+            "overUnder": pbp_txt["overUnder"],
+            "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
+            "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
+            "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
+            "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
+            "videos": np.array(pbp_txt["videos"]).tolist(),
+        }
+        self.json = pbp_json
+
+    def __returned_json(self):
+        return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
+
     def run_processing_pipeline(self):
         if self.ran_pipeline == False:
-            pbp_txt = self.__helper_cfb_pbp_drives(self.json)
-            self.plays_json = pbp_txt["plays"]
-
-            pbp_json = {
-                "gameId": int(self.gameId),
-                "plays": self.plays_json.to_dicts(),
-                "season": pbp_txt["season"],
-                "week": pbp_txt["header"]["week"],
-                "gameInfo": pbp_txt["gameInfo"],
-                "teamInfo": pbp_txt["header"]["competitions"][0],
-                "playByPlaySource": pbp_txt.get("header").get("competitions")[0].get("playByPlaySource"),
-                "drives": pbp_txt["drives"],
-                "boxscore": pbp_txt["boxscore"],
-                "header": pbp_txt["header"],
-                "standings": pbp_txt["standings"],
-                "leaders": np.array(pbp_txt["leaders"]).tolist(),
-                "timeouts": pbp_txt["timeouts"],
-                "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
-                "gameSpread": pbp_txt["gameSpread"],
-                "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
-                "overUnder": pbp_txt["overUnder"],
-                "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
-                "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
-                "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
-                "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
-                "videos": np.array(pbp_txt["videos"]).tolist(),
-            }
-            self.json = pbp_json
-            self.plays_json = pbp_txt["plays"]
+            pbp_txt = self.__prepare_pipeline()
 
             confirmed_corrupt = self.corrupt_pbp_check()
 
             if confirmed_corrupt:
-                return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
+                return self.__returned_json()
 
-            if (pbp_json.get("header").get("competitions")[0].get("playByPlaySource") != "none") and (
-                len(pbp_txt["drives"]) > 0
-            ):
-                self.plays_json = (
-                    self.plays_json.pipe(self.__add_downs_data)
-                    .pipe(self.__add_play_type_flags)
-                    .pipe(self.__add_rush_pass_flags)
-                    .pipe(self.__add_team_score_variables)
-                    .pipe(self.__add_new_play_types)
-                    .pipe(self.__setup_penalty_data)
-                    .pipe(self.__add_play_category_flags)
-                    .pipe(self.__add_yardage_cols)
-                    .pipe(self.__add_player_cols)
-                    .pipe(self.__after_cols)
-                    .pipe(self.__add_spread_time)
-                    .pipe(self.__process_epa)
-                    .pipe(self.__process_wpa)
-                    .pipe(self.__add_drive_data)
-                    .pipe(self.__process_qbr)
-                )
+            if self.__pipeline_ready(pbp_txt):
+                self.plays_json = self.__process_plays(self.plays_json)
                 self.ran_pipeline = True
-                advBoxScore = self.plays_json.pipe(self.create_box_score)
-                self.plays_json = self.plays_json.to_dicts()
-                pbp_json = {
-                    "gameId": int(self.gameId),
-                    "plays": self.plays_json,
-                    "season": pbp_txt["season"],
-                    "week": pbp_txt["header"]["week"],
-                    "gameInfo": pbp_txt["gameInfo"],
-                    "teamInfo": pbp_txt["header"]["competitions"][0],
-                    "playByPlaySource": pbp_txt["playByPlaySource"],
-                    "drives": pbp_txt["drives"],
-                    "boxscore": pbp_txt["boxscore"],
-                    "advBoxScore": advBoxScore,
-                    "header": pbp_txt["header"],
-                    "standings": pbp_txt["standings"],
-                    "leaders": np.array(pbp_txt["leaders"]).tolist(),
-                    "timeouts": pbp_txt["timeouts"],
-                    "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
-                    "gameSpread": pbp_txt["gameSpread"],
-                    "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
-                    "overUnder": pbp_txt["overUnder"],
-                    "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
-                    "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
-                    "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
-                    "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
-                    "videos": np.array(pbp_txt["videos"]).tolist(),
-                }
-                self.json = pbp_json
+                self.__finish_pipeline(pbp_txt)
             self.ran_pipeline = True
-            return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
+            return self.__returned_json()
+
+    @classmethod
+    def process_many(cls, jsons, return_keys=None):
+        """process_many() - Run the processing pipeline over many games at once
+
+        The plays of every game are stacked into one frame, so each stage and each EP/WP model
+        prediction runs once per batch instead of once per game; lags, leads and drive totals are
+        computed within each game. Games that fail `corrupt_pbp_check()` or have no play-by-play
+        are returned as `run_processing_pipeline()` returns them.
+
+        Args:
+            jsons (list): Game summaries, as returned by `espn_cfb_pbp()` or `cfb_pbp_disk()`.
+            return_keys (list): If given, only these keys of each processed game are returned.
+
+        Returns:
+            list: One processed game dictionary per summary, in the same order.
+
+        Example:
+            `games = sportsdataverse.cfb.CFBPlayProcess.process_many([CFBPlayProcess(gameId=g).espn_cfb_pbp() for g in game_ids])`
+        """
+        processes, pending = [], []
+        for summary in jsons:
+            process = cls(gameId=summary["header"]["id"], return_keys=return_keys)
+            process.json = summary
+            pbp_txt = process.__prepare_pipeline()
+            processes.append(process)
+            if not process.corrupt_pbp_check() and process.__pipeline_ready(pbp_txt):
+                pending.append((process, pbp_txt))
+        if pending:
+            plays = cls().__process_plays(stack_frames([process.plays_json for process, _ in pending]))
+            games = {frame["game_id"][0]: frame for frame in plays.partition_by("game_id", maintain_order=True)}
+            for process, pbp_txt in pending:
+                process.plays_json = games.get(process.gameId, plays.head(0))
+                process.ran_pipeline = True
+                process.__finish_pipeline(pbp_txt)
+        return [process.__returned_json() for process in processes]
 
     def run_cleaning_pipeline(self):
         if self.ran_cleaning_pipeline == False:
@@ -4667,19 +4607,7 @@ class CFBPlayProcess(object):
                 pbp_json.get("header").get("competitions")[0].get("playByPlaySource") != "none"
                 and len(pbp_txt["drives"]) > 0
             ):
-                self.plays_json = (
-                    self.plays_json.pipe(self.__add_downs_data)
-                    .pipe(self.__add_play_type_flags)
-                    .pipe(self.__add_rush_pass_flags)
-                    .pipe(self.__add_team_score_variables)
-                    .pipe(self.__add_new_play_types)
-                    .pipe(self.__setup_penalty_data)
-                    .pipe(self.__add_play_category_flags)
-                    .pipe(self.__add_yardage_cols)
-                    .pipe(self.__add_player_cols)
-                    .pipe(self.__after_cols)
-                    .pipe(self.__add_spread_time)
-                )
+                self.plays_json = self.__prepare_plays(self.plays_json)
                 self.plays_json = self.plays_json.to_dicts()
                 pbp_json = {
                     "gameId": int(self.gameId),
@@ -3,7 +3,7 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import download, run_async
 
 
 def espn_cfb_schedule(
@@ -85,6 +85,27 @@ def espn_cfb_schedule(
     return ev.to_pandas() if return_as_pandas else ev
 
 
+async def aespn_cfb_schedule(
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, **kwargs
+) -> pl.DataFrame:
+    """aespn_cfb_schedule() - Coroutine version of `espn_cfb_schedule()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `cfb_df = await sportsdataverse.cfb.aespn_cfb_schedule(dates=2023)`
+    """
+    return await run_async(
+        espn_cfb_schedule,
+        dates=dates,
+        week=week,
+        season_type=season_type,
+        groups=groups,
+        limit=limit,
+        return_as_pandas=return_as_pandas,
+        **kwargs,
+    )
+
+
 def scoreboard_event_parsing(event):
     event.get("competitions")[0].get("competitors")[0].get("team").pop("links", None)
     event.get("competitions")[0].get("competitors")[1].get("team").pop("links", None)
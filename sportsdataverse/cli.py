@@ -0,0 +1,85 @@
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from sportsdataverse import rebuild
+from sportsdataverse.mirror import DATASETS, DEFAULT_MAX_WORKERS, sync
+
+
+def parse_seasons(value: str) -> List[int]:
+    """Parse a season list such as `"2019,2021"` or a range such as `"1999-2023"`"""
+    seasons = []
+    for part in value.split(","):
+        start, _, end = part.strip().partition("-")
+        seasons.extend(range(int(start), int(end or start) + 1))
+    return seasons
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sportsdataverse", description="sportsdataverse command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subparsers.add_parser("sync", help="Mirror release files into a local directory")
+    sync_parser.add_argument("datasets", nargs="*", help="Datasets to mirror, e.g. nfl_pbp mbb_player_box")
+    sync_parser.add_argument("--seasons", type=parse_seasons, help="Seasons to mirror, e.g. 1999-2023 or 2021,2022")
+    sync_parser.add_argument("--dest", help="Mirror directory (defaults to SDV_MIRROR_DIR)")
+    sync_parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Parallel transfers")
+    sync_parser.add_argument("--overwrite", action="store_true", help="Download files already in the mirror again")
+    sync_parser.add_argument("--list", action="store_true", help="List the available datasets and exit")
+    rebuild_parser = subparsers.add_parser("rebuild", help="Reprocess a directory of ESPN game summaries to parquet")
+    rebuild_parser.add_argument("sport", choices=sorted(rebuild.PROCESSORS), help="Sport of the summaries")
+    rebuild_parser.add_argument("json_dir", help="Directory of {gameId}.json summaries")
+    rebuild_parser.add_argument("output_dir", help="Directory the parquet files and checkpoint are written to")
+    rebuild_parser.add_argument("--workers", type=int, default=rebuild.DEFAULT_MAX_WORKERS, help="Worker processes")
+    rebuild_parser.add_argument(
+        "--chunk-size", type=int, default=rebuild.DEFAULT_CHUNK_SIZE, help="Games processed per batch"
+    )
+    return parser
+
+
+def _rebuild(args) -> int:
+    result = rebuild.rebuild_season(
+        args.json_dir,
+        args.output_dir,
+        sport=args.sport,
+        max_workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    print(f"{len(result['completed'])} games processed, {len(result['skipped'])} already done", end="")
+    print(f", {len(result['failed'])} failed" if result["failed"] else "")
+    return 1 if result["failed"] else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the `sportsdataverse` command
+
+    Example:
+        `sportsdataverse sync nfl_pbp nhl_pbp --seasons 2015-2023 --dest /data/sdv`
+
+        `sportsdataverse rebuild cfb /data/cfb/json/2022 /data/cfb/processed/2022 --workers 8`
+    """
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    if args.command == "rebuild":
+        return _rebuild(args)
+    if args.list or not args.datasets:
+        for name, (url, min_season) in sorted(DATASETS.items()):
+            print(f"{name:<24} {min_season or '':<6} {url}")
+        return 0
+    try:
+        paths = sync(
+            args.datasets,
+            seasons=args.seasons,
+            mirror_dir=args.dest,
+            max_workers=args.workers,
+            overwrite=args.overwrite,
+        )
+    except ValueError as e:
+        print(f"sportsdataverse: {e}", file=sys.stderr)
+        return 2
+    print(f"{len(paths)} files mirrored")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+import requests
+
+logger = logging.getLogger("sdv.dataset_cache")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sportsdataverse")
+DEFAULT_MAX_SIZE = 5 * 1024**3
+DEFAULT_MIN_AGE = 60
+CHUNK_SIZE = 1024 * 1024
+
+_SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def parse_size(size) -> int:
+    """Parse a cache size given in bytes or as a string such as `"500MB"` or `"2GB"`"""
+    if isinstance(size, (int, float)):
+        return int(size)
+    size = str(size).strip().upper()
+    for unit, factor in _SIZE_UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[: -len(unit)]) * factor)
+    return int(size.rstrip("B"))
+
+
+class DatasetCache:
+    """Local cache of release files, keyed by URL
+
+    Cached files are revalidated with a conditional request (`If-None-Match` /
+    `If-Modified-Since`) on every fetch, so unchanged files are never downloaded twice.
+    When the total size of the cache exceeds `max_size` the least recently used files
+    are evicted. Files fetched less than `min_age` seconds ago are kept, since the caller
+    may still be reading them.
+
+    Args:
+        cache_dir (str): Directory holding the cached files.
+        max_size (int or str): Maximum total size of the cache, e.g. `5 * 1024**3` or `"5GB"`.
+        enabled (bool): If False, `fetch()` is never used by the loaders.
+        timeout (int): Timeout in seconds for each request.
+        min_age (float): Seconds after its last fetch during which a file is never evicted.
+    """
+
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE, enabled=True, timeout=60, min_age=DEFAULT_MIN_AGE):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_size = parse_size(max_size)
+        self.min_age = float(min_age)
+        self.enabled = enabled
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._locks = defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def path_for(self, url: str) -> str:
+        """Return the local path a URL is (or would be) cached at"""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        ext = os.path.splitext(url.split("?")[0])[1]
+        return os.path.join(self.cache_dir, f"{key}{ext}")
+
+    def fetch(self, url: str) -> str:
+        """Return a local path holding the current contents of `url`
+
+        Downloads the file on a miss, revalidates it on a hit, and falls back to the
+        cached copy if the revalidation request itself fails.
+        """
+        path = self.path_for(url)
+        with self._lock_for(path):
+            meta = self._read_meta(path)
+            cached = meta is not None and os.path.exists(path)
+            headers = {}
+            if cached and meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if cached and meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            try:
+                response = self._session.get(url, headers=headers, stream=True, timeout=self.timeout)
+            except requests.RequestException as e:
+                if not cached:
+                    raise
+                logger.warning("Could not revalidate %s, using cached copy: %s", url, e)
+                self._touch(path)
+                return path
+            with response:
+                if cached and response.status_code == 304:
+                    logger.debug("Cache hit: %s", url)
+                    self._touch(path)
+                    return path
+                response.raise_for_status()
+                logger.debug("Cache miss: %s", url)
+                self._store(path, url, response)
+        self.evict(keep=path)
+        return path
+
+    def fetch_derived(self, url: str, suffix: str, build) -> str:
+        """Return a local file derived from the contents of `url`, rebuilding it only when `url` changes
+
+        Example:
+            `cache.fetch_derived(rds_url, "parquet", convert_rds_to_parquet)`
+
+        Args:
+            url (str): Location of the source file.
+            suffix (str): Extension appended to the cached source path for the derived file.
+            build (callable): Function called as `build(source_path, target_path)` to create the
+                derived file from the cached source.
+
+        Returns:
+            str: Local path of the derived file.
+        """
+        source = self.fetch(url)
+        target = f"{source}.{suffix}"
+        with self._lock_for(target):
+            meta = self._read_meta(source) or {}
+            if os.path.exists(target) and os.path.getmtime(target) >= meta.get("fetched_at", float("inf")):
+                logger.debug("Derived cache hit: %s (%s)", url, suffix)
+                self._touch(target)
+                return target
+            self._build(build, source, target)
+        self.evict(keep=target)
+        return target
+
+    def derive_local(self, source: str, suffix: str, build) -> str:
+        """Return a cached file derived from the local file `source`, rebuilding it only when `source` changes
+
+        The derived file is written to the cache directory, so `source` may live in a read-only
+        directory such as a shared mirror.
+
+        Args:
+            source (str): Path of the local source file.
+            suffix (str): Extension appended to the cached path for the derived file.
+            build (callable): Function called as `build(source_path, target_path)` to create the
+                derived file from `source`.
+
+        Returns:
+            str: Local path of the derived file.
+        """
+        target = f"{self.path_for(os.path.abspath(source))}.{suffix}"
+        with self._lock_for(target):
+            if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+                logger.debug("Derived cache hit: %s (%s)", source, suffix)
+                self._touch(target)
+                return target
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._build(build, source, target)
+        self.evict(keep=target)
+        return target
+
+    def _build(self, build, source, target):
+        tmp_path = f"{target}.{uuid.uuid4().hex}.tmp"
+        try:
+            build(source, tmp_path)
+            os.replace(tmp_path, target)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def evict(self, keep=None):
+        """Remove least recently used files until the cache fits in `max_size`
+
+        Files being fetched by another thread, or fetched less than `min_age` seconds ago, are skipped.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith((".json", ".tmp")) or not os.path.isfile(path):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            if path == keep or now - mtime < self.min_age:
+                continue
+            lock = self._lock_for(path)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                # The file may have been fetched again since it was listed
+                if os.path.exists(path) and now - os.path.getmtime(path) < self.min_age:
+                    continue
+                self._remove(path)
+            finally:
+                lock.release()
+            total -= size
+
+    def clear(self):
+        """Remove every file from the cache"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def _store(self, path, url, response):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": os.path.getsize(path),
+            "fetched_at": time.time(),
+        }
+        tmp_meta = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_meta, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, f"{path}.json")
+
+    def _read_meta(self, path):
+        try:
+            with open(f"{path}.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _remove(self, path):
+        for p in (path, f"{path}.json"):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+    def _lock_for(self, path):
+        with self._locks_lock:
+            return self._locks[path]
+
+
+_dataset_cache = None
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Return the process-wide dataset cache
+
+    Disabled unless `set_dataset_cache()` has been called or `SDV_CACHE=1` is set, so the loaders
+    write nothing to disk by default. `SDV_CACHE_DIR` and `SDV_CACHE_MAX_SIZE` configure its location
+    and size limit.
+    """
+    global _dataset_cache
+    if _dataset_cache is None:
+        _dataset_cache = DatasetCache(
+            cache_dir=os.environ.get("SDV_CACHE_DIR"),
+            max_size=os.environ.get("SDV_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE),
+            enabled=os.environ.get("SDV_CACHE", "0").lower() in ("1", "true", "yes"),
+        )
+    return _dataset_cache
+
+
+def set_dataset_cache(cache_dir=None, max_size=DEFAULT_MAX_SIZE, enabled=True) -> DatasetCache:
+    """Turn on (or reconfigure) the process-wide dataset cache used by the `load_*` functions
+
+    Example:
+        `sportsdataverse.dataset_cache.set_dataset_cache(cache_dir="/data/sdv", max_size="20GB")`
+
+    Args:
+        cache_dir (str): Directory holding the cached files. Defaults to `~/.cache/sportsdataverse`.
+        max_size (int or str): Maximum total size of the cache before least recently used files are evicted.
+        enabled (bool): If False, the loaders always read directly from the remote URL.
+
+    Returns:
+        DatasetCache: The newly configured cache.
+    """
+    global _dataset_cache
+    _dataset_cache = DatasetCache(cache_dir=cache_dir, max_size=max_size, enabled=enabled)
+    return _dataset_cache
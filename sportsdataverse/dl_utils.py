@@ -1,49 +1,721 @@
+import asyncio
+import base64
+import datetime
+import email.utils
+import functools
+import gzip
+import hashlib
 import json
 import logging
+import os
+import random
 import re
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain, starmap
+from typing import Dict
+from urllib.parse import urlsplit
 
 import numpy as np
 import polars as pl
 import requests
 
+from sportsdataverse import metrics
 from sportsdataverse.errors import no_espn_data
+from sportsdataverse.response_cache import COMPLETION_KEYS, cache_key, get_response_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+    _msgspec_decoder = msgspec.json.Decoder()
+else:
+    JSON_BACKEND = "json"
 
 logger = logging.getLogger("sdv.dl_utils")
 logger.addHandler(logging.NullHandler())
 
 
-def download(url, params=None, headers=None, proxy=None, timeout=30, num_retries=15, session=None, logger=None):
+def json_loads(data):
+    """Decode JSON text or bytes with the fastest installed backend (orjson, msgspec, then json)
+
+    Raises:
+        ValueError: If `data` is not valid JSON.
+    """
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few inputs the standard library accepts, such as NaN and Infinity
+            pass
+    elif JSON_BACKEND == "msgspec":
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(data)
+
+
+if msgspec is not None:
+    _msgspec_raw_decoder = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+
+
+def json_loads_keys(data, keys):
+    """Decode only the top-level `keys` of a JSON object, leaving every other value unparsed
+
+    With msgspec installed the other values are skipped while scanning, without building them,
+    which saves time and memory on large ESPN summaries. Otherwise the whole body is decoded
+    and the other values are dropped straight away. A body that is not an object is decoded
+    in full.
+
+    Raises:
+        ValueError: If `data` is not valid JSON.
+    """
+    keys = set(keys)
+    if msgspec is not None:
+        try:
+            values = _msgspec_raw_decoder.decode(data)
+        except msgspec.ValidationError:
+            return json_loads(data)
+        except msgspec.DecodeError:
+            # Let the standard library accept (or reject) what msgspec does not, such as NaN
+            values = None
+        if values is not None:
+            return {k: json_loads(bytes(v)) for k, v in values.items() if k in keys}
+    body = json_loads(data)
+    if not isinstance(body, dict):
+        return body
+    return {k: v for k, v in body.items() if k in keys}
+
+
+_UNPARSED = object()
+
+
+class JSONResponse:
+    """`requests.Response` wrapper whose `json()` decodes the body once and memoises the result
+
+    Every other attribute is read from the wrapped response. The memoised object is shared
+    by all `json()` calls on the same wrapper.
+
+    Args:
+        response (requests.Response): The response to wrap.
+        keys (list): If given, only these top-level keys (and `code`, which ESPN uses to report
+            missing data) of an object body are decoded; see `json_loads_keys()`.
+    """
+
+    def __init__(self, response, keys=None):
+        self._response = response
+        self._keys = None if keys is None else set(keys) | {"code"}
+        self._parsed = _UNPARSED
+
+    def json(self, **kwargs):
+        if self._parsed is _UNPARSED:
+            if self._keys is None:
+                self._parsed = json_loads(self._response.content)
+            else:
+                self._parsed = json_loads_keys(self._response.content, self._keys)
+        return self._parsed
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __repr__(self):
+        return repr(self._response)
+
+
+DEFAULT_POOL_SIZE = int(os.environ.get("SDV_HTTP_POOL_SIZE", 20))
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session shared by every `download()` call
+
+    Reusing one session keeps TCP and TLS connections alive between requests to the same host.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _pooled_session(DEFAULT_POOL_SIZE)
+        return _session
+
+
+def configure_session(pool_size=DEFAULT_POOL_SIZE) -> requests.Session:
+    """Replace the process-wide session with one keeping up to `pool_size` connections per host
+
+    Example:
+        `sportsdataverse.dl_utils.configure_session(pool_size=64)`
+
+    Args:
+        pool_size (int): Maximum number of connections kept open to each host. Raise this when
+            downloading from many threads at once. Defaults to `SDV_HTTP_POOL_SIZE` or 20.
+
+    Returns:
+        requests.Session: The new session.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = _pooled_session(pool_size)
+        return _session
+
+
+def _pooled_session(pool_size):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def download(
+    url,
+    params=None,
+    headers=None,
+    proxy=None,
+    timeout=30,
+    num_retries=15,
+    session=None,
+    logger=None,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    max_backoff=DEFAULT_MAX_BACKOFF,
+    use_cache=True,
+    coalesce=True,
+    json_keys=None,
+):
+    """Download `url` with the shared session, retrying transient failures
+
+    Timeouts, connection errors and 408/429/5xx responses are retried up to `num_retries` times
+    with exponential backoff and full jitter, or after the delay given by a `Retry-After`
+    header. A 404 raises `NoESPNDataError` and any other 4xx raises `requests.HTTPError`
+    straight away. Once the retries are used up the last error is raised.
+
+    When the response cache is turned on (see `response_cache.set_response_cache()`) and
+    `use_cache` is True, cached responses are returned without a request and successful
+    responses are stored.
+
+    When `coalesce` is True, concurrent calls for the same URL, parameters, headers and session
+    share a single in-flight request, so callers sending different credentials never share a
+    response. Each caller still gets its own `JSONResponse`, so decoded payloads can be modified
+    without affecting the other callers.
+
+    When `json_keys` is given, `json()` on the returned response decodes only those top-level
+    keys of the body (see `json_loads_keys()`).
+
+    Every call emits a timing event to the hooks registered with `metrics.add_hook()`.
+    """
     session, params, logger = init_request_settings(params, session, logger)
-    try:
-        response = session.get(url, params=params, proxies=proxy, headers=headers, timeout=timeout)
-        response = no_espn_data(response)
+    start = time.perf_counter()
+    cache = get_response_cache() if use_cache else None
+    if cache is not None and cache.enabled:
+        cached = cache.get(url, params)
+        if cached is not None:
+            if metrics.hooks_enabled():
+                metrics.emit(_cached_event(cached, start, "hit"))
+            return no_espn_data(JSONResponse(cached, keys=json_keys))
+    fetch = functools.partial(
+        _get_with_retries,
+        session,
+        url,
+        params=params,
+        headers=headers,
+        proxy=proxy,
+        timeout=timeout,
+        num_retries=num_retries,
+        logger=logger,
+        backoff_factor=backoff_factor,
+        max_backoff=max_backoff,
+        cache="miss" if cache is not None and cache.enabled else "off",
+    )
+    if coalesce:
+        response, leader = _coalesced(_coalesce_key(session, url, params, headers), fetch)
+        if not leader and metrics.hooks_enabled():
+            metrics.emit(_cached_event(response, start, "coalesced"))
+    else:
+        response, leader = fetch(), True
+    if 400 <= response.status_code < 500 and response.status_code != 404:
+        logger.error(f"{response.status_code}: {url} \nparams: {params}")
+        response.raise_for_status()
+    response = no_espn_data(JSONResponse(response, keys=json_keys))
+    if leader and cache is not None and cache.enabled:
+        try:
+            # `json_keys` may leave out the game status the cache reads to decide how long to keep the response
+            body = response.json() if json_keys is None else json_loads_keys(response.content, COMPLETION_KEYS)
+        except ValueError:
+            body = None
+        cache.put(url, params, response, body=body)
+    return response
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
 
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def _coalesce_key(session, url, params, headers):
+    # Headers and the session (which carries its own headers and auth) can change the response,
+    # so they are part of the key along with the URL and parameters.
+    headers = tuple(sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items()))
+    return cache_key(url, params), id(session), headers
+
+
+def _coalesced(key, fetch):
+    # Singleflight: the first caller for `key` runs `fetch`, later callers wait for its result.
+    # Returns the response and whether this caller was the one that fetched it.
+    with _in_flight_lock:
+        call = _in_flight.get(key)
+        leader = call is None
+        if leader:
+            call = _in_flight[key] = _InFlight()
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.response, False
+    try:
+        call.response = fetch()
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+        call.done.set()
+    return call.response, True
+
+
+def _get_with_retries(
+    session, url, params, headers, proxy, timeout, num_retries, logger, backoff_factor, max_backoff, cache="off"
+):
+    limiter = get_rate_limiter(url)
+    start = time.perf_counter()
+    attempt = -1
+    try:
+        for attempt in range(num_retries + 1):
+            try:
+                with limiter:
+                    sent = time.perf_counter()
+                    response = get_transport()(
+                        session, url, params=params, headers=headers, proxy=proxy, timeout=timeout
+                    )
+                    received = time.perf_counter()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == num_retries:
+                    logger.error(f"Retry Limit Exceeded: {url} \nparams: {params}\n {e}")
+                    raise
+                delay = _backoff_delay(attempt, backoff_factor, max_backoff)
+                logger.warning("%s for url (%s), retrying in %.1fs", e, url, delay)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    if metrics.hooks_enabled():
+                        metrics.emit(_response_event(response, attempt + 1, received - sent, start, cache))
+                    return response
+                if attempt == num_retries:
+                    logger.error(f"Retry Limit Exceeded: {url} \nparams: {params}\n {response.status_code}")
+                    if metrics.hooks_enabled():
+                        metrics.emit(_response_event(response, attempt + 1, received - sent, start, cache))
+                    response.raise_for_status()
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = _backoff_delay(attempt, backoff_factor, max_backoff)
+                logger.warning(
+                    "%i - %s for url (%s), retrying in %.1fs",
+                    response.status_code,
+                    response.reason,
+                    response.url,
+                    delay,
+                )
+            time.sleep(delay)
     except Exception as e:
-        if num_retries == 0:
-            logger.error(f"Retry Limit Exceeded: {url} \nparams: {params}\n {e}")
-
-        if hasattr(e, "code") and getattr(e, "code") == 404:
-            logger.error(f"404: {url} \nparams: {params}")
-
-        if num_retries > 0:
-            logger.warning("%s: %i - %s for url (%s)", e, response.status_code, response.reason, response.url)
-            time.sleep(2)
-            return download(
-                url,
-                params=params,
-                proxy=proxy,
-                headers=headers,
-                timeout=timeout,
-                num_retries=num_retries - 1,
-                session=session,
-                logger=logger,
-            )
+        if metrics.hooks_enabled() and not isinstance(e, requests.HTTPError):
+            event = metrics.request_event(url, attempts=attempt + 1, total=time.perf_counter() - start, cache=cache)
+            event["error"] = type(e).__name__
+            metrics.emit(event)
+        raise
+
+
+def _cached_event(response, start, cache):
+    return metrics.request_event(
+        response.url or "",
+        status=response.status_code,
+        total=time.perf_counter() - start,
+        nbytes=len(response.content or b""),
+        cache=cache,
+    )
+
+
+def _response_event(response, attempts, duration, start, cache):
+    # `elapsed` runs from sending the request until its headers are parsed; the rest is the body
+    ttfb = response.elapsed.total_seconds() if response.elapsed else None
+    transfer = None if ttfb is None else max(duration - ttfb, 0.0)
+    event = metrics.request_event(
+        response.url or "",
+        status=response.status_code,
+        attempts=attempts,
+        ttfb=ttfb,
+        transfer=transfer,
+        total=time.perf_counter() - start,
+        nbytes=len(response.content or b""),
+        cache=cache,
+    )
+    if response.status_code >= 400:
+        event["error"] = f"HTTP {response.status_code}"
+    return event
+
+
+def _backoff_delay(attempt, backoff_factor, max_backoff):
+    return random.uniform(0, min(max_backoff, backoff_factor * 2**attempt))
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def network_transport(session, url, params=None, headers=None, proxy=None, timeout=None):
+    """Default transport of `download()`: send the request over the network with `session`"""
+    return session.get(url, params=params, proxies=proxy, headers=headers, timeout=timeout)
+
+
+class CassetteMissError(LookupError):
+    pass
+
+
+class Cassette:
+    """Directory of recorded responses, one gzip-compressed JSON file per request
+
+    Requests are keyed like the response cache (URL and sorted parameters without cache
+    busters), so a replay matches the recording even though the fetchers add timestamps.
+
+    Args:
+        cassette_dir (str): Directory holding the recordings.
+    """
+
+    def __init__(self, cassette_dir):
+        self.cassette_dir = cassette_dir
+
+    def path_for(self, url, params=None) -> str:
+        key = hashlib.sha256(cache_key(url, params).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cassette_dir, f"{key}.json.gz")
+
+    def load(self, url, params=None):
+        """Return the recorded `requests.Response` for a request, or None if it was never recorded"""
+        try:
+            with gzip.open(self.path_for(url, params), "rt", encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        response = requests.Response()
+        response.status_code = record["status_code"]
+        response.url = record["url"]
+        response.reason = record["reason"]
+        response.headers = requests.structures.CaseInsensitiveDict(record["headers"])
+        response.encoding = record["encoding"]
+        response._content = base64.b64decode(record["content"])
+        return response
+
+    def save(self, url, params, response):
+        """Record `response` as the answer to a request"""
+        record = {
+            "request_url": cache_key(url, params),
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        os.makedirs(self.cassette_dir, exist_ok=True)
+        path = self.path_for(url, params)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+
+class RecordingTransport:
+    """Transport that sends requests with `inner` and records every response to a cassette
+
+    Args:
+        cassette_dir (str): Directory to record to.
+        inner (callable): Transport that actually sends the requests. Defaults to `network_transport`.
+    """
+
+    def __init__(self, cassette_dir, inner=network_transport):
+        self.cassette = Cassette(cassette_dir)
+        self.inner = inner
+
+    def __call__(self, session, url, params=None, headers=None, proxy=None, timeout=None):
+        response = self.inner(session, url, params=params, headers=headers, proxy=proxy, timeout=timeout)
+        self.cassette.save(url, params, response)
+        return response
+
+
+class ReplayTransport:
+    """Transport that answers requests from a cassette recorded by `RecordingTransport`, without the network
+
+    Args:
+        cassette_dir (str): Directory to replay from.
+        fallback (callable): Transport for requests missing from the cassette. If None, a miss
+            raises `CassetteMissError`.
+    """
+
+    def __init__(self, cassette_dir, fallback=None):
+        self.cassette = Cassette(cassette_dir)
+        self.fallback = fallback
+
+    def __call__(self, session, url, params=None, headers=None, proxy=None, timeout=None):
+        response = self.cassette.load(url, params)
+        if response is not None:
+            return response
+        if self.fallback is None:
+            raise CassetteMissError(f"No recording of {cache_key(url, params)} in {self.cassette.cassette_dir}")
+        return self.fallback(session, url, params=params, headers=headers, proxy=proxy, timeout=timeout)
+
+
+_transport = None
+
+
+def set_transport(transport=None):
+    """Set the transport every `download()` call sends its requests through
+
+    Example:
+        `sportsdataverse.dl_utils.set_transport(sportsdataverse.dl_utils.ReplayTransport("tests/cassettes"))`
+
+    Args:
+        transport (callable): Called as `transport(session, url, params=, headers=, proxy=, timeout=)`
+            and returning a `requests.Response`. None restores `network_transport`.
+    """
+    global _transport
+    _transport = transport or network_transport
+
+
+def get_transport():
+    """Return the current transport
+
+    Unless `set_transport()` has been called, `SDV_TRANSPORT=record` or `SDV_TRANSPORT=replay`
+    together with `SDV_CASSETTE_DIR` select a `RecordingTransport` or `ReplayTransport`.
+    """
+    global _transport
+    if _transport is None:
+        mode = os.environ.get("SDV_TRANSPORT", "network").lower()
+        cassette_dir = os.environ.get("SDV_CASSETTE_DIR", "cassettes")
+        if mode == "record":
+            _transport = RecordingTransport(cassette_dir)
+        elif mode == "replay":
+            _transport = ReplayTransport(cassette_dir)
         else:
-            logger.error(f"Download Error: {url} \nparams: {params}\n {e}")
+            _transport = network_transport
+    return _transport
+
+
+class RateLimiter:
+    """Token bucket plus in-flight cap for the requests sent to one host
+
+    Used as a context manager around each request. Entering blocks until fewer than
+    `max_in_flight` requests are running and a token is available; tokens refill at
+    `requests_per_second` up to `burst`. The limiter is thread-safe, so it holds for plain
+    calls, thread pools and the `adownload()` worker threads alike.
+
+    Args:
+        requests_per_second (float): Sustained request rate. None for no rate limit.
+        max_in_flight (int): Maximum number of concurrent requests. None for no cap.
+        burst (int): Number of requests that may be sent back to back after an idle period.
+            Defaults to `max(1, requests_per_second)`.
+    """
+
+    def __init__(self, requests_per_second=None, max_in_flight=None, burst=None):
+        self.requests_per_second = requests_per_second
+        self.max_in_flight = max_in_flight
+        self.burst = burst or max(1, requests_per_second or 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                wait = None
+                if self.max_in_flight is None or self._in_flight < self.max_in_flight:
+                    if self.requests_per_second is None:
+                        break
+                    now = time.monotonic()
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.requests_per_second)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    wait = (1 - self._tokens) / self.requests_per_second
+                self._condition.wait(wait)
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+_unlimited = RateLimiter()
+_rate_limits = {}
+_rate_limiters = {}
+_rate_limit_lock = threading.Lock()
+
+
+def set_rate_limit(host="*", requests_per_second=None, max_in_flight=None, burst=None):
+    """Limit the requests `download()` and `adownload()` send to a host
+
+    Example:
+        `sportsdataverse.dl_utils.set_rate_limit("site.api.espn.com", requests_per_second=10, max_in_flight=8)`
+
+    Args:
+        host (str): Host name, e.g. "sports.core.api.espn.com", or "*" for every host without its own limit.
+        requests_per_second (float): Sustained request rate. None for no rate limit.
+        max_in_flight (int): Maximum number of concurrent requests. None for no cap.
+        burst (int): Requests allowed back to back after an idle period. Defaults to `max(1, requests_per_second)`.
+    """
+    with _rate_limit_lock:
+        if requests_per_second is None and max_in_flight is None:
+            _rate_limits.pop(host, None)
+        else:
+            _rate_limits[host] = (requests_per_second, max_in_flight, burst)
+        # Hosts falling back to "*" need new limiters too, so start over
+        _rate_limiters.clear()
+
+
+def get_rate_limiter(url) -> RateLimiter:
+    """Return the limiter shared by every request to the host of `url`"""
+    host = (urlsplit(url).hostname or "").lower()
+    with _rate_limit_lock:
+        if host not in _rate_limiters:
+            limits = _rate_limits.get(host, _rate_limits.get("*"))
+            _rate_limiters[host] = RateLimiter(*limits) if limits else _unlimited
+        return _rate_limiters[host]
+
+
+def _load_rate_limits_from_env():
+    # SDV_RATE_LIMITS="site.api.espn.com=10/8,*=20" sets requests/sec and optionally max in-flight per host
+    for entry in filter(None, os.environ.get("SDV_RATE_LIMITS", "").split(",")):
+        host, _, limits = entry.strip().partition("=")
+        rate, _, in_flight = limits.partition("/")
+        set_rate_limit(host, float(rate) if rate else None, int(in_flight) if in_flight else None)
+
+
+_load_rate_limits_from_env()
+
+
+DEFAULT_ASYNC_CONCURRENCY = int(os.environ.get("SDV_ASYNC_CONCURRENCY", 32))
+
+_async_concurrency = DEFAULT_ASYNC_CONCURRENCY
+_async_executor = None
+_async_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_async_concurrency(limit=DEFAULT_ASYNC_CONCURRENCY):
+    """Set how many `adownload()` calls and `aespn_*` fetchers may run at the same time
+
+    Example:
+        `sportsdataverse.dl_utils.set_async_concurrency(64)`
+
+    Args:
+        limit (int): Maximum number of concurrent requests per event loop. The shared session's
+            connection pool (see `configure_session()`) should be at least this large.
+    """
+    global _async_concurrency, _async_executor
+    with _session_lock:
+        _async_concurrency = limit
+        if _async_executor is not None:
+            _async_executor.shutdown(wait=False)
+        _async_executor = None
+        _async_semaphores.clear()
 
-    return response
+
+def _get_async_executor():
+    global _async_executor
+    with _session_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=_async_concurrency, thread_name_prefix="sdv-async")
+        return _async_executor
+
+
+def _get_async_semaphore(loop):
+    with _session_lock:
+        if loop not in _async_semaphores:
+            _async_semaphores[loop] = asyncio.Semaphore(_async_concurrency)
+        return _async_semaphores[loop]
+
+
+async def run_async(func, *args, **kwargs):
+    """Await a blocking download function without blocking the event loop
+
+    The call runs on a worker thread, and at most `set_async_concurrency()` of them run at once
+    per event loop.
+    """
+    loop = asyncio.get_running_loop()
+    async with _get_async_semaphore(loop):
+        return await loop.run_in_executor(_get_async_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def adownload(
+    url, params=None, headers=None, proxy=None, timeout=30, num_retries=15, session=None, logger=None, **kwargs
+):
+    """Coroutine version of `download()`, limited by `set_async_concurrency()`
+
+    Example:
+        `responses = await asyncio.gather(*(sportsdataverse.dl_utils.adownload(url) for url in urls))`
+    """
+    return await run_async(
+        download,
+        url,
+        params=params,
+        headers=headers,
+        proxy=proxy,
+        timeout=timeout,
+        num_retries=num_retries,
+        session=session,
+        logger=logger,
+        **kwargs,
+    )
 
 
 def init_request_settings(params, session, logger):
@@ -51,7 +723,7 @@ def init_request_settings(params, session, logger):
         params = {}
 
     if session is None:
-        session = requests.Session()
+        session = get_session()
 
     if logger is None:
         logger = logging.getLogger("sdv.dl_utils")
@@ -106,6 +778,37 @@ def key_check(obj, key, replacement=np.array([])):
     return obj[key] if key in obj.keys() else replacement
 
 
+def stack_frames(frames) -> pl.DataFrame:
+    """Concatenate frames whose columns or dtypes differ, such as the plays of several games
+
+    Columns missing from a frame are filled with nulls. A column whose dtype differs between
+    frames is cast to the first non-null dtype, to Float64 if the dtypes are all numeric, or
+    to Utf8 if they are all strings, numbers or booleans.
+    """
+    dtypes = {}
+    for frame in frames:
+        for name, dtype in frame.schema.items():
+            current = dtypes.get(name)
+            if current is None or current == pl.Null:
+                dtypes[name] = dtype
+            elif dtype != current and dtype != pl.Null:
+                if dtype in pl.NUMERIC_DTYPES and current in pl.NUMERIC_DTYPES:
+                    dtypes[name] = pl.Float64
+                elif {dtype, current} <= pl.NUMERIC_DTYPES | {pl.Utf8, pl.Boolean}:
+                    dtypes[name] = pl.Utf8
+    frames = [
+        frame.with_columns(
+            [
+                pl.col(name).cast(dtypes[name], strict=False)
+                for name, dtype in frame.schema.items()
+                if dtype != dtypes[name]
+            ]
+        )
+        for frame in frames
+    ]
+    return pl.concat(frames, how="diagonal")
+
+
 @pl.api.register_dataframe_namespace("janitor")
 class ColumnJanitor:
     def __init__(self, df: pl.DataFrame):
@@ -237,11 +940,15 @@ class ESPNResponse:
 
         self._url = url
 
+        self._dict = _UNPARSED
+
     def get_response(self):
         return self._response
 
     def get_dict(self):
-        return json.loads(self._response)
+        if self._dict is _UNPARSED:
+            self._dict = json_loads(self._response)
+        return self._dict
 
     def get_json(self):
         return json.dumps(self.get_dict())
@@ -260,6 +967,13 @@ class ESPNResponse:
 
 
 class ESPNHTTP:
+    """Base client for ESPN endpoints; subclasses set `base_url` (with an `{endpoint}` field) and `headers`
+
+    Requests go through the shared pooled session (or `session`, if set) with the retry,
+    backoff, rate-limit, transport and metrics behaviour of `download()`, so one instance can be reused
+    for any number of calls, from many threads or, with `asend_api_request()`, from coroutines.
+    """
+
     espn_response = ESPNResponse
 
     base_url = None
@@ -268,6 +982,14 @@ class ESPNHTTP:
 
     headers = None
 
+    session = None
+
+    num_retries = 15
+
+    backoff_factor = DEFAULT_BACKOFF_FACTOR
+
+    max_backoff = DEFAULT_MAX_BACKOFF
+
     def clean_contents(self, contents):
         return contents
 
@@ -283,34 +1005,46 @@ class ESPNHTTP:
 
         self.parameters = parameters
 
-        request_headers = self.headers if headers is None else headers
+        request_headers = dict(self.headers or {}) if headers is None else dict(headers)
         if referer:
             request_headers["Referer"] = referer
 
-        url = None
-
-        status_code = None
-
-        contents = None
-
         # Sort parameters by key... for some reason this matters for some requests...
-
-        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
-
-        if not contents:
-            response = requests.get(url=base_url, params=parameters, headers=request_headers, timeout=timeout)
-
-            url = response.url
-
-            status_code = response.status_code
-
-            contents = response.text
-
-        contents = self.clean_contents(contents)
-
-        data = self.espn_response(response=contents, status_code=status_code, url=url)
+        if isinstance(parameters, dict):
+            parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+
+        response = _get_with_retries(
+            self.session or get_session(),
+            base_url,
+            params=parameters,
+            headers=request_headers,
+            proxy=None,
+            timeout=timeout,
+            num_retries=self.num_retries,
+            logger=logger,
+            backoff_factor=self.backoff_factor,
+            max_backoff=self.max_backoff,
+        )
+
+        contents = self.clean_contents(response.text)
+
+        data = self.espn_response(response=contents, status_code=response.status_code, url=response.url)
 
         if raise_exception_on_error and not data.valid_json():
             raise Exception("InvalidResponse: Response is not in a valid JSON format.")
 
         return data
+
+    async def asend_api_request(
+        self, endpoint, parameters, referer=None, headers=None, timeout=None, raise_exception_on_error=False
+    ):
+        """Coroutine version of `send_api_request()`, limited by `set_async_concurrency()`"""
+        return await run_async(
+            self.send_api_request,
+            endpoint,
+            parameters,
+            referer=referer,
+            headers=headers,
+            timeout=timeout,
+            raise_exception_on_error=raise_exception_on_error,
+        )
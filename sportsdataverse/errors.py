@@ -3,7 +3,7 @@ Custom exceptions for sportsdataverse module
 """
 
 
-class SeasonNotFoundError(Exception):
+class SeasonNotFoundError(ValueError):
     pass
 
 
@@ -21,7 +21,10 @@ class NoESPNDataError(Exception):
 def no_espn_data(response):
     if response.status_code == 404:
         raise NoESPNDataError(f"NoESPNDataError: No response for {response.url}")
-    elif response.json().get("code", None) == 404:
-        raise NoESPNDataError(f"NoESPNDataError: No data found for {response.url}, response: {response.json()}")
-    else:
+    try:
+        body = response.json()
+    except ValueError:
         return response
+    if isinstance(body, dict) and body.get("code", None) == 404:
+        raise NoESPNDataError(f"NoESPNDataError: No data found for {response.url}, response: {body}")
+    return response
@@ -0,0 +1,577 @@
+import contextlib
+import functools
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Tuple
+
+import polars as pl
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import requests
+from tqdm import tqdm
+
+from sportsdataverse.dataset_cache import get_dataset_cache
+from sportsdataverse.errors import season_not_found_error
+from sportsdataverse.mirror import mirrored_path
+from sportsdataverse.remote_parquet import RangeRequestsNotSupported, range_reads_enabled, read_parquet_range
+
+logger = logging.getLogger("sdv.loader_utils")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def cached_path(url: str) -> str:
+    """Return a local copy of `url` from the mirror or the dataset cache, or `url` itself if neither is possible
+
+    Args:
+        url (str): Location of a release file.
+
+    Returns:
+        str: Local path of the mirrored or cached file, or the original URL.
+    """
+    mirrored = mirrored_path(url)
+    if mirrored is not None:
+        return mirrored
+    cache = get_dataset_cache()
+    if not cache.enabled or not url.startswith(("http://", "https://")):
+        return url
+    try:
+        return cache.fetch(url)
+    except requests.RequestException:
+        raise
+    except OSError as e:
+        logger.warning("Dataset cache unavailable (%s), reading %s directly", e, url)
+        return url
+
+
+def cached_derived_path(url: str, suffix: str, build) -> Optional[str]:
+    """Return a cached file derived from `url` (see `DatasetCache.fetch_derived()`), or None if caching is not possible
+
+    If `url` has a local mirror (see `mirrored_path()`), the file is derived from the mirrored copy
+    with `DatasetCache.derive_local()`, so nothing is written to the mirror directory.
+
+    Args:
+        url (str): Location of a release file.
+        suffix (str): Extension of the derived file, e.g. "parquet".
+        build (callable): Function called as `build(source_path, target_path)`.
+
+    Returns:
+        str: Local path of the derived file, or None if the dataset cache is disabled or unavailable.
+    """
+    mirrored = mirrored_path(url)
+    cache = get_dataset_cache()
+    if not cache.enabled:
+        return None
+    try:
+        if mirrored is not None:
+            return cache.derive_local(mirrored, suffix, build)
+        return cache.fetch_derived(url, suffix, build)
+    except requests.RequestException:
+        raise
+    except OSError as e:
+        logger.warning("Dataset cache unavailable (%s), reading %s directly", e, url)
+        return None
+
+
+def normalize_filters(filters) -> Optional[List[Tuple[str, str, Any]]]:
+    """Convert loader `filters` into a list of `(column, op, value)` tuples
+
+    Args:
+        filters (dict or list): Either a dict mapping column names to a value or a collection of
+            accepted values, e.g. `{"week": [1, 2], "season_type": "REG"}`, or a list of
+            `(column, op, value)` tuples as accepted by `pyarrow.parquet.read_table`.
+
+    Returns:
+        list: Filters in `pyarrow` conjunctive form, or None if `filters` is empty.
+    """
+    if not filters:
+        return None
+    if isinstance(filters, dict):
+        normalized = []
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set, range)):
+                normalized.append((column, "in", list(value)))
+            else:
+                normalized.append((column, "==", value))
+        return normalized
+    return [tuple(f) for f in filters]
+
+
+_FILTER_OPS = {
+    "==": lambda col, value: col == value,
+    "=": lambda col, value: col == value,
+    "!=": lambda col, value: col != value,
+    "<": lambda col, value: col < value,
+    "<=": lambda col, value: col <= value,
+    ">": lambda col, value: col > value,
+    ">=": lambda col, value: col >= value,
+    "in": lambda col, value: col.is_in(list(value)),
+    "not in": lambda col, value: ~col.is_in(list(value)),
+}
+
+
+def filters_to_expr(filters) -> Optional[pl.Expr]:
+    """Build a polars expression equivalent to loader `filters`, for sources without predicate pushdown
+
+    Args:
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+
+    Returns:
+        pl.Expr: Boolean expression combining every filter, or None if `filters` is empty.
+    """
+    normalized = normalize_filters(filters)
+    if not normalized:
+        return None
+    exprs = [_FILTER_OPS[op](pl.col(column), value) for column, op, value in normalized]
+    return functools.reduce(lambda a, b: a & b, exprs)
+
+
+def select_and_filter(data: pl.DataFrame, columns=None, filters=None) -> pl.DataFrame:
+    """Apply loader `columns` and `filters` to an already materialised dataframe
+
+    Args:
+        data (pl.DataFrame): Dataframe read from a source that cannot push down projections or filters.
+        columns (list): Columns to keep. If None, all columns are kept.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+
+    Returns:
+        pl.DataFrame: The filtered and projected dataframe.
+    """
+    expr = filters_to_expr(filters)
+    if expr is not None:
+        data = data.filter(expr)
+    return data.select(columns) if columns is not None else data
+
+
+def read_parquet_url(url: str, columns=None, filters=None) -> pl.DataFrame:
+    """Read a single parquet release file into a polars dataframe, going through the dataset cache
+
+    Only the requested columns are decoded, and row groups whose statistics cannot satisfy
+    `filters` are skipped by the parquet reader. When `columns` or `filters` are given for a
+    file that is neither mirrored nor cached yet, only the footer and the needed column chunks
+    are downloaded with HTTP Range requests (see `remote_parquet.read_parquet_range()`).
+
+    Args:
+        url (str): Location of the parquet file.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing the contents of the file.
+    """
+    if (columns is not None or filters) and _prefer_range_read(url):
+        try:
+            return read_parquet_range(url, columns=columns, filters=normalize_filters(filters))
+        except RangeRequestsNotSupported as e:
+            logger.debug("%s, downloading the whole file", e)
+    return _read_parquet_source(cached_path(url), columns=columns, filters=filters)
+
+
+def _prefer_range_read(url):
+    if not url.startswith(("http://", "https://")) or not range_reads_enabled():
+        return False
+    if mirrored_path(url) is not None:
+        return False
+    cache = get_dataset_cache()
+    return not (cache.enabled and os.path.exists(cache.path_for(url)))
+
+
+def _read_parquet_source(source, columns=None, filters=None) -> pl.DataFrame:
+    filters = normalize_filters(filters)
+    return pl.read_parquet(
+        source,
+        columns=columns,
+        use_pyarrow=True,
+        pyarrow_options={"filters": filters} if filters else None,
+    )
+
+
+def scan_parquet_url(url: str, columns=None, filters=None) -> pl.LazyFrame:
+    """Lazily scan a single parquet release file
+
+    The file is downloaded to the dataset cache first, since `pl.scan_parquet` can only scan
+    local files. If the cache is disabled the file is read eagerly and wrapped in a LazyFrame.
+
+    Args:
+        url (str): Location of the parquet file.
+        columns (list): Columns to select. If None, all columns are selected.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+
+    Returns:
+        pl.LazyFrame: Polars LazyFrame over the contents of the file.
+    """
+    source = cached_path(url)
+    if source.startswith(("http://", "https://")):
+        logger.warning("Dataset cache disabled (set SDV_CACHE=1), reading %s eagerly for return_as='lazy'", url)
+        return read_parquet_url(url, columns=columns, filters=filters).lazy()
+    data = pl.scan_parquet(source)
+    expr = filters_to_expr(filters)
+    if expr is not None:
+        data = data.filter(expr)
+    return data.select(columns) if columns is not None else data
+
+
+def load_file(url: str, columns=None, filters=None, lazy=False):
+    """Load a single (non-seasonal) parquet release file
+
+    Args:
+        url (str): Location of the parquet file.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+        lazy (bool): If True, returns a `pl.LazyFrame` from `scan_parquet_url()`.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame: The contents of the file.
+    """
+    reader = scan_parquet_url if lazy else read_parquet_url
+    return reader(url, columns=columns, filters=filters)
+
+
+def as_return_type(data, return_as=None, return_as_pandas=False):
+    """Convert loaded data to the type requested by a loader's `return_as` / `return_as_pandas` arguments
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame): Loaded data.
+        return_as (str): One of "polars", "pandas" or "lazy". Takes precedence over `return_as_pandas`.
+        return_as_pandas (bool): If True and `return_as` is None, returns a pandas dataframe.
+
+    Returns:
+        pl.DataFrame, pd.DataFrame or pl.LazyFrame: The data in the requested form.
+
+    Raises:
+        ValueError: If `return_as` is not one of the accepted values.
+    """
+    if return_as is None:
+        return_as = "pandas" if return_as_pandas else "polars"
+    if return_as == "lazy":
+        return data if isinstance(data, pl.LazyFrame) else data.lazy()
+    if isinstance(data, pl.LazyFrame):
+        data = data.collect()
+    if return_as == "pandas":
+        return data.to_pandas(use_pyarrow_extension_array=True)
+    if return_as == "polars":
+        return data
+    raise ValueError(f"return_as must be one of 'polars', 'pandas' or 'lazy', got {return_as!r}")
+
+
+COMPACT_CATEGORICAL_RATIO = 0.2
+_COMPACT_INT_DTYPES = [
+    (pl.Int8, -(2**7), 2**7 - 1),
+    (pl.Int16, -(2**15), 2**15 - 1),
+    (pl.Int32, -(2**31), 2**31 - 1),
+    (pl.Int64, -(2**63), 2**63 - 1),
+]
+_INT_WIDTH = {dtype: i for i, (dtype, _, _) in enumerate(_COMPACT_INT_DTYPES)}
+
+
+def _smallest_int_dtype(minimum, maximum):
+    for dtype, low, high in _COMPACT_INT_DTYPES:
+        if low <= minimum and maximum <= high:
+            return dtype
+    return None
+
+
+def compact_frame(data: pl.DataFrame, categorical_ratio=COMPACT_CATEGORICAL_RATIO) -> pl.DataFrame:
+    """Shrink a dataframe's memory footprint without changing its values
+
+    Low-cardinality string columns (team abbreviations, play types, player names) become
+    `pl.Categorical`, integer columns are downcast to the smallest signed integer type that
+    holds their range, and float columns holding only whole numbers (downs, yard lines, 0/1
+    flags) become integers. Call with the global string cache enabled if the result will be
+    concatenated with other compacted frames.
+
+    Args:
+        data (pl.DataFrame): Dataframe to compact.
+        categorical_ratio (float): String columns with at most this ratio of unique values
+            to rows are dictionary-encoded.
+
+    Returns:
+        pl.DataFrame: The compacted dataframe.
+    """
+    if data.height == 0:
+        return data
+    casts = []
+    for name, dtype in data.schema.items():
+        column = data.get_column(name)
+        if column.null_count() == data.height:
+            continue
+        if dtype == pl.Utf8:
+            if column.n_unique() <= categorical_ratio * data.height:
+                casts.append(pl.col(name).cast(pl.Categorical))
+        elif dtype in pl.INTEGER_DTYPES:
+            target = _smallest_int_dtype(column.min(), column.max())
+            if target is not None and target != dtype:
+                casts.append(pl.col(name).cast(target))
+        elif dtype in pl.FLOAT_DTYPES:
+            non_null = column.drop_nulls()
+            if non_null.is_nan().any() or non_null.is_infinite().any() or not (non_null == non_null.round(0)).all():
+                continue
+            target = _smallest_int_dtype(non_null.min(), non_null.max())
+            if target is not None and target != pl.Int64:
+                casts.append(pl.col(name).cast(target))
+    return data.with_columns(casts) if casts else data
+
+
+def _unify_compact_dtypes(frames: List[pl.DataFrame]) -> List[pl.DataFrame]:
+    # Seasons are compacted independently, so the same column can end up with different dtypes
+    found = {}
+    for frame in frames:
+        for name, dtype in frame.schema.items():
+            found.setdefault(name, set()).add(dtype)
+    targets = {}
+    for name, dtypes in found.items():
+        if len(dtypes) == 1:
+            continue
+        if dtypes <= {pl.Utf8, pl.Categorical}:
+            targets[name] = pl.Categorical
+        elif all(dtype in _INT_WIDTH for dtype in dtypes):
+            targets[name] = max(dtypes, key=_INT_WIDTH.get)
+        elif all(dtype in pl.NUMERIC_DTYPES for dtype in dtypes):
+            targets[name] = pl.Float64
+    if not targets:
+        return frames
+    return [
+        frame.with_columns([pl.col(name).cast(dtype) for name, dtype in targets.items() if name in frame.columns])
+        for frame in frames
+    ]
+
+
+def load_seasons(
+    url: str,
+    seasons: List[int],
+    min_season: int,
+    columns=None,
+    filters=None,
+    lazy=False,
+    compact=False,
+    max_workers=None,
+    missing_ok=False,
+    reader=None,
+    to_partitioned=None,
+):
+    """Load one parquet file per season and stack them into a single dataframe
+
+    Seasons are downloaded concurrently on a bounded thread pool and concatenated once
+    at the end, in the order they were requested.
+
+    Args:
+        url (str): URL template with a `{season}` placeholder, e.g. `config.NFL_BASE_URL`.
+        seasons (list): Seasons to load. A single int is treated as a one-season list.
+        min_season (int): Earliest available season for the dataset.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the reader, in any form accepted
+            by `normalize_filters()`.
+        lazy (bool): If True, returns a `pl.LazyFrame` concatenating a scan of every season's file.
+        compact (bool): If True, each season is passed through `compact_frame()` as it arrives, inside a
+            `pl.StringCache()` so categorical columns from different seasons can be combined. Compaction
+            needs the data in memory, so it cannot be combined with `lazy`.
+        max_workers (int): Maximum number of seasons downloaded at the same time.
+            Defaults to `DEFAULT_MAX_WORKERS`.
+        missing_ok (bool): If True, seasons that fail to download are skipped with a message
+            instead of raising.
+        reader (callable): Function taking a single season's URL plus the `columns` and `filters`
+            keyword arguments and returning a polars dataframe.
+            Defaults to `read_parquet_url`, or `scan_parquet_url` when `lazy` is True.
+        to_partitioned (str): If given, the loaded data is also written to this directory with
+            `export_dataset()`, partitioned by whichever of `DEFAULT_PARTITION_BY` it has.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame: The requested seasons.
+
+    Raises:
+        SeasonNotFoundError: If any season is less than `min_season`.
+        ValueError: If both `compact` and `lazy` are True.
+    """
+    if compact and lazy:
+        raise ValueError("compact=True needs the data in memory and cannot be combined with a lazy result")
+    if type(seasons) is int:
+        seasons = [seasons]
+    seasons = list(seasons)
+    for season in seasons:
+        season_not_found_error(int(season), min_season)
+    if not seasons:
+        return pl.LazyFrame() if lazy else pl.DataFrame()
+    if reader is None:
+        reader = scan_parquet_url if lazy else read_parquet_url
+
+    def fetch(season):
+        try:
+            data = reader(url.format(season=season), columns=columns, filters=filters)
+            if compact:
+                return compact_frame(data)
+            return data.lazy() if lazy and isinstance(data, pl.DataFrame) else data
+        except Exception:
+            if not missing_ok:
+                raise
+            print(f"We don't seem to have data for the {season} season.")
+            return None
+
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(seasons)))
+    with pl.StringCache() if compact else contextlib.nullcontext():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = list(tqdm(executor.map(fetch, seasons), total=len(seasons)))
+        frames = [frame for frame in frames if frame is not None]
+        if not frames:
+            return pl.LazyFrame() if lazy else pl.DataFrame()
+        if compact:
+            frames = _unify_compact_dtypes(frames)
+        data = pl.concat(frames, how="vertical")
+    if to_partitioned is not None:
+        partition_by = [col for col in DEFAULT_PARTITION_BY if col in data.columns]
+        export_dataset(data.collect() if lazy else data, to_partitioned, partition_by=partition_by)
+    return data
+
+
+DEFAULT_PARTITION_BY = ["season", "week"]
+
+
+def export_dataset(data, path: str, partition_by=DEFAULT_PARTITION_BY, sort_by="game_id") -> str:
+    """Write a dataframe to a hive-partitioned parquet dataset (`season=2022/week=1/part-0.parquet`)
+
+    Files are zstd-compressed with column statistics, and rows are sorted by `sort_by` within
+    each partition, so readers can skip whole partitions by path and row groups by statistics.
+    Partitions present in `data` replace any existing files for the same partition; other
+    partitions already under `path` are left alone. Read the dataset back with `scan_dataset()`.
+
+    Example:
+        `sportsdataverse.loader_utils.export_dataset(nfl_df, "/data/nfl_pbp", partition_by=["season", "week"])`
+
+    Args:
+        data (pl.DataFrame, pl.LazyFrame or pd.DataFrame): Data to write.
+        path (str): Root directory of the dataset.
+        partition_by (list): Columns to partition by, outermost first.
+        sort_by (str): Column to sort by within each partition. Skipped if `data` does not have it.
+
+    Returns:
+        str: `path`.
+    """
+    if isinstance(data, pl.LazyFrame):
+        data = data.collect()
+    elif not isinstance(data, pl.DataFrame):
+        data = pl.from_pandas(data)
+    partition_by = list(partition_by or [])
+    missing = [col for col in partition_by if col not in data.columns]
+    if missing:
+        raise ValueError(f"Cannot partition by missing columns: {missing}")
+    sort_cols = partition_by + ([sort_by] if sort_by is not None and sort_by in data.columns else [])
+    if sort_cols:
+        data = data.sort(sort_cols)
+    pq.write_to_dataset(
+        data.to_arrow(),
+        root_path=path,
+        partition_cols=partition_by or None,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+        compression="zstd",
+        write_statistics=True,
+    )
+    return path
+
+
+def scan_dataset(path: str, columns=None, filters=None) -> pl.LazyFrame:
+    """Lazily scan a hive-partitioned dataset written by `export_dataset()`
+
+    Filters on partition columns prune whole directories before any file is opened.
+
+    Args:
+        path (str): Root directory of the dataset.
+        columns (list): Columns to select. If None, all columns are selected.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+
+    Returns:
+        pl.LazyFrame: Polars LazyFrame over the dataset, with the partition columns included.
+    """
+    data = pl.scan_pyarrow_dataset(ds.dataset(path, format="parquet", partitioning="hive"))
+    expr = filters_to_expr(filters)
+    if expr is not None:
+        data = data.filter(expr)
+    return data.select(columns) if columns is not None else data
+
+
+def iter_seasons(
+    url: str,
+    seasons: List[int],
+    min_season: int,
+    batch="season",
+    columns=None,
+    filters=None,
+    return_as_pandas=False,
+) -> Iterator[pl.DataFrame]:
+    """Iterate over one parquet file per season without holding more than one season in memory
+
+    While a batch is being consumed, the next season's file is downloaded to the dataset
+    cache in the background.
+
+    Args:
+        url (str): URL template with a `{season}` placeholder, e.g. `config.NFL_BASE_URL`.
+        seasons (list): Seasons to iterate over. A single int is treated as a one-season list.
+        min_season (int): Earliest available season for the dataset.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one
+            dataframe per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Filters in any form accepted by `normalize_filters()`.
+        return_as_pandas (bool): If True, yields pandas dataframes.
+
+    Returns:
+        Iterator[pl.DataFrame]: Generator of dataframes, in season order.
+
+    Raises:
+        SeasonNotFoundError: If any season is less than `min_season`.
+        ValueError: If `batch` is not "season" or "row_group".
+    """
+    if batch not in ("season", "row_group"):
+        raise ValueError(f"batch must be 'season' or 'row_group', got {batch!r}")
+    if type(seasons) is int:
+        seasons = [seasons]
+    seasons = list(seasons)
+    for season in seasons:
+        season_not_found_error(int(season), min_season)
+    urls = [url.format(season=season) for season in seasons]
+    return _iter_sources(urls, batch, columns, filters, return_as_pandas)
+
+
+def _iter_sources(urls, batch, columns, filters, return_as_pandas):
+    if not urls:
+        return
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_prefetch_source, urls[0])
+        for i in range(len(urls)):
+            source = pending.result()
+            pending = executor.submit(_prefetch_source, urls[i + 1]) if i + 1 < len(urls) else None
+            if batch == "season":
+                batches = [_read_parquet_source(source, columns=columns, filters=filters)]
+            else:
+                batches = _iter_row_groups(source, columns=columns, filters=filters)
+            for data in batches:
+                yield data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+            del source, batches
+
+
+def _prefetch_source(url):
+    source = cached_path(url)
+    if source.startswith(("http://", "https://")):
+        # Nothing on disk to prefetch into when the cache is disabled, so hold the compressed bytes instead
+        response = requests.get(source, timeout=60)
+        response.raise_for_status()
+        return io.BytesIO(response.content)
+    return source
+
+
+def _iter_row_groups(source, columns=None, filters=None):
+    parquet_file = pq.ParquetFile(source)
+    expr = filters_to_expr(filters)
+    read_columns = None
+    if columns is not None:
+        filter_columns = [column for column, _, _ in normalize_filters(filters) or []]
+        read_columns = list(dict.fromkeys(list(columns) + filter_columns))
+    for i in range(parquet_file.num_row_groups):
+        data = pl.from_arrow(parquet_file.read_row_group(i, columns=read_columns))
+        if expr is not None:
+            data = data.filter(expr)
+        if columns is not None:
+            data = data.select(columns)
+        if data.height > 0:
+            yield data
@@ -0,0 +1,238 @@
+import collections
+import functools
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import polars as pl
+
+logger = logging.getLogger("sdv.metrics")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_MAX_EVENTS = 100_000
+PERCENTILES = (50, 90, 99)
+
+_hooks = []
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook):
+    """Call `hook(event)` for every timing event emitted by `dl_utils.download()`, `ESPNHTTP` and `timed()`
+
+    Request events are dicts with the keys:
+
+    - `kind`: `"request"`.
+    - `endpoint`: Scheme, host and path of the request, without the query string.
+    - `url`: The full URL that was requested.
+    - `status`: HTTP status of the final attempt, or None if no response was received.
+    - `attempts`: Number of attempts sent over the network (0 for cache hits and coalesced calls).
+    - `retries`: `attempts - 1`, or 0.
+    - `ttfb`: Seconds from sending the final attempt until its headers were parsed. This includes
+      DNS lookup and connection setup when the pool had no open connection to the host.
+    - `transfer`: Seconds spent reading the body of the final attempt.
+    - `total`: Seconds spent in the call, including backoff between retries.
+    - `bytes`: Size of the response body.
+    - `cache`: `"hit"`, `"miss"`, `"coalesced"` (answered by a concurrent identical call) or `"off"`.
+    - `error`: Name of the exception raised, or None.
+
+    Function events from `timed()` have `kind="function"`, `endpoint` set to the function name,
+    `total` and `error`.
+
+    Hooks run on the thread that made the request and must not raise.
+
+    Example:
+        `sportsdataverse.metrics.add_hook(lambda event: print(event["endpoint"], event["total"]))`
+
+    Args:
+        hook (callable): Function taking one event dict.
+    """
+    with _hooks_lock:
+        _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """Stop calling a hook added with `add_hook()`"""
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def hooks_enabled() -> bool:
+    """Return True if at least one hook is registered, so callers can skip building events"""
+    return bool(_hooks)
+
+
+def emit(event):
+    """Pass an event to every registered hook"""
+    for hook in list(_hooks):
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Metrics hook %r failed", hook)
+
+
+def endpoint_of(url) -> str:
+    """Return the scheme, host and path of `url`, the key events are grouped by"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def request_event(url, status=None, attempts=0, ttfb=None, transfer=None, total=0.0, nbytes=0, cache="off", error=None):
+    """Build a request event (see `add_hook()`)"""
+    return {
+        "kind": "request",
+        "endpoint": endpoint_of(url),
+        "url": url,
+        "status": status,
+        "attempts": attempts,
+        "retries": max(attempts - 1, 0),
+        "ttfb": ttfb,
+        "transfer": transfer,
+        "total": total,
+        "bytes": nbytes,
+        "cache": cache,
+        "error": error,
+    }
+
+
+def timed(name=None):
+    """Decorator emitting a `kind="function"` event with the wall time of every call of the wrapped function
+
+    Example:
+        ```
+        @sportsdataverse.metrics.timed()
+        def scrape_week(week):
+            ...
+        ```
+
+    Args:
+        name (str): Name reported as the event's `endpoint`. Defaults to the function's qualified name.
+    """
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                if _hooks:
+                    emit({"kind": "function", "endpoint": label, "total": time.perf_counter() - start, "error": error})
+
+        return wrapper
+
+    return decorator
+
+
+def _percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(int(round(q / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class MetricsCollector:
+    """In-process collector of timing events, with per-endpoint percentiles
+
+    Keeps the most recent `max_events` events. Register it with `add_hook()`, or use
+    `enable_metrics()`, which does both.
+
+    Example:
+        ```
+        collector = sportsdataverse.metrics.enable_metrics()
+        sportsdataverse.cfb.espn_cfb_schedule(dates=2022)
+        print(collector.summary())
+        ```
+
+    Args:
+        max_events (int): Number of events kept.
+    """
+
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS):
+        self.events = collections.deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def reset(self):
+        """Drop every collected event"""
+        with self._lock:
+            self.events.clear()
+
+    def to_frame(self, return_as_pandas=False) -> pl.DataFrame:
+        """Return the collected events, one row per event"""
+        with self._lock:
+            events = list(self.events)
+        keys = list(request_event("").keys())
+        data = pl.DataFrame({k: [event.get(k) for event in events] for k in keys})
+        return data.to_pandas() if return_as_pandas else data
+
+    def summary(self, return_as_pandas=False) -> pl.DataFrame:
+        """Summarise the collected events by endpoint, slowest 99th percentile first
+
+        Returns:
+            pl.DataFrame: One row per endpoint with `kind`, `count`, `errors`, `retries`,
+            `cache_hits`, `bytes`, and the `total_p50`, `total_p90`, `total_p99`, `ttfb_p50`,
+            `ttfb_p90` and `ttfb_p99` timings in seconds.
+        """
+        with self._lock:
+            events = list(self.events)
+        groups = {}
+        for event in events:
+            groups.setdefault((event["kind"], event["endpoint"]), []).append(event)
+        rows = []
+        for (kind, endpoint), group in groups.items():
+            row = {
+                "endpoint": endpoint,
+                "kind": kind,
+                "count": len(group),
+                "errors": sum(event.get("error") is not None for event in group),
+                "retries": sum(event.get("retries") or 0 for event in group),
+                "cache_hits": sum(event.get("cache") in ("hit", "coalesced") for event in group),
+                "bytes": sum(event.get("bytes") or 0 for event in group),
+            }
+            for field in ("total", "ttfb"):
+                values = sorted(event[field] for event in group if event.get(field) is not None)
+                for q in PERCENTILES:
+                    row[f"{field}_p{q}"] = _percentile(values, q)
+            rows.append(row)
+        schema = {"endpoint": pl.Utf8, "kind": pl.Utf8, "count": pl.Int64, "errors": pl.Int64}
+        schema.update({"retries": pl.Int64, "cache_hits": pl.Int64, "bytes": pl.Int64})
+        schema.update({f"{field}_p{q}": pl.Float64 for field in ("total", "ttfb") for q in PERCENTILES})
+        data = pl.DataFrame(rows, schema=schema).sort("total_p99", descending=True, nulls_last=True)
+        return data.to_pandas() if return_as_pandas else data
+
+
+_collector = None
+
+
+def enable_metrics(max_events=DEFAULT_MAX_EVENTS) -> MetricsCollector:
+    """Start collecting timing events in-process and return the collector
+
+    Calling it again returns the same collector.
+    """
+    global _collector
+    with _hooks_lock:
+        if _collector is None:
+            _collector = MetricsCollector(max_events=max_events)
+            _hooks.append(_collector)
+    return _collector
+
+
+def disable_metrics():
+    """Stop the collector started by `enable_metrics()`"""
+    global _collector
+    if _collector is not None:
+        remove_hook(_collector)
+        _collector = None
@@ -0,0 +1,318 @@
+import datetime
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from tqdm import tqdm
+
+from sportsdataverse.config import (
+    CFB_BASE_URL,
+    CFB_BETTING_LINES_URL,
+    CFB_ROSTER_URL,
+    CFB_TEAM_INFO_URL,
+    CFB_TEAM_SCHEDULE_URL,
+    MBB_BASE_URL,
+    MBB_PLAYER_BOX_URL,
+    MBB_TEAM_BOX_URL,
+    MBB_TEAM_SCHEDULE_URL,
+    NBA_BASE_URL,
+    NBA_PLAYER_BOX_URL,
+    NBA_TEAM_BOX_URL,
+    NBA_TEAM_SCHEDULE_URL,
+    NFL_BASE_URL,
+    NFL_COMBINE_URL,
+    NFL_CONTRACTS_URL,
+    NFL_DEPTH_CHARTS_URL,
+    NFL_DRAFT_PICKS_URL,
+    NFL_INJURIES_URL,
+    NFL_NGS_PASSING_URL,
+    NFL_NGS_RECEIVING_URL,
+    NFL_NGS_RUSHING_URL,
+    NFL_OFFICIALS_URL,
+    NFL_PBP_PARTICIPATION_URL,
+    NFL_PFR_SEASON_DEF_URL,
+    NFL_PFR_SEASON_PASS_URL,
+    NFL_PFR_SEASON_REC_URL,
+    NFL_PFR_SEASON_RUSH_URL,
+    NFL_PFR_WEEK_DEF_URL,
+    NFL_PFR_WEEK_PASS_URL,
+    NFL_PFR_WEEK_REC_URL,
+    NFL_PFR_WEEK_RUSH_URL,
+    NFL_PLAYER_STATS_URL,
+    NFL_PLAYER_URL,
+    NFL_ROSTER_URL,
+    NFL_SNAP_COUNTS_URL,
+    NFL_TEAM_SCHEDULE_URL,
+    NFL_WEEKLY_ROSTER_URL,
+    NHL_BASE_URL,
+    NHL_PLAYER_BOX_URL,
+    NHL_TEAM_BOX_URL,
+    NHL_TEAM_SCHEDULE_URL,
+    WBB_BASE_URL,
+    WBB_PLAYER_BOX_URL,
+    WBB_TEAM_BOX_URL,
+    WBB_TEAM_SCHEDULE_URL,
+    WNBA_BASE_URL,
+    WNBA_PLAYER_BOX_URL,
+    WNBA_TEAM_BOX_URL,
+    WNBA_TEAM_SCHEDULE_URL,
+)
+
+logger = logging.getLogger("sdv.mirror")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RETRIES = 3
+CHUNK_SIZE = 1024 * 1024
+
+# Dataset name -> (URL, earliest season). Datasets without a `{season}` placeholder are a single file.
+DATASETS: Dict[str, Tuple[str, Optional[int]]] = {
+    "cfb_pbp": (CFB_BASE_URL, 2003),
+    "cfb_schedule": (CFB_TEAM_SCHEDULE_URL, 2002),
+    "cfb_rosters": (CFB_ROSTER_URL, 2004),
+    "cfb_team_info": (CFB_TEAM_INFO_URL, 2002),
+    "cfb_betting_lines": (CFB_BETTING_LINES_URL, None),
+    "mbb_pbp": (MBB_BASE_URL, 2002),
+    "mbb_team_box": (MBB_TEAM_BOX_URL, 2002),
+    "mbb_player_box": (MBB_PLAYER_BOX_URL, 2002),
+    "mbb_schedule": (MBB_TEAM_SCHEDULE_URL, 2002),
+    "nba_pbp": (NBA_BASE_URL, 2002),
+    "nba_team_box": (NBA_TEAM_BOX_URL, 2002),
+    "nba_player_box": (NBA_PLAYER_BOX_URL, 2002),
+    "nba_schedule": (NBA_TEAM_SCHEDULE_URL, 2002),
+    "nfl_pbp": (NFL_BASE_URL, 1999),
+    "nfl_schedule": (NFL_TEAM_SCHEDULE_URL, 1999),
+    "nfl_players": (NFL_PLAYER_URL, None),
+    "nfl_player_stats": (NFL_PLAYER_STATS_URL, None),
+    "nfl_ngs_passing": (NFL_NGS_PASSING_URL, None),
+    "nfl_ngs_rushing": (NFL_NGS_RUSHING_URL, None),
+    "nfl_ngs_receiving": (NFL_NGS_RECEIVING_URL, None),
+    "nfl_pfr_pass": (NFL_PFR_SEASON_PASS_URL, None),
+    "nfl_pfr_rush": (NFL_PFR_SEASON_RUSH_URL, None),
+    "nfl_pfr_rec": (NFL_PFR_SEASON_REC_URL, None),
+    "nfl_pfr_def": (NFL_PFR_SEASON_DEF_URL, None),
+    "nfl_pfr_weekly_pass": (NFL_PFR_WEEK_PASS_URL, 2018),
+    "nfl_pfr_weekly_rush": (NFL_PFR_WEEK_RUSH_URL, 2018),
+    "nfl_pfr_weekly_rec": (NFL_PFR_WEEK_REC_URL, 2018),
+    "nfl_pfr_weekly_def": (NFL_PFR_WEEK_DEF_URL, 2018),
+    "nfl_rosters": (NFL_ROSTER_URL, 1920),
+    "nfl_weekly_rosters": (NFL_WEEKLY_ROSTER_URL, 2002),
+    "nfl_snap_counts": (NFL_SNAP_COUNTS_URL, 2012),
+    "nfl_pbp_participation": (NFL_PBP_PARTICIPATION_URL, 2016),
+    "nfl_injuries": (NFL_INJURIES_URL, 2009),
+    "nfl_depth_charts": (NFL_DEPTH_CHARTS_URL, 2001),
+    "nfl_contracts": (NFL_CONTRACTS_URL, None),
+    "nfl_draft_picks": (NFL_DRAFT_PICKS_URL, None),
+    "nfl_combine": (NFL_COMBINE_URL, None),
+    "nfl_officials": (NFL_OFFICIALS_URL, None),
+    "nhl_pbp": (NHL_BASE_URL, 2011),
+    "nhl_team_box": (NHL_TEAM_BOX_URL, 2011),
+    "nhl_player_box": (NHL_PLAYER_BOX_URL, 2011),
+    "nhl_schedule": (NHL_TEAM_SCHEDULE_URL, 2002),
+    "wbb_pbp": (WBB_BASE_URL, 2002),
+    "wbb_team_box": (WBB_TEAM_BOX_URL, 2002),
+    "wbb_player_box": (WBB_PLAYER_BOX_URL, 2002),
+    "wbb_schedule": (WBB_TEAM_SCHEDULE_URL, 2002),
+    "wnba_pbp": (WNBA_BASE_URL, 2002),
+    "wnba_team_box": (WNBA_TEAM_BOX_URL, 2002),
+    "wnba_player_box": (WNBA_PLAYER_BOX_URL, 2002),
+    "wnba_schedule": (WNBA_TEAM_SCHEDULE_URL, 2002),
+}
+
+# Leading and trailing bytes every complete file of a given type must carry
+_MAGIC = {
+    ".parquet": (b"PAR1", b"PAR1"),
+    ".rds": (b"\x1f\x8b", b""),
+}
+
+_mirror_dir = None
+
+
+class MirrorIntegrityError(IOError):
+    pass
+
+
+def get_mirror_dir() -> Optional[str]:
+    """Return the local mirror directory the loaders read from, if any
+
+    Set with `set_mirror_dir()` or the `SDV_MIRROR_DIR` environment variable.
+    """
+    return _mirror_dir or os.environ.get("SDV_MIRROR_DIR") or None
+
+
+def set_mirror_dir(mirror_dir: Optional[str]):
+    """Point the `load_*` functions at a local mirror created by `sync()`
+
+    Example:
+        `sportsdataverse.mirror.set_mirror_dir("/data/sdv-mirror")`
+
+    Args:
+        mirror_dir (str): Mirror directory, or None to read from the remote releases again.
+    """
+    global _mirror_dir
+    _mirror_dir = mirror_dir
+
+
+def mirror_path(url: str, mirror_dir: str) -> str:
+    """Return the path `url` is stored at inside `mirror_dir`"""
+    parts = urlsplit(url)
+    return os.path.join(mirror_dir, parts.netloc, *parts.path.strip("/").split("/"))
+
+
+def mirrored_path(url: str) -> Optional[str]:
+    """Return the local mirror copy of `url`, or None if there is no mirror or it does not hold the file"""
+    mirror_dir = get_mirror_dir()
+    if mirror_dir is None or not url.startswith(("http://", "https://")):
+        return None
+    path = mirror_path(url, mirror_dir)
+    return path if os.path.isfile(path) else None
+
+
+def verify_file(path: str, expected_size: Optional[int] = None):
+    """Raise `MirrorIntegrityError` if `path` is truncated or not a complete file of its type
+
+    Args:
+        path (str): Local file to check.
+        expected_size (int): Size reported by the server, if known.
+    """
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        raise MirrorIntegrityError(f"{path} has {size} bytes, expected {expected_size}")
+    ext = os.path.splitext(path[: -len(".part")] if path.endswith(".part") else path)[1].lower()
+    head, tail = _MAGIC.get(ext, (b"", b""))
+    if size < len(head) + len(tail):
+        raise MirrorIntegrityError(f"{path} is too small to be a {ext} file")
+    with open(path, "rb") as f:
+        if f.read(len(head)) != head:
+            raise MirrorIntegrityError(f"{path} does not start with the {ext} magic bytes")
+        if tail:
+            f.seek(-len(tail), os.SEEK_END)
+            if f.read(len(tail)) != tail:
+                raise MirrorIntegrityError(f"{path} does not end with the {ext} magic bytes")
+
+
+def download_resumable(url: str, dest: str, session=None, retries=DEFAULT_RETRIES, timeout=60) -> str:
+    """Download `url` to `dest`, resuming an interrupted download with an HTTP Range request
+
+    Bytes are written to `<dest>.part`, which is only moved into place once the file passes
+    `verify_file()`. If the transfer drops, the next attempt (or the next `sync()`) continues
+    from the end of the partial file instead of starting over.
+
+    Args:
+        url (str): Location of the release file.
+        dest (str): Local destination path.
+        session (requests.Session): Session to download with.
+        retries (int): Number of times to resume after a dropped connection.
+        timeout (int): Timeout in seconds for each request.
+
+    Returns:
+        str: `dest`.
+    """
+    session = session or requests.Session()
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    part = f"{dest}.part"
+    for attempt in range(retries + 1):
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                if response.status_code == 416:
+                    # The partial file already holds every byte
+                    expected_size = None
+                else:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        offset = 0
+                    length = response.headers.get("Content-Length")
+                    expected_size = offset + int(length) if length is not None else None
+                    with open(part, "ab" if offset else "wb") as f:
+                        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                            f.write(chunk)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            logger.warning("Transfer of %s interrupted (%s), resuming", url, e)
+            continue
+        try:
+            verify_file(part, expected_size)
+        except MirrorIntegrityError:
+            os.remove(part)
+            raise
+        os.replace(part, dest)
+        return dest
+
+
+def dataset_urls(dataset: str, seasons: Optional[List[int]] = None) -> List[str]:
+    """Return the release file URLs of a registered dataset
+
+    Args:
+        dataset (str): A key of `DATASETS`, e.g. `"nfl_pbp"`.
+        seasons (list): Seasons to include. Defaults to every season from the first available
+            one through the current year. Ignored for single-file datasets.
+
+    Returns:
+        list: The URLs to mirror.
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset {dataset!r}, expected one of: {', '.join(sorted(DATASETS))}")
+    url, min_season = DATASETS[dataset]
+    if min_season is None:
+        return [url]
+    if seasons is None:
+        seasons = range(min_season, datetime.date.today().year + 1)
+    return [url.format(season=season) for season in seasons if int(season) >= min_season]
+
+
+def sync(
+    datasets: List[str],
+    seasons: Optional[List[int]] = None,
+    mirror_dir: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    overwrite: bool = False,
+) -> List[str]:
+    """Mirror release files into a local directory for offline use by the `load_*` functions
+
+    Example:
+        `sportsdataverse.mirror.sync(["nfl_pbp", "mbb_player_box"], seasons=range(2019, 2024), mirror_dir="/data/sdv")`
+
+    Args:
+        datasets (list): Dataset names, see `DATASETS`.
+        seasons (list): Seasons to mirror for seasonal datasets. Defaults to all available seasons.
+        mirror_dir (str): Destination directory. Defaults to `get_mirror_dir()`.
+        max_workers (int): Number of files transferred in parallel.
+        overwrite (bool): If True, download files that are already in the mirror again.
+
+    Returns:
+        list: Local paths of the mirrored files. Seasons the release does not have yet are skipped.
+    """
+    mirror_dir = mirror_dir or get_mirror_dir()
+    if mirror_dir is None:
+        raise ValueError("No mirror directory given and SDV_MIRROR_DIR is not set")
+    urls = [url for dataset in datasets for url in dataset_urls(dataset, seasons)]
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def _sync_one(url):
+        dest = mirror_path(url, mirror_dir)
+        if not overwrite and os.path.exists(dest):
+            try:
+                verify_file(dest)
+                return dest
+            except MirrorIntegrityError as e:
+                logger.warning("Re-downloading %s: %s", url, e)
+        try:
+            return download_resumable(url, dest, session=session)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                logger.info("Skipping %s, not found", url)
+                return None
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths = list(tqdm(executor.map(_sync_one, urls), total=len(urls)))
+    return [path for path in paths if path is not None]
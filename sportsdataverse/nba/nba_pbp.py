@@ -7,15 +7,25 @@ import numpy as np
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, flatten_json_iterative
+from sportsdataverse.dl_utils import download, flatten_json_iterative, run_async
 
+# Summary keys read by the cleaning functions below
+SUMMARY_KEYS_REQUIRED = ["header", "plays", "pickcenter"]
 
-def espn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
+
+def _summary_keys(keys):
+    return None if keys is None else [*keys, *SUMMARY_KEYS_REQUIRED]
+
+
+def espn_nba_pbp(game_id: int, raw=False, keys=None, **kwargs) -> Dict:
     """espn_nba_pbp() - Pull the game by id - Data from API endpoints - `nba/playbyplay`, `nba/summary`
 
     Args:
         game_id (int): Unique game_id, can be obtained from nba_schedule().
         raw (bool): If True, returns the raw json from the API endpoint. If False, returns a cleaned dictionary of datasets.
+        keys (list): Top-level keys of the summary to decode, e.g. `["plays", "boxscore"]`. The keys the
+         cleaning needs ("header", "plays", "pickcenter") are always decoded; the others are skipped without
+         being parsed and returned empty. If None, every key is decoded.
 
 
     Returns:
@@ -30,7 +40,7 @@ def espn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
     pbp_txt = {"timeouts": {}}
     # summary endpoint for pickcenter array
     summary_url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
-    summary_resp = download(summary_url, **kwargs)
+    summary_resp = download(summary_url, json_keys=_summary_keys(keys), **kwargs)
     summary = summary_resp.json()
 
     incoming_keys_expected = [
@@ -91,6 +101,16 @@ def espn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
     return helper_nba_pbp(game_id, pbp_txt)
 
 
+async def aespn_nba_pbp(game_id: int, raw=False, keys=None, **kwargs) -> Dict:
+    """aespn_nba_pbp() - Coroutine version of `espn_nba_pbp()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `nba_games = await asyncio.gather(*(sportsdataverse.nba.aespn_nba_pbp(game_id=g) for g in game_ids))`
+    """
+    return await run_async(espn_nba_pbp, game_id, raw=raw, keys=keys, **kwargs)
+
+
 def nba_pbp_disk(game_id, path_to_json):
     with open(os.path.join(path_to_json, f"{game_id}.json")) as json_file:
         pbp_txt = json.load(json_file)
@@ -1,7 +1,7 @@
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, underscore
+from sportsdataverse.dl_utils import download, run_async, underscore
 
 
 def espn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, **kwargs) -> pl.DataFrame:
@@ -51,6 +51,16 @@ def espn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, **kwa
     return rosters.to_pandas() if return_as_pandas else rosters
 
 
+async def aespn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+    """aespn_nfl_game_rosters() - Coroutine version of `espn_nfl_game_rosters()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `nfl_games = await asyncio.gather(*(sportsdataverse.nfl.aespn_nfl_game_rosters(game_id=g) for g in game_ids))`
+    """
+    return await run_async(espn_nfl_game_rosters, game_id, raw=raw, return_as_pandas=return_as_pandas, **kwargs)
+
+
 def helper_nfl_game_items(summary):
     items = pl.from_pandas(pd.json_normalize(summary, record_path="items", sep="_"))
     items.columns = [col.replace("$ref", "href") for col in items.columns]
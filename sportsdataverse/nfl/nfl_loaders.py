@@ -1,9 +1,9 @@
+import os
 import tempfile
-from typing import List
+from typing import Iterator, List
 
 import polars as pl
 from pyreadr import download_file, read_r
-from tqdm import tqdm
 
 from sportsdataverse.config import (
     NFL_BASE_URL,
@@ -34,10 +34,27 @@ from sportsdataverse.config import (
     NFL_TEAM_SCHEDULE_URL,
     NFL_WEEKLY_ROSTER_URL,
 )
-from sportsdataverse.errors import season_not_found_error
+from sportsdataverse.loader_utils import (
+    as_return_type,
+    cached_derived_path,
+    iter_seasons,
+    load_file,
+    load_seasons,
+    read_parquet_url,
+    select_and_filter,
+)
 
 
-def load_nfl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    compact=False,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL play by play data going back to 1999
 
     Example:
@@ -46,24 +63,101 @@ def load_nfl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 1999 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        compact (bool): If True, low-cardinality string columns are returned as `pl.Categorical` and
+            integer-valued columns such as downs, yard lines and flags are downcast to the smallest integer
+            type that holds them. Cannot be combined with `return_as="lazy"`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
 
     Raises:
         ValueError: If `season` is less than 1999.
+        ValueError: If `compact` is True and `return_as` is "lazy".
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 1999)
-        i_data = pl.read_parquet(NFL_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_BASE_URL,
+        seasons,
+        min_season=1999,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        compact=compact,
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def iter_nfl_pbp(
+    seasons: List[int], batch="season", columns=None, filters=None, return_as_pandas=False
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL play by play data going back to 1999, one batch at a time
+
+    Only one season is held in memory at a time while the next season's file is
+    downloaded in the background.
+
+    Example:
+        `for nfl_df in sportsdataverse.nfl.iter_nfl_pbp(seasons=range(1999,2021)):`
+
+    Args:
+        seasons (list): Used to define different seasons. 1999 is the earliest available season.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one dataframe
+            per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+
+    Yields:
+        pl.DataFrame: Polars dataframe containing one season or row group of the play-by-plays.
+
+    Raises:
+        ValueError: If `season` is less than 1999.
+    """
+    return iter_seasons(
+        NFL_BASE_URL,
+        seasons,
+        min_season=1999,
+        batch=batch,
+        columns=columns,
+        filters=filters,
+        return_as_pandas=return_as_pandas,
+    )
+
+
+def _convert_nfl_schedule_rds(rds_path, parquet_path):
+    pl.DataFrame(read_r(rds_path)[None]).write_parquet(parquet_path)
 
 
-def load_nfl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def _read_nfl_schedule(schedule_url, columns=None, filters=None):
+    # Convert each season's RDS file to parquet once, so warm loads skip pyreadr entirely
+    parquet_path = cached_derived_path(schedule_url, "parquet", _convert_nfl_schedule_rds)
+    if parquet_path is not None:
+        return read_parquet_url(parquet_path, columns=columns, filters=filters)
+    with tempfile.TemporaryDirectory() as tempdirname:
+        rds_path = os.path.join(tempdirname, os.path.basename(schedule_url))
+        data = pl.DataFrame(read_r(download_file(schedule_url, rds_path))[None])
+    return select_and_filter(data, columns=columns, filters=filters)
+
+
+def load_nfl_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL schedule data
 
     Example:
@@ -72,6 +166,14 @@ def load_nfl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 1999 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to keep. If None, all columns are kept.
+        filters (dict or list): Row filters, e.g. `{"week": [1, 2], "season_type": "REG"}`
+            or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            over the loaded data. Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -79,21 +181,23 @@ def load_nfl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 1999.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    with tempfile.TemporaryDirectory() as tempdirname:
-        for i in tqdm(seasons):
-            season_not_found_error(int(i), 1999)
-            schedule_url = NFL_TEAM_SCHEDULE_URL.format(season=i)
-            # i_data = pd.read_parquet(NFL_TEAM_SCHEDULE_URL.format(season = i), engine='auto', columns=None)
-            i_data = read_r(download_file(schedule_url, f"{tempdirname}/nfl_sched_{i}.rds"))[None]
-            i_data = pl.DataFrame(i_data)
-            data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=1999,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+        reader=_read_nfl_schedule,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_player_stats(kicking=False, return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_player_stats(
+    kicking=False, return_as_pandas=False, columns=None, filters=None, return_as=None
+) -> pl.DataFrame:
     """Load NFL player stats data
 
     Example:
@@ -102,24 +206,36 @@ def load_nfl_player_stats(kicking=False, return_as_pandas=False) -> pl.DataFrame
     Args:
         kicking (bool): If True, load kicking stats. If False, load all other stats.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing player stats.
     """
     data = pl.DataFrame()
     if kicking is False:
-        data = pl.read_parquet(NFL_PLAYER_STATS_URL, use_pyarrow=True, columns=None)
+        data = load_file(NFL_PLAYER_STATS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
     else:
-        data = pl.read_parquet(NFL_PLAYER_KICKING_STATS_URL, use_pyarrow=True, columns=None)
+        data = load_file(NFL_PLAYER_KICKING_STATS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
 
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_ngs_passing(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_ngs_passing(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL NextGen Stats Passing data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_passing()`
@@ -128,20 +244,21 @@ def load_nfl_ngs_passing(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Passing data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_PASSING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_PASSING_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_NGS_PASSING_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_ngs_rushing(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_ngs_rushing(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL NextGen Stats Rushing data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_rushing()`
@@ -150,20 +267,21 @@ def load_nfl_ngs_rushing(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Rushing data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_RUSHING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_RUSHING_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_NGS_RUSHING_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_ngs_receiving(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_ngs_receiving(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL NextGen Stats Receiving data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_receiving()`
@@ -172,20 +290,21 @@ def load_nfl_ngs_receiving(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Receiving data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_RECEIVING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_RECEIVING_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_NGS_RECEIVING_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_pfr_pass(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_pfr_pass(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Advanced Passing data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_pfr_pass()`
@@ -195,16 +314,19 @@ def load_nfl_pfr_pass(return_as_pandas=False) -> pl.DataFrame:
             advanced passing stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_PASS_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_PASS_URL, use_pyarrow=True, columns=None)
-    )
-
-
-def load_nfl_pfr_weekly_pass(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_file(NFL_PFR_SEASON_PASS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_pfr_weekly_pass(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Weekly Advanced Passing data going back to 2018
 
     Example:
@@ -213,27 +335,45 @@ def load_nfl_pfr_weekly_pass(seasons: List[int], return_as_pandas=False) -> pl.D
     Args:
         seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
             advanced passing stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_PASS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_PFR_WEEK_PASS_URL,
+        seasons,
+        min_season=2018,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_pfr_rush(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_pfr_rush(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Advanced Rushing data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rush()`
@@ -243,16 +383,19 @@ def load_nfl_pfr_rush(return_as_pandas=False) -> pl.DataFrame:
             advanced rushing stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_RUSH_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_RUSH_URL, use_pyarrow=True, columns=None)
-    )
-
-
-def load_nfl_pfr_weekly_rush(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_file(NFL_PFR_SEASON_RUSH_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_pfr_weekly_rush(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Weekly Advanced Rushing data going back to 2018
 
     Example:
@@ -261,27 +404,45 @@ def load_nfl_pfr_weekly_rush(seasons: List[int], return_as_pandas=False) -> pl.D
     Args:
         seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
             advanced rushing stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_RUSH_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_PFR_WEEK_RUSH_URL,
+        seasons,
+        min_season=2018,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_pfr_rec(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_pfr_rec(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Advanced Receiving data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rec()`
@@ -291,16 +452,19 @@ def load_nfl_pfr_rec(return_as_pandas=False) -> pl.DataFrame:
             advanced receiving stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_REC_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_REC_URL, use_pyarrow=True, columns=None)
-    )
-
-
-def load_nfl_pfr_weekly_rec(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_file(NFL_PFR_SEASON_REC_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_pfr_weekly_rec(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Weekly Advanced Receiving data going back to 2018
 
     Example:
@@ -309,27 +473,45 @@ def load_nfl_pfr_weekly_rec(seasons: List[int], return_as_pandas=False) -> pl.Da
     Args:
         seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
             advanced receiving stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_REC_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_PFR_WEEK_REC_URL,
+        seasons,
+        min_season=2018,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_pfr_def(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_pfr_def(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Advanced Defensive data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_pfr_def()`
@@ -339,16 +521,19 @@ def load_nfl_pfr_def(return_as_pandas=False) -> pl.DataFrame:
             advanced defensive stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_DEF_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_DEF_URL, use_pyarrow=True, columns=None)
-    )
-
-
-def load_nfl_pfr_weekly_def(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_file(NFL_PFR_SEASON_DEF_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_pfr_weekly_def(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Weekly Advanced Defensive data going back to 2018
 
     Example:
@@ -357,23 +542,43 @@ def load_nfl_pfr_weekly_def(seasons: List[int], return_as_pandas=False) -> pl.Da
     Args:
         seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
             advanced defensive stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_DEF_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NFL_PFR_WEEK_DEF_URL,
+        seasons,
+        min_season=2018,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL roster data for all seasons
 
     Example:
@@ -382,22 +587,42 @@ def load_nfl_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame
     Args:
         seasons (list): Used to define different seasons. 1920 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing rosters available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 1920)
-        i_data = pl.read_parquet(NFL_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_weekly_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NFL_ROSTER_URL,
+        seasons,
+        min_season=1920,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_weekly_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL weekly roster data for selected seasons
 
     Example:
@@ -406,22 +631,34 @@ def load_nfl_weekly_rosters(seasons: List[int], return_as_pandas=False) -> pl.Da
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing weekly rosters available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2002)
-        i_data = pl.read_parquet(NFL_WEEKLY_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_WEEKLY_ROSTER_URL,
+        seasons,
+        min_season=2002,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_teams(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_teams(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL team ID information and logos
 
     Example:
@@ -429,18 +666,20 @@ def load_nfl_teams(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to keep. If None, all columns are kept.
+        filters (dict or list): Row filters, e.g. `{"team_conf": "AFC"}` or a list of
+            `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            over the loaded data. Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing teams available.
     """
-    return (
-        pl.read_csv(NFL_TEAM_LOGO_URL).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_csv(NFL_TEAM_LOGO_URL)
-    )
+    data = select_and_filter(pl.read_csv(NFL_TEAM_LOGO_URL), columns=columns, filters=filters)
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_players(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_players(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Player ID information
 
     Example:
@@ -448,18 +687,29 @@ def load_nfl_players(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, as a dict of
+            `{column: value}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing players available.
     """
-    return (
-        pl.read_parquet(NFL_PLAYER_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None)
-    )
-
-
-def load_nfl_snap_counts(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_file(NFL_PLAYER_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_snap_counts(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL snap counts data for selected seasons
 
     Example:
@@ -468,22 +718,42 @@ def load_nfl_snap_counts(seasons: List[int], return_as_pandas=False) -> pl.DataF
     Args:
         seasons (list): Used to define different seasons. 2012 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing snap counts available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2012)
-        i_data = pl.read_parquet(NFL_SNAP_COUNTS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_pbp_participation(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NFL_SNAP_COUNTS_URL,
+        seasons,
+        min_season=2012,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_pbp_participation(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL play-by-play participation data for selected seasons
 
     Example:
@@ -492,22 +762,42 @@ def load_nfl_pbp_participation(seasons: List[int], return_as_pandas=False) -> pl
     Args:
         seasons (list): Used to define different seasons. 2016 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing play-by-play participation data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2016)
-        i_data = pl.read_parquet(NFL_PBP_PARTICIPATION_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_injuries(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NFL_PBP_PARTICIPATION_URL,
+        seasons,
+        min_season=2016,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_injuries(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL injuries data for selected seasons
 
     Example:
@@ -516,22 +806,42 @@ def load_nfl_injuries(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2009 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing injuries data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2009)
-        i_data = pl.read_parquet(NFL_INJURIES_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_depth_charts(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NFL_INJURIES_URL,
+        seasons,
+        min_season=2009,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nfl_depth_charts(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NFL Depth Chart data for selected seasons
 
     Example:
@@ -540,22 +850,34 @@ def load_nfl_depth_charts(seasons: List[int], return_as_pandas=False) -> pl.Data
     Args:
         seasons (list): Used to define different seasons. 2001 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"week": [1, 2], "season_type": "REG"}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing depth chart data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2001)
-        i_data = pl.read_parquet(NFL_DEPTH_CHARTS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_DEPTH_CHARTS_URL,
+        seasons,
+        min_season=2001,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_contracts(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_contracts(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Historical contracts information
 
     Example:
@@ -563,18 +885,21 @@ def load_nfl_contracts(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing historical contracts available.
     """
-    return (
-        pl.read_parquet(NFL_CONTRACTS_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_CONTRACTS_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_CONTRACTS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_combine(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_combine(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Combine information
 
     Example:
@@ -582,18 +907,21 @@ def load_nfl_combine(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing NFL combine data available.
     """
-    return (
-        pl.read_parquet(NFL_COMBINE_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_COMBINE_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_COMBINE_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_draft_picks(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_draft_picks(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Draft picks information
 
     Example:
@@ -601,20 +929,21 @@ def load_nfl_draft_picks(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season": [2021, 2022]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing NFL Draft picks data available.
     """
-    return (
-        pl.read_parquet(NFL_DRAFT_PICKS_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_DRAFT_PICKS_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_DRAFT_PICKS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
-def load_nfl_officials(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_officials(return_as_pandas=False, columns=None, filters=None, return_as=None) -> pl.DataFrame:
     """Load NFL Officials information
 
     Example:
@@ -622,15 +951,18 @@ def load_nfl_officials(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, as a dict of
+            `{column: value}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing officials available.
     """
-    return (
-        pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None)
-    )
+    data = load_file(NFL_OFFICIALS_URL, columns=columns, filters=filters, lazy=return_as == "lazy")
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
 
 
 ## Currently removed due to unsupported features of pyreadr's method.
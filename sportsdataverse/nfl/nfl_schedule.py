@@ -3,7 +3,7 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import download, run_async
 
 
 def espn_nfl_schedule(
@@ -62,6 +62,27 @@ def espn_nfl_schedule(
     return ev.to_pandas() if return_as_pandas else ev
 
 
+async def aespn_nfl_schedule(
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, **kwargs
+) -> pl.DataFrame:
+    """aespn_nfl_schedule() - Coroutine version of `espn_nfl_schedule()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `nfl_df = await sportsdataverse.nfl.aespn_nfl_schedule(dates=2023)`
+    """
+    return await run_async(
+        espn_nfl_schedule,
+        dates=dates,
+        week=week,
+        season_type=season_type,
+        groups=groups,
+        limit=limit,
+        return_as_pandas=return_as_pandas,
+        **kwargs,
+    )
+
+
 def scoreboard_event_parsing(event):
     event.get("competitions")[0].get("competitors")[0].get("team").pop("links", None)
     event.get("competitions")[0].get("competitors")[1].get("team").pop("links", None)
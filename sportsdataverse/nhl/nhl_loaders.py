@@ -1,7 +1,6 @@
-from typing import List
+from typing import Iterator, List
 
 import polars as pl
-from tqdm import tqdm
 
 from sportsdataverse.config import (
     NHL_BASE_URL,
@@ -10,10 +9,18 @@ from sportsdataverse.config import (
     NHL_TEAM_LOGO_URL,
     NHL_TEAM_SCHEDULE_URL,
 )
-from sportsdataverse.errors import SeasonNotFoundError
+from sportsdataverse.loader_utils import as_return_type, iter_seasons, load_seasons
 
 
-def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nhl_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NHL play by play data going back to 2011
 
     Example:
@@ -22,6 +29,15 @@ def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
@@ -29,18 +45,65 @@ def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NHL_BASE_URL,
+        seasons,
+        min_season=2011,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def iter_nhl_pbp(
+    seasons: List[int], batch="season", columns=None, filters=None, return_as_pandas=False
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL play by play data going back to 2011, one batch at a time
+
+    Only one season is held in memory at a time while the next season's file is
+    downloaded in the background.
+
+    Example:
+        `for nhl_df in sportsdataverse.nhl.iter_nhl_pbp(seasons=range(2011,2021)):`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one dataframe
+            per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+
+    Yields:
+        pl.DataFrame: Polars dataframe containing one season or row group of the play-by-plays.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return iter_seasons(
+        NHL_BASE_URL,
+        seasons,
+        min_season=2011,
+        batch=batch,
+        columns=columns,
+        filters=filters,
+        return_as_pandas=return_as_pandas,
+    )
+
+
+def load_nhl_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NHL schedule data
 
     Example:
@@ -49,6 +112,15 @@ def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -56,18 +128,28 @@ def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NHL_TEAM_SCHEDULE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NHL_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=2002,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def load_nhl_team_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NHL team boxscore data
 
     Example:
@@ -76,6 +158,15 @@ def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -84,18 +175,65 @@ def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_TEAM_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        NHL_TEAM_BOX_URL,
+        seasons,
+        min_season=2011,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def iter_nhl_team_boxscore(
+    seasons: List[int], batch="season", columns=None, filters=None, return_as_pandas=False
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL team boxscore data, one batch at a time
+
+    Only one season is held in memory at a time while the next season's file is
+    downloaded in the background.
+
+    Example:
+        `for nhl_df in sportsdataverse.nhl.iter_nhl_team_boxscore(seasons=range(2011,2022)):`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one dataframe
+            per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+
+    Yields:
+        pl.DataFrame: Polars dataframe containing one season or row group of the team boxscores.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return iter_seasons(
+        NHL_TEAM_BOX_URL,
+        seasons,
+        min_season=2011,
+        batch=batch,
+        columns=columns,
+        filters=filters,
+        return_as_pandas=return_as_pandas,
+    )
+
+
+def load_nhl_player_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    columns=None,
+    filters=None,
+    return_as=None,
+    max_workers=None,
+    to_partitioned=None,
+) -> pl.DataFrame:
     """Load NHL player boxscore data
 
     Example:
@@ -104,6 +242,15 @@ def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as (str): One of "polars", "pandas" or "lazy". "lazy" returns a `pl.LazyFrame`
+            scanning the files from the dataset cache, or read eagerly if the cache is off (see
+            `dataset_cache.set_dataset_cache()`). Takes precedence over `return_as_pandas`.
+        max_workers (int): Maximum number of seasons to download in parallel.
+        to_partitioned (str): If given, the data is also written to this directory as a hive-partitioned
+            parquet dataset (see `sportsdataverse.loader_utils.export_dataset()`).
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -112,15 +259,54 @@ def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_PLAYER_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NHL_PLAYER_BOX_URL,
+        seasons,
+        min_season=2011,
+        columns=columns,
+        filters=filters,
+        lazy=return_as == "lazy",
+        max_workers=max_workers,
+        to_partitioned=to_partitioned,
+    )
+    return as_return_type(data, return_as=return_as, return_as_pandas=return_as_pandas)
+
+
+def iter_nhl_player_boxscore(
+    seasons: List[int], batch="season", columns=None, filters=None, return_as_pandas=False
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL player boxscore data, one batch at a time
+
+    Only one season is held in memory at a time while the next season's file is
+    downloaded in the background.
+
+    Example:
+        `for nhl_df in sportsdataverse.nhl.iter_nhl_player_boxscore(seasons=range(2011,2022)):`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        batch (str): "season" yields one dataframe per season, "row_group" yields one dataframe
+            per parquet row group.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (dict or list): Row filters pushed down into the parquet reader, e.g.
+            `{"season_type": [2, 3]}` or a list of `(column, op, value)` tuples.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+
+    Yields:
+        pl.DataFrame: Polars dataframe containing one season or row group of the player boxscores.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return iter_seasons(
+        NHL_PLAYER_BOX_URL,
+        seasons,
+        min_season=2011,
+        batch=batch,
+        columns=columns,
+        filters=filters,
+        return_as_pandas=return_as_pandas,
+    )
 
 
 def nhl_teams(return_as_pandas=False) -> pl.DataFrame:
@@ -0,0 +1,195 @@
+import polars as pl
+
+TEXT_TOKENS_COLUMN = "text_tokens"
+
+# Patterns searched for in the lowercased play text. Each one is matched once per play by
+# `play_text_tokens()`, and the processing stages read the result with `text_has(pattern)`.
+TEXT_FLAGS = (
+    "touchdown|for a td",
+    "touchdown",
+    "safety",
+    "fumble",
+    "forced by",
+    "touchback",
+    "kickoff$",
+    "on-side|onside|on side",
+    "out-of-bounds|out of bounds",
+    "fair catch|fair caught",
+    "downed",
+    "kick|kickoff",
+    "kickoff",
+    "punt",
+    "blocked",
+    "sacked",
+    "for a td",
+    "pass intercepted for a td",
+    "fumbled",
+    "td",
+    "pass complete",
+    "pass incomplete",
+    "pass intercepted",
+    "two-point",
+    "penalty",
+    "declined",
+    "no play",
+    "off-setting",
+    "1st down",
+    "roughing passer",
+    "offensive holding",
+    "pass interference",
+    "encroachment",
+    "defensive pass interference",
+    "offensive pass interference",
+    "illegal procedure",
+    "defensive holding",
+    "holding",
+    "offensive offside|offside offense",
+    "defensive offside|offside defense",
+    "offside",
+    "illegal fair catch signal",
+    "illegal batting",
+    "neutral zone infraction",
+    "ineligible downfield",
+    "illegal use of hands",
+    "kickoff out of bounds|kickoff out-of-bounds",
+    "12 men on the field",
+    "illegal block",
+    "personal foul",
+    "false start",
+    "substitution infraction",
+    "illegal formation",
+    "illegal touching",
+    "sideline interference",
+    "clipping",
+    "sideline infraction",
+    "crackback",
+    "illegal snap",
+    "illegal helmet contact",
+    "roughing holder",
+    "horse collar tackle",
+    "illegal participation",
+    "tripping",
+    "illegal shift",
+    "illegal motion",
+    "roughing the kicker",
+    "delay of game",
+    "targeting",
+    "face mask",
+    "illegal forward pass",
+    "intentional grounding",
+    "illegal kicking",
+    "illegal conduct",
+    "kick catching interference",
+    "kick catch interference",
+    "unnecessary roughness",
+    "penalty, ur",
+    "roughing the snapper",
+    "illegal blindside block",
+    "unsportsmanlike conduct",
+    "running into kicker",
+    "failure to wear required equipment",
+    "player disqualification",
+    r"ards\)",
+    "broken up by",
+    "field goal",
+    "run for no gain",
+    "for no gain",
+    "run for a loss of",
+    "rush for a loss of",
+    "run for",
+    "rush for",
+    "yd run",
+    "yd rush",
+    "yard rush",
+    "rushed",
+    "complete to",
+    "for a loss of",
+    "incomplete| sacked|intercepted|pass defensed",
+    "incompletion",
+    "yd pass",
+    "yd interception return",
+    "for no gain|fair catch|fair caught",
+    "returned by",
+    "return for",
+    "no return|no gain",
+    r"returned \d+ yards",
+    "yd td pass",
+    "return",
+    "blocked by|missed",
+    "recovered by",
+)
+
+# Patterns whose first capture holds a yardage, read with `text_yards(pattern)`. The first run of
+# digits in the capture is returned as an Int32.
+TEXT_YARDAGES = (
+    r"(punt for \d+)",
+    r"run for a loss of (\d+)",
+    r"rush for a loss of (\d+)",
+    r"run for (\d+)",
+    r"rush for (\d+)",
+    r"(\d+) yd run",
+    r"(\d+) yd rush",
+    r"(\d+) yard rush",
+    r"for (\d+) yards",
+    r"for a (\d+) yard",
+    r"for a loss of (\d+)",
+    r"for (\d+)",
+    r"(\d+) yd pass",
+    "(.+)yd interception return",
+    "return for (.+)",
+    "kickoff for (.+)",
+    "returned by (.+)",
+    "punt for (.+)",
+    "returned (.+)",
+    "returns for (.+)",
+    "sacked (.+)",
+)
+
+_FLAGS = frozenset(TEXT_FLAGS)
+_YARDAGES = frozenset(TEXT_YARDAGES)
+
+
+def play_text_tokens(text: pl.Expr) -> pl.Expr:
+    """Return a struct holding every `TEXT_FLAGS` match and `TEXT_YARDAGES` yardage of a lowercased play text
+
+    Example:
+        ```
+        play_df.with_columns(text_lower=pl.col("text").str.to_lowercase())
+            .with_columns(play_text_tokens(pl.col("text_lower")))
+            .drop("text_lower")
+        ```
+
+    Args:
+        text (pl.Expr): The play text, already lowercased.
+
+    Returns:
+        pl.Expr: A struct column named `TEXT_TOKENS_COLUMN`.
+    """
+    flags = [text.str.contains(pattern).alias(f"has:{pattern}") for pattern in TEXT_FLAGS]
+    yards = [
+        text.str.extract(pattern, 1).str.extract(r"(\d+)", 1).cast(pl.Int32).alias(f"yds:{pattern}")
+        for pattern in TEXT_YARDAGES
+    ]
+    return pl.struct(flags + yards).alias(TEXT_TOKENS_COLUMN)
+
+
+def text_has(pattern: str) -> pl.Expr:
+    """Return whether the play text matches `pattern`, case-insensitively
+
+    Same result as `pl.col("text").str.contains("(?i)" + pattern)`, read from the tokens computed
+    by `play_text_tokens()`. `pattern` must be one of `TEXT_FLAGS`, in lowercase.
+    """
+    if pattern not in _FLAGS:
+        raise KeyError(f"{pattern!r} is not in TEXT_FLAGS")
+    return pl.col(TEXT_TOKENS_COLUMN).struct.field(f"has:{pattern}")
+
+
+def text_yards(pattern: str) -> pl.Expr:
+    r"""Return the yardage captured by `pattern` in the play text, case-insensitively
+
+    Same result as `pl.col("text").str.extract("(?i)" + pattern).str.extract(r"(\d+)").cast(pl.Int32)`,
+    read from the tokens computed by `play_text_tokens()`. `pattern` must be one of `TEXT_YARDAGES`.
+    """
+    if pattern not in _YARDAGES:
+        raise KeyError(f"{pattern!r} is not in TEXT_YARDAGES")
+    return pl.col(TEXT_TOKENS_COLUMN).struct.field(f"yds:{pattern}")
@@ -0,0 +1,218 @@
+import glob
+import importlib
+import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import polars as pl
+from tqdm import tqdm
+
+from sportsdataverse.dl_utils import stack_frames
+
+logger = logging.getLogger("sdv.rebuild")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_MAX_WORKERS = max((os.cpu_count() or 2) - 1, 1)
+DEFAULT_CHUNK_SIZE = 25
+CHECKPOINT_FILE = "_completed_games.txt"
+
+# Sport -> (module, play processor class). Imported lazily so the parent process does not load the models.
+PROCESSORS = {
+    "cfb": ("sportsdataverse.cfb.cfb_pbp", "CFBPlayProcess"),
+    "nfl": ("sportsdataverse.nfl.nfl_pbp", "NFLPlayProcess"),
+}
+BOX_SCORE_TABLES = ["pass", "rush", "receiver", "team", "situational", "defensive", "turnover", "drives"]
+
+
+def list_game_ids(json_dir: str) -> List[int]:
+    """Return the game ids of the `{gameId}.json` files in `json_dir`, in ascending order"""
+    stems = (os.path.splitext(name) for name in os.listdir(json_dir))
+    return sorted(int(stem) for stem, ext in stems if ext == ".json" and stem.isdigit())
+
+
+def read_checkpoint(output_dir: str) -> set:
+    """Return the game ids a previous `rebuild_season()` run into `output_dir` completed"""
+    path = os.path.join(output_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {int(line) for line in f if line.strip()}
+
+
+def _write_checkpoint(output_dir, game_ids):
+    with open(os.path.join(output_dir, CHECKPOINT_FILE), "a") as f:
+        f.writelines(f"{game_id}\n" for game_id in game_ids)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _write_parquet(frame, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        frame.write_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _process_games(processor, sport, json_dir, game_ids):
+    """Process a chunk of games in one batch, falling back to one game at a time if the batch fails
+
+    Games `process_many()` hands back unprocessed (corrupt or without play-by-play) are reported
+    as failed, so they are neither written nor checkpointed.
+    """
+    summaries = {}
+    failed = {}
+    for game_id in game_ids:
+        try:
+            summaries[game_id] = getattr(processor(gameId=game_id, path_to_json=json_dir), f"{sport}_pbp_disk")()
+        except Exception as e:
+            failed[game_id] = f"{type(e).__name__}: {e}"
+    return_keys = ["gameId", "plays", "advBoxScore"]
+    processed = {}
+    try:
+        processed = dict(zip(summaries, processor.process_many(list(summaries.values()), return_keys=return_keys)))
+    except Exception:
+        logger.warning("Batch of %s games failed, processing them one at a time", len(summaries), exc_info=True)
+        for game_id, summary in summaries.items():
+            try:
+                processed[game_id] = processor.process_many([summary], return_keys=return_keys)[0]
+            except Exception as e:
+                failed[game_id] = f"{type(e).__name__}: {e}"
+    for game_id in [game_id for game_id, game in processed.items() if game.get("advBoxScore") is None]:
+        del processed[game_id]
+        failed[game_id] = "NotProcessed: the play-by-play is corrupt or missing"
+    return processed, failed
+
+
+def _write_game(game_id, game, output_dir):
+    """Write the plays and box score tables of one processed game, replacing any earlier copy"""
+    part = f"part-{game_id}.parquet"
+    tables = {os.path.join(output_dir, "plays", part): game.get("plays")}
+    for table in BOX_SCORE_TABLES:
+        tables[os.path.join(output_dir, "box_score", table, part)] = game["advBoxScore"].get(table)
+    for path, rows in tables.items():
+        if rows:
+            frame = pl.from_dicts(rows, infer_schema_length=None)
+            if "game_id" not in frame.columns:
+                frame = frame.with_columns(game_id=pl.lit(game_id, dtype=pl.Int64))
+            _write_parquet(frame, path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def _rebuild_chunk(sport, processor_spec, json_dir, output_dir, game_ids):
+    """Worker: process and write `game_ids`, returning the completed ids and the errors of the others
+
+    Errors are returned as strings, since polars' exceptions cannot be pickled back to the parent.
+    """
+    module, name = processor_spec
+    processor = getattr(importlib.import_module(module), name)
+    processed, failed = _process_games(processor, sport, json_dir, game_ids)
+    completed = []
+    for game_id, game in processed.items():
+        try:
+            _write_game(game_id, game, output_dir)
+            completed.append(game_id)
+        except Exception as e:
+            logger.warning("Writing game %s failed", game_id, exc_info=True)
+            failed[game_id] = f"{type(e).__name__}: {e}"
+    return completed, failed
+
+
+def rebuild_season(
+    json_dir: str,
+    output_dir: str,
+    sport: str = "cfb",
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    game_ids: Optional[List[int]] = None,
+) -> Dict[str, object]:
+    """Reprocess a season of archived ESPN summaries on a process pool and write the results to parquet
+
+    Every `{gameId}.json` file in `json_dir` is read as `cfb_pbp_disk()`/`nfl_pbp_disk()` would
+    read it. The games are split into chunks of `chunk_size`, and each worker runs
+    `process_many()` on one chunk at a time. Each game's processed plays are written to
+    `output_dir/plays/part-<game id>.parquet` and each of its advanced box score tables to
+    `output_dir/box_score/<table>/part-<game id>.parquet`, with a `game_id` column.
+    Column types can differ between parts, so read them back with `read_rebuilt()`.
+
+    The ids of the games in each finished chunk are appended to `output_dir/_completed_games.txt`.
+    Running again with the same `output_dir` skips them, so an interrupted rebuild picks up where it
+    stopped. Games that fail, including games whose play-by-play is corrupt or missing, are logged,
+    reported and left out of the checkpoint, so the next run retries them. A game processed again
+    replaces its own files, so resuming never duplicates rows.
+
+    Example:
+        `sportsdataverse.rebuild.rebuild_season("/data/cfb/json/2022", "/data/cfb/processed/2022", max_workers=8)`
+
+    Args:
+        json_dir (str): Directory of `{gameId}.json` summaries.
+        output_dir (str): Directory the parquet files and the checkpoint are written to.
+        sport (str): `"cfb"` or `"nfl"`.
+        max_workers (int): Number of worker processes.
+        chunk_size (int): Number of games each worker processes in one batch.
+        game_ids (list): Game ids to rebuild. Defaults to every summary in `json_dir`.
+
+    Returns:
+        dict: `completed` (game ids processed by this run), `skipped` (game ids already in the
+        checkpoint) and `failed` (game id -> error message).
+    """
+    if sport not in PROCESSORS:
+        raise ValueError(f"Unknown sport {sport!r}, expected one of: {', '.join(sorted(PROCESSORS))}")
+    os.makedirs(output_dir, exist_ok=True)
+    game_ids = sorted(int(game_id) for game_id in game_ids) if game_ids is not None else list_game_ids(json_dir)
+    done = read_checkpoint(output_dir)
+    todo = [game_id for game_id in game_ids if game_id not in done]
+    chunks = [todo[i : i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    result = {"completed": [], "skipped": [game_id for game_id in game_ids if game_id in done], "failed": {}}
+    if not chunks:
+        return result
+
+    # polars' thread pool does not survive fork(), so the workers are started fresh
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = {
+            executor.submit(_rebuild_chunk, sport, PROCESSORS[sport], json_dir, output_dir, chunk): chunk
+            for chunk in chunks
+        }
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            try:
+                completed, failed = future.result()
+            except Exception as e:
+                failed = {game_id: f"{type(e).__name__}: {e}" for game_id in futures[future]}
+                completed = []
+            _write_checkpoint(output_dir, completed)
+            result["completed"].extend(completed)
+            result["failed"].update(failed)
+            for game_id, error in failed.items():
+                logger.warning("Game %s failed: %s", game_id, error)
+    result["completed"].sort()
+    return result
+
+
+def read_rebuilt(output_dir: str, table: str = "plays", return_as_pandas=False) -> pl.DataFrame:
+    """Read one table written by `rebuild_season()`, combining its parts with `dl_utils.stack_frames()`
+
+    Example:
+        `plays = sportsdataverse.rebuild.read_rebuilt("/data/cfb/processed/2022")`
+
+    Args:
+        output_dir (str): The `output_dir` given to `rebuild_season()`.
+        table (str): `"plays"` or one of the box score tables: `"pass"`, `"rush"`, `"receiver"`,
+            `"team"`, `"situational"`, `"defensive"`, `"turnover"`, `"drives"`.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+
+    Returns:
+        pl.DataFrame: The rows of every part.
+    """
+    if table != "plays" and table not in BOX_SCORE_TABLES:
+        raise ValueError(f"Unknown table {table!r}, expected plays or one of: {', '.join(BOX_SCORE_TABLES)}")
+    directory = os.path.join(output_dir, "plays") if table == "plays" else os.path.join(output_dir, "box_score", table)
+    paths = sorted(glob.glob(os.path.join(directory, "part-*.parquet")))
+    data = stack_frames([pl.read_parquet(path) for path in paths]) if paths else pl.DataFrame()
+    return data.to_pandas() if return_as_pandas else data
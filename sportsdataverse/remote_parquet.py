@@ -0,0 +1,135 @@
+import io
+import logging
+import os
+import threading
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from sportsdataverse.dl_utils import get_session
+
+logger = logging.getLogger("sdv.remote_parquet")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_READAHEAD = 64 * 1024
+
+
+class RangeRequestsNotSupported(ValueError):
+    pass
+
+
+def range_reads_enabled() -> bool:
+    """Return False if byte-range reads are turned off with `SDV_RANGE_READS=0`"""
+    return os.environ.get("SDV_RANGE_READS", "1").lower() not in ("0", "false", "no")
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """Read-only, seekable file over a remote object, fetched with HTTP Range requests
+
+    Every read that is not already covered by a previously fetched range is turned into one
+    Range request for exactly the bytes asked for (at least `readahead` bytes, so the many
+    small reads of the parquet footer share a request). Only the footer and the column
+    chunks pyarrow asks for are transferred.
+
+    Args:
+        url (str): Location of the remote file. Redirects are resolved once up front.
+        session (requests.Session): Session to issue the requests with. Defaults to the shared
+            `dl_utils.get_session()` pool.
+        readahead (int): Minimum number of bytes fetched per request.
+        timeout (int): Timeout in seconds for each request.
+    """
+
+    def __init__(self, url: str, session=None, readahead=DEFAULT_READAHEAD, timeout=60):
+        super().__init__()
+        self.session = session or get_session()
+        self.readahead = readahead
+        self.timeout = timeout
+        response = self.session.head(url, allow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes" or "Content-Length" not in response.headers:
+            raise RangeRequestsNotSupported(f"{url} does not support byte-range requests")
+        self.url = response.url
+        self.size = int(response.headers["Content-Length"])
+        self.bytes_fetched = 0
+        self._ranges = []
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self._position
+
+    def readinto(self, buffer):
+        data = self._read_range(self._position, len(buffer))
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._position
+        data = self._read_range(self._position, size)
+        self._position += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def _read_range(self, start, length):
+        end = min(start + length, self.size)
+        if start >= end:
+            return b""
+        with self._lock:
+            for range_start, body in self._ranges:
+                if range_start <= start and end <= range_start + len(body):
+                    return body[start - range_start : end - range_start]
+            body = self._fetch(start, min(max(end, start + self.readahead), self.size))
+            self._ranges.append((start, body))
+        return body[: end - start]
+
+    def _fetch(self, start, end):
+        response = self.session.get(self.url, headers={"Range": f"bytes={start}-{end - 1}"}, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.content
+        self.bytes_fetched += len(body)
+        if response.status_code != 206:
+            # The server ignored the range and sent the whole object, so keep all of it
+            self._ranges.append((0, body))
+            return body[start:end]
+        return body
+
+
+def read_parquet_range(url: str, columns=None, filters=None) -> pl.DataFrame:
+    """Read the requested columns and row groups of a remote parquet file with byte-range requests
+
+    The footer is read first; pyarrow then fetches only the column chunks of the projected
+    columns, skipping row groups whose statistics cannot match `filters`.
+
+    Args:
+        url (str): Location of the parquet file.
+        columns (list): Columns to read. If None, all columns are read.
+        filters (list): Filters as `(column, op, value)` tuples (see `loader_utils.normalize_filters()`).
+
+    Returns:
+        pl.DataFrame: Polars dataframe with the requested data.
+    """
+    with HTTPRangeFile(url) as f:
+        table = pq.read_table(f, columns=columns, filters=filters)
+        logger.debug("Read %s of %s bytes from %s", f.bytes_fetched, f.size, url)
+    return pl.from_arrow(table)
@@ -0,0 +1,211 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger("sdv.response_cache")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sportsdataverse", "responses")
+DEFAULT_TTL = 60
+
+# Query parameters that only exist to defeat upstream caches
+_CACHE_BUSTER_PARAMS = {"cache_buster", "_"}
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Top-level keys `game_completed()` reads
+COMPLETION_KEYS = ("header", "status", "events")
+
+
+def cache_key(url: str, params=None) -> str:
+    """Return the cache key of a request: its URL and parameters, sorted, without cache busters
+
+    ESPN endpoints are often called with a bare millisecond timestamp appended to the query
+    string (`...summary?event=401520281&1697654321000`). Such parameters, and parameters named
+    `cache_buster` or `_`, are dropped so every call for the same resource shares one entry.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if isinstance(params, dict):
+        query += [(k, v) for k, v in params.items() if v is not None]
+    elif params:
+        query += [(k, v) for k, v in params if v is not None]
+    query = sorted((str(k), str(v)) for k, v in query if not _is_cache_buster(str(k), str(v)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def _is_cache_buster(key, value):
+    return key in _CACHE_BUSTER_PARAMS or (key.isdigit() and value == "")
+
+
+def game_completed(body) -> bool:
+    """Return True if an ESPN payload describes only games that are final (`status.type.completed`)
+
+    Understands summary payloads (`header.competitions[0].status`), event and competition
+    payloads (`status`) and scoreboards (`events[*].status`). Anything else counts as not completed.
+    """
+    if not isinstance(body, dict):
+        return False
+    if isinstance(body.get("header"), dict):
+        competitions = body["header"].get("competitions") or [{}]
+        return _status_completed(competitions[0].get("status"))
+    if "status" in body:
+        return _status_completed(body.get("status"))
+    events = body.get("events")
+    if isinstance(events, list) and events:
+        return all(_status_completed(event.get("status")) for event in events)
+    return False
+
+
+def _status_completed(status):
+    return isinstance(status, dict) and bool((status.get("type") or {}).get("completed"))
+
+
+class ResponseCache:
+    """Disk-backed cache of ESPN API responses, stored gzip-compressed
+
+    Responses for games that are final are kept indefinitely; everything else (live and
+    scheduled games, scoreboards with unfinished games, non-JSON bodies) expires after `ttl`
+    seconds.
+
+    Args:
+        cache_dir (str): Directory holding the cached responses.
+        ttl (float): Lifetime in seconds of responses for games that are not final.
+        enabled (bool): If False, `download()` never reads or writes the cache.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_TTL, enabled=True):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.ttl = float(ttl)
+        self.enabled = enabled
+
+    def path_for(self, key: str) -> str:
+        """Return the path of the compressed body stored under `key`"""
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.gz")
+
+    def get(self, url: str, params=None):
+        """Return the cached `requests.Response` for a request, or None on a miss or expired entry"""
+        path = self.path_for(cache_key(url, params))
+        meta = self._read_meta(path)
+        if meta is None:
+            return None
+        if meta["expires_at"] is not None and meta["expires_at"] < time.time():
+            return None
+        try:
+            with gzip.open(path, "rb") as f:
+                content = f.read()
+        except (OSError, EOFError):
+            return None
+        if hashlib.sha256(content).hexdigest() != meta.get("sha256"):
+            # The body was replaced by a concurrent put() after the metadata was read
+            return None
+        logger.debug("Response cache hit: %s", url)
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.url = meta["url"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta["encoding"]
+        response._content = content
+        return response
+
+    def put(self, url: str, params, response, body=None):
+        """Store a successful response
+
+        `body` is the decoded JSON, if already parsed. It must include the keys in `COMPLETION_KEYS`,
+        which decide whether the game is final; if None, the full response body is decoded.
+        """
+        if response.status_code != 200:
+            return
+        if body is None:
+            try:
+                body = json.loads(response.content)
+            except ValueError:
+                body = None
+        completed = game_completed(body)
+        path = self.path_for(cache_key(url, params))
+        meta = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+            "encoding": response.encoding,
+            "sha256": hashlib.sha256(response.content).hexdigest(),
+            "completed": completed,
+            "stored_at": time.time(),
+            "expires_at": None if completed else time.time() + self.ttl,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        token = uuid.uuid4().hex
+        tmp_body, tmp_meta = f"{path}.{token}.tmp", f"{path}.json.{token}.tmp"
+        try:
+            with gzip.open(tmp_body, "wb", compresslevel=6) as f:
+                f.write(response.content)
+            with open(tmp_meta, "w") as f:
+                json.dump(meta, f)
+            # get() checks the body against the metadata's hash, so a reader between the two
+            # replaces sees a miss rather than a body paired with the wrong expiry
+            os.replace(tmp_body, path)
+            os.replace(tmp_meta, f"{path}.json")
+        finally:
+            for tmp_path in (tmp_body, tmp_meta):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def clear(self):
+        """Remove every cached response"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def _read_meta(self, path):
+        try:
+            with open(f"{path}.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+_response_cache = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide ESPN response cache
+
+    Disabled unless `set_response_cache()` has been called or `SDV_RESPONSE_CACHE=1` is set;
+    `SDV_RESPONSE_CACHE_DIR` and `SDV_RESPONSE_CACHE_TTL` configure its location and TTL.
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            cache_dir=os.environ.get("SDV_RESPONSE_CACHE_DIR"),
+            ttl=os.environ.get("SDV_RESPONSE_CACHE_TTL", DEFAULT_TTL),
+            enabled=os.environ.get("SDV_RESPONSE_CACHE", "0").lower() in ("1", "true", "yes"),
+        )
+    return _response_cache
+
+
+def set_response_cache(cache_dir=None, ttl=DEFAULT_TTL, enabled=True) -> ResponseCache:
+    """Turn on (or reconfigure) caching of the responses fetched by `dl_utils.download()`
+
+    Example:
+        `sportsdataverse.response_cache.set_response_cache(cache_dir="/data/sdv-responses", ttl=30)`
+
+    Args:
+        cache_dir (str): Directory holding the cached responses. Defaults to `~/.cache/sportsdataverse/responses`.
+        ttl (float): Seconds to keep responses for games that are not final yet.
+        enabled (bool): If False, responses are neither read from nor written to the cache.
+
+    Returns:
+        ResponseCache: The newly configured cache.
+    """
+    global _response_cache
+    _response_cache = ResponseCache(cache_dir=cache_dir, ttl=ttl, enabled=enabled)
+    return _response_cache
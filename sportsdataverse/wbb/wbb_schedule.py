@@ -3,7 +3,7 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import download, run_async
 from sportsdataverse.errors import SeasonNotFoundError
 
 
@@ -64,6 +64,26 @@ def espn_wbb_schedule(
     return ev.to_pandas() if return_as_pandas else ev
 
 
+async def aespn_wbb_schedule(
+    dates=None, groups=50, season_type=None, limit=500, return_as_pandas=False, **kwargs
+) -> pl.DataFrame:
+    """aespn_wbb_schedule() - Coroutine version of `espn_wbb_schedule()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `wbb_df = await sportsdataverse.wbb.aespn_wbb_schedule(dates=2023)`
+    """
+    return await run_async(
+        espn_wbb_schedule,
+        dates=dates,
+        groups=groups,
+        season_type=season_type,
+        limit=limit,
+        return_as_pandas=return_as_pandas,
+        **kwargs,
+    )
+
+
 def scoreboard_event_parsing(event):
     event.get("competitions")[0].get("competitors")[0].get("team").pop("links", None)
     event.get("competitions")[0].get("competitors")[1].get("team").pop("links", None)
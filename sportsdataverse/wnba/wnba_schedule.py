@@ -3,7 +3,7 @@ from datetime import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import download, run_async
 
 
 def espn_wnba_schedule(dates=None, season_type=None, limit=500, return_as_pandas=False, **kwargs) -> pl.DataFrame:
@@ -54,6 +54,25 @@ def espn_wnba_schedule(dates=None, season_type=None, limit=500, return_as_pandas
     return ev.to_pandas() if return_as_pandas else ev
 
 
+async def aespn_wnba_schedule(
+    dates=None, season_type=None, limit=500, return_as_pandas=False, **kwargs
+) -> pl.DataFrame:
+    """aespn_wnba_schedule() - Coroutine version of `espn_wnba_schedule()`, run under the shared limit
+    set with `sportsdataverse.dl_utils.set_async_concurrency()`.
+
+    Example:
+        `wnba_df = await sportsdataverse.wnba.aespn_wnba_schedule(dates=2023)`
+    """
+    return await run_async(
+        espn_wnba_schedule,
+        dates=dates,
+        season_type=season_type,
+        limit=limit,
+        return_as_pandas=return_as_pandas,
+        **kwargs,
+    )
+
+
 def scoreboard_event_parsing(event):
     event.get("competitions")[0].get("competitors")[0].get("team").pop("links", None)
     event.get("competitions")[0].get("competitors")[1].get("team").pop("links", None)
@@ -1,7 +1,10 @@
+import json
+
 import polars as pl
 import pytest
 
 from sportsdataverse.cfb.cfb_pbp import CFBPlayProcess
+from sportsdataverse.rebuild import read_checkpoint, read_rebuilt, rebuild_season
 
 
 @pytest.fixture()
@@ -26,6 +29,43 @@ def test_basic_cfb_pbp(generated_cfb_data):
     assert isinstance(pl.DataFrame(generated_cfb_data.plays_json, infer_schema_length=400), pl.DataFrame)
 
 
+def test_timeouts_only_decrease_within_a_half(generated_cfb_data):
+    plays = pl.DataFrame(generated_cfb_data.plays_json, infer_schema_length=400)
+    for side in ["home", "away"]:
+        assert plays[f"end.{side}TeamTimeouts"].max() <= 3
+        steps = plays.select(pl.col(f"end.{side}TeamTimeouts").diff().over("half")).to_series().drop_nulls()
+        assert steps.max() <= 0
+
+
+def test_process_many_matches_single_games():
+    game_ids = [401301025, 401403867]
+    batch = CFBPlayProcess.process_many([CFBPlayProcess(gameId=g).espn_cfb_pbp() for g in game_ids])
+    for game_id, processed in zip(game_ids, batch):
+        single = CFBPlayProcess(gameId=game_id)
+        single.espn_cfb_pbp()
+        single.run_processing_pipeline()
+        assert processed["gameId"] == game_id
+        assert [p["EPA"] for p in processed["plays"]] == pytest.approx([p["EPA"] for p in single.plays_json])
+        assert [p["wpa"] for p in processed["plays"]] == pytest.approx([p["wpa"] for p in single.plays_json])
+
+
+def test_rebuild_season_resumes(tmp_path):
+    game_ids = [401301025, 401403867]
+    json_dir = tmp_path / "json"
+    json_dir.mkdir()
+    for game_id in game_ids:
+        (json_dir / f"{game_id}.json").write_text(json.dumps(CFBPlayProcess(gameId=game_id).espn_cfb_pbp()))
+    output_dir = tmp_path / "processed"
+    result = rebuild_season(str(json_dir), str(output_dir), max_workers=2, chunk_size=1)
+    assert result["completed"] == game_ids and not result["failed"]
+    assert read_checkpoint(str(output_dir)) == set(game_ids)
+    assert sorted(read_rebuilt(str(output_dir))["game_id"].unique().to_list()) == game_ids
+    assert sorted(read_rebuilt(str(output_dir), "team")["game_id"].unique().to_list()) == game_ids
+
+    result = rebuild_season(str(json_dir), str(output_dir), max_workers=2, chunk_size=1)
+    assert result["completed"] == [] and result["skipped"] == game_ids
+
+
 def test_cfb_adv_box_score(cfb_box_score):
     assert cfb_box_score is not None
     assert not set(cfb_box_score.keys()).difference(
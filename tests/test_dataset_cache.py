@@ -0,0 +1,103 @@
+import functools
+import http.server
+import os
+import threading
+
+import pytest
+
+from sportsdataverse import dataset_cache
+from sportsdataverse.dataset_cache import DatasetCache, parse_size
+
+
+class _CountingHandler(http.server.SimpleHTTPRequestHandler):
+    statuses = []
+
+    def send_response(self, code, message=None):
+        self.statuses.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def file_server(tmp_path):
+    served = tmp_path / "served"
+    served.mkdir()
+    for name, size in [("a.parquet", 600), ("b.parquet", 600)]:
+        (served / name).write_bytes(os.urandom(size))
+    _CountingHandler.statuses = []
+    handler = functools.partial(_CountingHandler, directory=str(served))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", _CountingHandler.statuses
+    server.shutdown()
+
+
+def test_fetch_revalidates_instead_of_downloading(file_server, tmp_path):
+    base_url, statuses = file_server
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+    first = cache.fetch(f"{base_url}/a.parquet")
+    second = cache.fetch(f"{base_url}/a.parquet")
+    assert first == second
+    assert os.path.getsize(first) == 600
+    assert statuses == [200, 304]
+
+
+def test_evicts_least_recently_used(file_server, tmp_path):
+    base_url, _ = file_server
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"), max_size=1000, min_age=0)
+    a = cache.fetch(f"{base_url}/a.parquet")
+    b = cache.fetch(f"{base_url}/b.parquet")
+    assert os.path.exists(b)
+    assert not os.path.exists(a)
+
+
+def test_evict_keeps_recent_and_locked_files(file_server, tmp_path):
+    base_url, _ = file_server
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"), max_size=1000)
+    a = cache.fetch(f"{base_url}/a.parquet")
+    b = cache.fetch(f"{base_url}/b.parquet")
+    assert os.path.exists(a) and os.path.exists(b)
+
+    cache.min_age = 0
+    with cache._lock_for(a):
+        cache.evict(keep=b)
+    assert os.path.exists(a)
+    cache.evict(keep=b)
+    assert not os.path.exists(a)
+
+
+def test_fetch_derived_builds_once(file_server, tmp_path):
+    base_url, statuses = file_server
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+    builds = []
+
+    def build(source, target):
+        builds.append(source)
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            dst.write(src.read()[:10])
+
+    first = cache.fetch_derived(f"{base_url}/a.parquet", "head", build)
+    second = cache.fetch_derived(f"{base_url}/a.parquet", "head", build)
+    assert first == second
+    assert os.path.getsize(first) == 10
+    assert len(builds) == 1
+    assert statuses == [200, 304]
+
+
+def test_parse_size():
+    assert parse_size("2GB") == 2 * 1024**3
+    assert parse_size("500MB") == 500 * 1024**2
+    assert parse_size(1024) == 1024
+
+
+@pytest.mark.parametrize("value, enabled", [(None, False), ("0", False), ("1", True)])
+def test_process_cache_is_opt_in(monkeypatch, value, enabled):
+    monkeypatch.setattr(dataset_cache, "_dataset_cache", None)
+    if value is None:
+        monkeypatch.delenv("SDV_CACHE", raising=False)
+    else:
+        monkeypatch.setenv("SDV_CACHE", value)
+    assert dataset_cache.get_dataset_cache().enabled is enabled
@@ -1,7 +1,37 @@
+import asyncio
+import http.server
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
 import pytest
 import requests
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse import dl_utils, metrics
+from sportsdataverse.dl_utils import (
+    CassetteMissError,
+    ESPNHTTP,
+    ESPNResponse,
+    JSONResponse,
+    RateLimiter,
+    RecordingTransport,
+    ReplayTransport,
+    adownload,
+    download,
+    get_rate_limiter,
+    get_session,
+    json_loads,
+    json_loads_keys,
+    run_async,
+    set_async_concurrency,
+    set_rate_limit,
+    set_transport,
+    stack_frames,
+)
+from sportsdataverse.errors import NoESPNDataError
 
 
 class TestDownload:
@@ -44,3 +74,343 @@ class TestDownload:
         url = "https://thisisnotavalidurl.com"
         with pytest.raises(requests.exceptions.RequestException):
             download(url)
+
+
+class _ScriptedHandler(http.server.BaseHTTPRequestHandler):
+    # Responses served in order, as (status, headers) pairs; the last one repeats
+    script = []
+    requests_seen = 0
+    delay = 0
+
+    def do_GET(self):
+        status, headers = self.script[min(type(self).requests_seen, len(self.script) - 1)]
+        type(self).requests_seen += 1
+        time.sleep(self.delay)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def scripted_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def serve(*script):
+        _ScriptedHandler.script = list(script)
+        _ScriptedHandler.requests_seen = 0
+        _ScriptedHandler.delay = 0
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield serve
+    server.shutdown()
+
+
+class TestDownloadRetries:
+    # Tests that 5xx responses are retried until the server recovers, honouring Retry-After
+    def test_retries_server_errors(self, scripted_server):
+        url = scripted_server((503, {"Retry-After": "0"}), (500, {}), (200, {}))
+        response = download(url, backoff_factor=0)
+        assert response.json() == {"ok": True}
+        assert _ScriptedHandler.requests_seen == 3
+
+    # Tests that the last error is raised once the retries are used up
+    def test_raises_after_retries_exhausted(self, scripted_server):
+        url = scripted_server((502, {}))
+        with pytest.raises(requests.exceptions.HTTPError):
+            download(url, num_retries=2, backoff_factor=0)
+        assert _ScriptedHandler.requests_seen == 3
+
+    # Tests that a 404 is not retried
+    def test_not_found_is_not_retried(self, scripted_server):
+        url = scripted_server((404, {}))
+        with pytest.raises(NoESPNDataError):
+            download(url, backoff_factor=0)
+        assert _ScriptedHandler.requests_seen == 1
+
+    # Tests that other client errors are raised without retrying
+    def test_client_error_is_not_retried(self, scripted_server):
+        url = scripted_server((403, {}))
+        with pytest.raises(requests.exceptions.HTTPError):
+            download(url, backoff_factor=0)
+        assert _ScriptedHandler.requests_seen == 1
+
+    # Tests that every call shares the same pooled session
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+
+class TestAsyncDownload:
+    # Tests that adownload returns the same response as download
+    def test_adownload(self, scripted_server):
+        url = scripted_server((200, {}))
+        response = asyncio.run(adownload(url))
+        assert response.json() == {"ok": True}
+
+    # Tests that no more than the configured number of calls run at once
+    def test_concurrency_limit(self):
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def fetch(i):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return i
+
+        async def fetch_all():
+            return await asyncio.gather(*(run_async(fetch, i) for i in range(8)))
+
+        set_async_concurrency(2)
+        try:
+            assert asyncio.run(fetch_all()) == list(range(8))
+        finally:
+            set_async_concurrency()
+        assert peak[0] == 2
+
+
+class TestRateLimiter:
+    # Tests that requests beyond the burst are spaced out at the configured rate
+    def test_rate(self):
+        limiter = RateLimiter(requests_per_second=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            with limiter:
+                pass
+        assert time.monotonic() - start >= 0.18
+
+    # Tests that no more than max_in_flight requests run at once across threads
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def request():
+            with limiter:
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert peak[0] == 2
+
+    # Tests that limits are configured per host, with "*" as the fallback
+    def test_per_host_limits(self):
+        set_rate_limit("site.api.espn.com", requests_per_second=5)
+        set_rate_limit("*", max_in_flight=4)
+        try:
+            site = get_rate_limiter("http://site.api.espn.com/apis/site/v2/sports")
+            assert site is get_rate_limiter("http://SITE.api.espn.com/other")
+            assert site.requests_per_second == 5
+            assert get_rate_limiter("https://sports.core.api.espn.com/v2").max_in_flight == 4
+        finally:
+            set_rate_limit("site.api.espn.com")
+            set_rate_limit("*")
+        assert get_rate_limiter("http://site.api.espn.com/").requests_per_second is None
+
+
+class TestJSONResponse:
+    # Tests that the body is decoded once and the result memoised
+    def test_json_is_parsed_once(self, scripted_server):
+        url = scripted_server((200, {}))
+        response = download(url)
+        assert isinstance(response, JSONResponse)
+        assert response.json() is response.json()
+        assert response.status_code == 200
+
+    # Tests that the decoder falls back to the standard library for inputs it rejects
+    def test_json_loads(self):
+        assert json_loads(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+        assert math.isnan(json_loads(b'{"x": NaN}')["x"])
+        with pytest.raises(ValueError):
+            json_loads(b"<html>")
+
+    # Tests that only the requested top-level keys are decoded, with and without msgspec
+    @pytest.mark.parametrize("use_msgspec", [True, False])
+    def test_json_loads_keys(self, use_msgspec, monkeypatch):
+        if not use_msgspec:
+            monkeypatch.setattr(dl_utils, "msgspec", None)
+        elif dl_utils.msgspec is None:
+            pytest.skip("msgspec is not installed")
+        body = b'{"header": {"id": "1"}, "videos": [{"s": "]}\\"}"}], "plays": [1, 2], "odds": null}'
+        assert json_loads_keys(body, ["header", "plays", "missing"]) == {"header": {"id": "1"}, "plays": [1, 2]}
+        assert json_loads_keys(b"[1, 2]", ["plays"]) == [1, 2]
+        with pytest.raises(ValueError):
+            json_loads_keys(b'{"plays": [1,', ["plays"])
+
+    # Tests that ESPNResponse.get_json() re-serializes the decoded payload, as it always has
+    def test_espn_response_get_json(self):
+        response = ESPNResponse('{"b": 1,  "a": [1, 2]}', 200, "https://example.com")
+        assert response.get_dict() == {"b": 1, "a": [1, 2]}
+        assert response.get_json() == json.dumps({"b": 1, "a": [1, 2]})
+
+    # Tests that the selected values decode when the fast backends are disabled
+    def test_json_loads_keys_stdlib_backend(self, monkeypatch):
+        if dl_utils.msgspec is None:
+            pytest.skip("msgspec is not installed")
+        monkeypatch.setattr(dl_utils, "JSON_BACKEND", "json")
+        body = b'{"header": {"id": "1"}, "plays": [1, 2], "odds": null}'
+        assert json_loads_keys(body, ["header", "plays"]) == {"header": {"id": "1"}, "plays": [1, 2]}
+
+    # Tests that download() hands back only the requested keys, plus the `code` error marker
+    def test_download_json_keys(self, scripted_server):
+        url = scripted_server((200, {}))
+        assert download(url, json_keys=["plays"]).json() == {}
+        assert download(url, json_keys=["ok"]).json() == {"ok": True}
+
+
+class TestCoalescing:
+    # Tests that concurrent calls for the same URL share one request but not one decoded payload
+    def test_concurrent_calls_share_a_request(self, scripted_server):
+        url = scripted_server((200, {}))
+        _ScriptedHandler.delay = 0.2
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(lambda _: download(url, params={"event": 1}), range(5)))
+        assert _ScriptedHandler.requests_seen == 1
+        assert all(response.json() == {"ok": True} for response in responses)
+        assert len({id(response.json()) for response in responses}) == 5
+
+    # Tests that calls sending different headers are not coalesced
+    def test_different_headers_are_not_shared(self, scripted_server):
+        url = scripted_server((200, {}))
+        _ScriptedHandler.delay = 0.2
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda token: download(url, headers={"Authorization": token}), ["a", "b"]))
+        assert _ScriptedHandler.requests_seen == 2
+
+    # Tests that coalescing can be turned off per call
+    def test_coalesce_off(self, scripted_server):
+        url = scripted_server((200, {}))
+        _ScriptedHandler.delay = 0.1
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: download(url, coalesce=False), range(3)))
+        assert _ScriptedHandler.requests_seen == 3
+
+
+class TestTransport:
+    # Tests that recorded responses replay without the network, ignoring cache busters
+    def test_record_then_replay(self, scripted_server, tmp_path):
+        url = scripted_server((200, {}))
+        set_transport(RecordingTransport(str(tmp_path)))
+        try:
+            recorded = download(f"{url}?event=1&1697654321000")
+            set_transport(ReplayTransport(str(tmp_path)))
+            replayed = download(f"{url}?event=1&1697654399999")
+        finally:
+            set_transport()
+        assert _ScriptedHandler.requests_seen == 1
+        assert replayed.json() == recorded.json()
+        assert replayed.status_code == 200
+
+    # Tests that a request missing from the cassette fails instead of going to the network
+    def test_replay_miss(self, scripted_server, tmp_path):
+        url = scripted_server((200, {}))
+        set_transport(ReplayTransport(str(tmp_path)))
+        try:
+            with pytest.raises(CassetteMissError):
+                download(url)
+        finally:
+            set_transport()
+        assert _ScriptedHandler.requests_seen == 0
+
+
+class _ScriptedEndpoint(ESPNHTTP):
+    headers = {"Accept": "application/json"}
+
+
+class TestESPNHTTP:
+    # Tests that the client retries through the shared session and memoises the parsed body
+    def test_send_api_request(self, scripted_server):
+        url = scripted_server((503, {}), (200, {}))
+        client = _ScriptedEndpoint()
+        client.base_url = url + "{endpoint}"
+        client.backoff_factor = 0
+        data = client.send_api_request("scoreboard", {"b": 2, "a": 1}, referer="https://www.espn.com")
+        assert _ScriptedHandler.requests_seen == 2
+        assert data.get_url().endswith("/scoreboard?a=1&b=2")
+        assert data.get_dict() is data.get_dict()
+        assert data.get_dict() == {"ok": True}
+        assert "Referer" not in _ScriptedEndpoint.headers
+
+    # Tests the coroutine counterpart
+    def test_asend_api_request(self, scripted_server):
+        url = scripted_server((200, {}))
+        client = _ScriptedEndpoint()
+        client.base_url = url + "{endpoint}"
+
+        async def fetch_all():
+            return await asyncio.gather(*(client.asend_api_request("summary", {"event": i}) for i in range(4)))
+
+        responses = asyncio.run(fetch_all())
+        assert [response.get_dict() for response in responses] == [{"ok": True}] * 4
+
+
+@pytest.fixture()
+def collector():
+    collector = metrics.MetricsCollector()
+    metrics.add_hook(collector)
+    yield collector
+    metrics.remove_hook(collector)
+
+
+class TestMetrics:
+    # Tests that a download emits one event with its retries, status, size and timings
+    def test_request_event(self, scripted_server, collector):
+        url = scripted_server((503, {}), (200, {}))
+        download(url + "scoreboard", params={"dates": 2022}, backoff_factor=0)
+        (event,) = collector.events
+        assert event["endpoint"].endswith("/scoreboard")
+        assert (event["status"], event["attempts"], event["retries"]) == (200, 2, 1)
+        assert event["bytes"] == len(b'{"ok": true}')
+        assert event["cache"] == "off" and event["error"] is None
+        assert 0 <= event["ttfb"] <= event["total"]
+
+    # Tests that failures are recorded with the exception name
+    def test_error_event(self, scripted_server, collector):
+        url = scripted_server((404, {}))
+        with pytest.raises(NoESPNDataError):
+            download(url)
+        assert collector.events[0]["error"] == "HTTP 404"
+
+    # Tests the per-endpoint summary and the function timer
+    def test_summary(self, collector):
+        for total in [0.1, 0.2, 0.3, 0.4]:
+            collector(metrics.request_event("http://x.com/summary?event=1", status=200, attempts=2, total=total))
+
+        @metrics.timed("parse")
+        def parse():
+            return 1
+
+        assert parse() == 1
+        summary = collector.summary()
+        row = summary.filter(summary["endpoint"] == "http://x.com/summary").row(0, named=True)
+        assert (row["count"], row["retries"], row["total_p50"], row["total_p99"]) == (4, 4, 0.2, 0.4)
+        assert summary.filter(summary["endpoint"] == "parse")["kind"].to_list() == ["function"]
+
+
+# Tests that frames with different columns and dtypes stack, filling and casting as needed
+def test_stack_frames():
+    first = pl.DataFrame({"id": [1, 2], "yds": [None, None], "text": ["a", "b"]})
+    second = pl.DataFrame({"id": [3], "yds": [4.5], "flag": [True]})
+    stacked = stack_frames([first, second])
+    assert stacked.columns == ["id", "yds", "text", "flag"]
+    assert stacked["yds"].dtype == pl.Float64
+    assert stacked["flag"].to_list() == [None, None, True]
+    mixed = stack_frames([pl.DataFrame({"flag": [True]}), pl.DataFrame({"flag": ["no"]})])
+    assert mixed["flag"].to_list() == ["true", "no"]
@@ -0,0 +1,170 @@
+import os
+
+import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from sportsdataverse.errors import SeasonNotFoundError
+from sportsdataverse.loader_utils import (
+    as_return_type,
+    compact_frame,
+    export_dataset,
+    iter_seasons,
+    load_seasons,
+    normalize_filters,
+    scan_dataset,
+    select_and_filter,
+)
+
+
+@pytest.fixture()
+def season_files(tmp_path):
+    for season in range(2019, 2023):
+        pl.DataFrame({"season": [season] * 3, "game_id": [1, 2, 3]}).write_parquet(tmp_path / f"pbp_{season}.parquet")
+    yield str(tmp_path / "pbp_{season}.parquet")
+
+
+def test_load_seasons_keeps_requested_order(season_files):
+    data = load_seasons(season_files, [2022, 2019, 2021], min_season=2019, max_workers=3)
+    assert data.height == 9
+    assert data["season"].unique(maintain_order=True).to_list() == [2022, 2019, 2021]
+
+
+def test_load_seasons_single_season(season_files):
+    data = load_seasons(season_files, 2020, min_season=2019)
+    assert data["season"].unique().to_list() == [2020]
+
+
+def test_load_seasons_below_min_season(season_files):
+    with pytest.raises(SeasonNotFoundError):
+        load_seasons(season_files, [2018, 2019], min_season=2019)
+
+
+def test_load_seasons_missing_ok(season_files):
+    data = load_seasons(season_files, [2019, 2030], min_season=2019, missing_ok=True)
+    assert data["season"].unique().to_list() == [2019]
+
+
+def test_load_seasons_columns_and_filters(season_files):
+    data = load_seasons(season_files, [2019, 2020], min_season=2019, columns=["game_id"], filters={"game_id": [1, 3]})
+    assert data.columns == ["game_id"]
+    assert data["game_id"].to_list() == [1, 3, 1, 3]
+
+
+def test_normalize_filters():
+    assert normalize_filters({"week": range(1, 3), "season_type": "REG"}) == [
+        ("week", "in", [1, 2]),
+        ("season_type", "==", "REG"),
+    ]
+    assert normalize_filters([["week", ">", 17]]) == [("week", ">", 17)]
+    assert normalize_filters(None) is None
+
+
+def test_select_and_filter():
+    data = pl.DataFrame({"week": [1, 2, 3], "team": ["A", "B", "C"]})
+    filtered = select_and_filter(data, columns=["team"], filters=[("week", ">=", 2)])
+    assert filtered["team"].to_list() == ["B", "C"]
+
+
+def test_load_seasons_lazy(season_files):
+    data = load_seasons(season_files, [2019, 2020], min_season=2019, filters={"game_id": 2}, lazy=True)
+    assert isinstance(data, pl.LazyFrame)
+    assert data.collect()["season"].to_list() == [2019, 2020]
+
+
+def test_as_return_type():
+    data = pl.DataFrame({"a": [1, 2]})
+    assert isinstance(as_return_type(data.lazy()), pl.DataFrame)
+    assert isinstance(as_return_type(data, return_as="lazy"), pl.LazyFrame)
+    assert isinstance(as_return_type(data, return_as_pandas=True), pd.DataFrame)
+    with pytest.raises(ValueError):
+        as_return_type(data, return_as="arrow")
+
+
+def test_iter_seasons_by_season(season_files):
+    batches = list(iter_seasons(season_files, [2019, 2021], min_season=2019, columns=["season"]))
+    assert [batch["season"].unique().to_list() for batch in batches] == [[2019], [2021]]
+
+
+def test_iter_seasons_by_row_group(tmp_path):
+    data = pl.DataFrame({"season": [2020] * 10, "week": list(range(1, 11))})
+    pq.write_table(data.to_arrow(), tmp_path / "pbp_2020.parquet", row_group_size=4)
+    batches = list(
+        iter_seasons(
+            str(tmp_path / "pbp_{season}.parquet"),
+            2020,
+            min_season=2019,
+            batch="row_group",
+            columns=["season"],
+            filters=[("week", ">", 6)],
+        )
+    )
+    assert [batch.height for batch in batches] == [2, 2]
+    assert batches[0].columns == ["season"]
+
+
+def test_iter_seasons_validates_eagerly(season_files):
+    with pytest.raises(SeasonNotFoundError):
+        iter_seasons(season_files, [2010], min_season=2019)
+    with pytest.raises(ValueError):
+        iter_seasons(season_files, [2020], min_season=2019, batch="week")
+
+
+def test_compact_frame():
+    data = pl.DataFrame(
+        {
+            "posteam": ["KC", "BUF"] * 50,
+            "desc": [f"play {i}" for i in range(100)],
+            "down": [1.0, 2.0, 3.0, None] * 25,
+            "epa": [0.5] * 100,
+            "play_id": list(range(0, 100000, 1000)),
+        }
+    )
+    compacted = compact_frame(data)
+    assert compacted.schema["posteam"] == pl.Categorical
+    assert compacted.schema["desc"] == pl.Utf8
+    assert compacted.schema["down"] == pl.Int8
+    assert compacted.schema["epa"] == pl.Float64
+    assert compacted.schema["play_id"] == pl.Int32
+    assert compacted["down"].to_list() == [1, 2, 3, None] * 25
+
+
+def test_load_seasons_compact_concatenates_seasons(tmp_path):
+    pl.DataFrame({"posteam": ["KC", "BUF"] * 10, "yards": [5] * 20}).write_parquet(tmp_path / "pbp_2020.parquet")
+    pl.DataFrame({"posteam": ["NE", "MIA"] * 10, "yards": [500] * 20}).write_parquet(tmp_path / "pbp_2021.parquet")
+    data = load_seasons(str(tmp_path / "pbp_{season}.parquet"), [2020, 2021], min_season=2019, compact=True)
+    assert data.schema["posteam"] == pl.Categorical
+    assert data.schema["yards"] == pl.Int16
+    assert data.height == 40
+    assert not pl.using_string_cache()
+
+
+def test_load_seasons_compact_rejects_lazy(tmp_path):
+    with pytest.raises(ValueError):
+        load_seasons(str(tmp_path / "pbp_{season}.parquet"), [2020], min_season=2019, compact=True, lazy=True)
+
+
+def test_export_dataset_round_trip(tmp_path):
+    data = pl.DataFrame(
+        {
+            "season": [2021, 2021, 2022, 2021],
+            "week": [1, 1, 1, 2],
+            "game_id": ["b", "a", "c", "d"],
+            "epa": [0.1, 0.2, 0.3, 0.4],
+        }
+    )
+    path = str(tmp_path / "pbp")
+    export_dataset(data, path, partition_by=["season", "week"])
+    written = pq.ParquetFile(tmp_path / "pbp" / "season=2021" / "week=1" / "part-0.parquet")
+    assert written.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert written.read().column("game_id").to_pylist() == ["a", "b"]
+    week_one = scan_dataset(path, columns=["game_id"], filters={"season": 2021, "week": 1}).collect()
+    assert week_one["game_id"].to_list() == ["a", "b"]
+
+
+def test_load_seasons_to_partitioned(season_files, tmp_path):
+    path = str(tmp_path / "exported")
+    data = load_seasons(season_files, [2019, 2020], min_season=2019, to_partitioned=path)
+    assert sorted(os.listdir(path)) == ["season=2019", "season=2020"]
+    assert scan_dataset(path).collect().height == data.height
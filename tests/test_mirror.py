@@ -0,0 +1,125 @@
+import functools
+import http.server
+import os
+import threading
+
+import polars as pl
+import pytest
+
+from sportsdataverse import dataset_cache
+from sportsdataverse.cli import parse_seasons
+from sportsdataverse.loader_utils import cached_derived_path, cached_path, read_parquet_url
+from sportsdataverse.mirror import (
+    DATASETS,
+    MirrorIntegrityError,
+    download_resumable,
+    mirror_path,
+    set_mirror_dir,
+    sync,
+)
+
+
+class _RangeHandler(http.server.SimpleHTTPRequestHandler):
+    ranges = []
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        start = 0
+        range_header = self.headers.get("Range")
+        self.ranges.append(range_header)
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def release_server(tmp_path):
+    served = tmp_path / "served"
+    served.mkdir()
+    pl.DataFrame({"season": [2020, 2020], "week": [1, 2]}).write_parquet(served / "pbp_2020.parquet")
+    (served / "broken_2020.parquet").write_bytes(b"not a parquet file")
+    _RangeHandler.ranges = []
+    handler = functools.partial(_RangeHandler, directory=str(served))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", served, _RangeHandler.ranges
+    server.shutdown()
+    set_mirror_dir(None)
+
+
+def test_download_resumes_partial_file(release_server, tmp_path):
+    base_url, served, ranges = release_server
+    dest = str(tmp_path / "mirror" / "pbp_2020.parquet")
+    os.makedirs(os.path.dirname(dest))
+    body = (served / "pbp_2020.parquet").read_bytes()
+    with open(f"{dest}.part", "wb") as f:
+        f.write(body[:100])
+    download_resumable(f"{base_url}/pbp_2020.parquet", dest)
+    assert ranges == ["bytes=100-"]
+    assert open(dest, "rb").read() == body
+    assert not os.path.exists(f"{dest}.part")
+
+
+def test_download_rejects_corrupt_file(release_server, tmp_path):
+    base_url, _, _ = release_server
+    dest = str(tmp_path / "mirror" / "broken_2020.parquet")
+    with pytest.raises(MirrorIntegrityError):
+        download_resumable(f"{base_url}/broken_2020.parquet", dest)
+    assert not os.path.exists(dest)
+    assert not os.path.exists(f"{dest}.part")
+
+
+def test_loaders_read_from_mirror(release_server, tmp_path, monkeypatch):
+    base_url, _, ranges = release_server
+    monkeypatch.setitem(DATASETS, "test_pbp", (base_url + "/pbp_{season}.parquet", 2019))
+    mirror_dir = str(tmp_path / "mirror")
+    paths = sync(["test_pbp"], seasons=[2019, 2020], mirror_dir=mirror_dir)
+    url = f"{base_url}/pbp_2020.parquet"
+    assert paths == [mirror_path(url, mirror_dir)]
+    set_mirror_dir(mirror_dir)
+    requests_before = len(ranges)
+    assert cached_path(url) == paths[0]
+    assert read_parquet_url(url, columns=["week"]).to_series().to_list() == [1, 2]
+    assert len(ranges) == requests_before
+
+
+def test_derived_files_from_mirror_are_built_in_cache(release_server, tmp_path, monkeypatch):
+    base_url, _, _ = release_server
+    monkeypatch.setitem(DATASETS, "test_pbp", (base_url + "/pbp_{season}.parquet", 2019))
+    mirror_dir = str(tmp_path / "mirror")
+    sync(["test_pbp"], seasons=[2020], mirror_dir=mirror_dir)
+    set_mirror_dir(mirror_dir)
+    monkeypatch.setattr(dataset_cache, "_dataset_cache", None)
+    cache = dataset_cache.set_dataset_cache(cache_dir=str(tmp_path / "cache"))
+    builds = []
+
+    def build(source, target):
+        builds.append(source)
+        pl.read_parquet(source).write_csv(target)
+
+    url = f"{base_url}/pbp_2020.parquet"
+    mirror_files = sorted(os.listdir(os.path.dirname(mirror_path(url, mirror_dir))))
+    target = cached_derived_path(url, "csv", build)
+    assert cached_derived_path(url, "csv", build) == target
+    assert builds == [mirror_path(url, mirror_dir)]
+    assert os.path.dirname(target) == cache.cache_dir
+    assert pl.read_csv(target)["week"].to_list() == [1, 2]
+    assert sorted(os.listdir(os.path.dirname(mirror_path(url, mirror_dir)))) == mirror_files
+
+
+def test_parse_seasons():
+    assert parse_seasons("2019-2021") == [2019, 2020, 2021]
+    assert parse_seasons("2019,2022-2023") == [2019, 2022, 2023]
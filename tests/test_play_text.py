@@ -0,0 +1,40 @@
+import polars as pl
+import pytest
+
+from sportsdataverse.play_text import TEXT_FLAGS, TEXT_YARDAGES, play_text_tokens, text_has, text_yards
+
+TEXTS = [
+    "Jordan Travis pass complete to Johnny Wilson for 23 yds to the CLEM 30 for a 1ST down",
+    "Jordan Travis sacked by Myles Murphy for a loss of 8 yards to the FSU 17",
+    "Treshaun Ward run for no gain to the FSU 40",
+    "Trey Benson 12 Yd Run (Ryan Fitzgerald Kick)",
+    "Alex Mastromanno punt for 44 yds , Will Taylor returns for 9 yds to the CLEM 31",
+    "Clemson Penalty, Offensive Holding (10 Yards) to the CLEM 20",
+    "B.T. Potter kickoff for 65 yds for a touchback",
+    "Jordan Travis pass intercepted Trenton Simpson return for 31 yds for a TD",
+    "Timeout Florida State, clock 02:14",
+    None,
+]
+
+
+@pytest.fixture()
+def tokens():
+    frame = pl.DataFrame({"text": TEXTS}, schema={"text": pl.Utf8})
+    return frame.with_columns(play_text_tokens(pl.col("text").str.to_lowercase()))
+
+
+@pytest.mark.parametrize("pattern", TEXT_FLAGS)
+def test_text_has_matches_case_insensitive_contains(tokens, pattern):
+    expected = tokens.select(pl.col("text").str.contains(f"(?i){pattern}")).to_series().to_list()
+    assert tokens.select(text_has(pattern)).to_series().to_list() == expected
+
+
+@pytest.mark.parametrize("pattern", TEXT_YARDAGES)
+def test_text_yards_matches_case_insensitive_extract(tokens, pattern):
+    expected = pl.col("text").str.extract(f"(?i){pattern}").str.extract(r"(\d+)").cast(pl.Int32)
+    assert tokens.select(text_yards(pattern)).to_series().to_list() == tokens.select(expected).to_series().to_list()
+
+
+def test_unknown_pattern_raises():
+    with pytest.raises(KeyError):
+        text_has("not a registered pattern")
@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from sportsdataverse import rebuild
+from sportsdataverse.rebuild import read_checkpoint, read_rebuilt, rebuild_season
+
+
+class FakePlayProcess:
+    """Stand-in for CFBPlayProcess: three plays and one team box score row per game"""
+
+    def __init__(self, gameId=0, path_to_json="/", return_keys=None, **kwargs):
+        self.gameId = int(gameId)
+        self.path_to_json = path_to_json
+
+    def fake_pbp_disk(self):
+        with open(os.path.join(self.path_to_json, f"{self.gameId}.json")) as f:
+            return json.load(f)
+
+    @classmethod
+    def process_many(cls, jsons, return_keys=None):
+        games = []
+        for summary in jsons:
+            if summary.get("fail"):
+                raise ValueError("bad game")
+            if summary.get("corrupt"):
+                games.append({"gameId": summary["id"], "plays": [{"raw": 1}], "advBoxScore": None})
+                continue
+            plays = [{"game_id": summary["id"], "play": i} for i in range(3)]
+            games.append({"gameId": summary["id"], "plays": plays, "advBoxScore": {"team": [{"pos_team": 1}]}})
+        return games
+
+
+@pytest.fixture()
+def fake_sport(monkeypatch):
+    monkeypatch.setitem(rebuild.PROCESSORS, "fake", (__name__, "FakePlayProcess"))
+
+
+def _write_summary(json_dir, game_id, **flags):
+    (json_dir / f"{game_id}.json").write_text(json.dumps({"id": game_id, **flags}))
+
+
+def test_resume_after_failure_does_not_duplicate_rows(tmp_path, fake_sport):
+    json_dir = tmp_path / "json"
+    json_dir.mkdir()
+    for game_id in range(1, 7):
+        _write_summary(json_dir, game_id, fail=game_id == 2, corrupt=game_id == 5)
+    output_dir = str(tmp_path / "processed")
+
+    result = rebuild_season(str(json_dir), output_dir, sport="fake", max_workers=2, chunk_size=3)
+    assert result["completed"] == [1, 3, 4, 6]
+    assert sorted(result["failed"]) == [2, 5]
+    assert read_checkpoint(output_dir) == {1, 3, 4, 6}
+
+    _write_summary(json_dir, 2)
+    result = rebuild_season(str(json_dir), output_dir, sport="fake", max_workers=2, chunk_size=3)
+    assert result["completed"] == [2]
+    assert list(result["failed"]) == [5]
+
+    plays = read_rebuilt(output_dir)
+    assert plays.height == 15
+    assert plays.select(["game_id", "play"]).is_duplicated().sum() == 0
+    assert sorted(read_rebuilt(output_dir, "team")["game_id"].to_list()) == [1, 2, 3, 4, 6]
@@ -0,0 +1,100 @@
+import functools
+import http.server
+import os
+import threading
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sportsdataverse import dataset_cache, dl_utils
+from sportsdataverse.loader_utils import read_parquet_url
+from sportsdataverse.remote_parquet import HTTPRangeFile, read_parquet_range
+
+
+class _ByteRangeHandler(http.server.SimpleHTTPRequestHandler):
+    bytes_sent = []
+
+    def end_headers(self):
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        with open(path, "rb") as f:
+            body = f.read()
+        range_header = self.headers.get("Range")
+        if range_header is None:
+            self.send_response(200)
+        else:
+            start, end = (int(x) for x in range_header.split("=")[1].split("-"))
+            body = body[start : end + 1]
+            self.send_response(206)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.bytes_sent.append(len(body))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def parquet_server(tmp_path):
+    served = tmp_path / "served"
+    served.mkdir()
+    rng = np.random.default_rng(0)
+    table = pa.table(
+        {
+            "week": np.repeat(np.arange(1, 9), 20_000),
+            "epa": rng.normal(size=160_000),
+            "wpa": rng.normal(size=160_000),
+            "desc": [f"play {i}" for i in rng.integers(0, 10**9, size=160_000)],
+        }
+    )
+    pq.write_table(table, served / "pbp_2020.parquet", row_group_size=20_000)
+    _ByteRangeHandler.bytes_sent = []
+    handler = functools.partial(_ByteRangeHandler, directory=str(served))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/pbp_2020.parquet", served / "pbp_2020.parquet"
+    server.shutdown()
+
+
+def test_range_file_reads_like_a_local_file(parquet_server):
+    url, local = parquet_server
+    body = local.read_bytes()
+    with HTTPRangeFile(url, readahead=4096) as f:
+        f.seek(-8, os.SEEK_END)
+        assert f.read() == body[-8:]
+        f.seek(10_000)
+        assert f.read(5000) == body[10_000:15_000]
+        assert f.bytes_fetched < len(body)
+
+
+def test_range_file_uses_the_shared_session(parquet_server):
+    url, _ = parquet_server
+    session = dl_utils.configure_session(pool_size=4)
+    with HTTPRangeFile(url) as f:
+        assert f.session is session
+
+
+def test_projection_downloads_a_fraction_of_the_file(parquet_server):
+    url, local = parquet_server
+    data = read_parquet_range(url, columns=["week"], filters=[("week", "==", 3)])
+    assert data.height == 20_000
+    assert data["week"].unique().to_list() == [3]
+    assert sum(_ByteRangeHandler.bytes_sent) < os.path.getsize(local) / 4
+
+
+def test_read_parquet_url_uses_range_reads_when_not_cached(parquet_server, tmp_path, monkeypatch):
+    url, local = parquet_server
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(dataset_cache, "_dataset_cache", dataset_cache.DatasetCache(cache_dir=str(cache_dir)))
+    data = read_parquet_url(url, columns=["epa"])
+    assert data.columns == ["epa"]
+    assert data["epa"].to_list() == pl.read_parquet(local, columns=["epa"])["epa"].to_list()
+    assert not cache_dir.exists()
+    assert sum(_ByteRangeHandler.bytes_sent) < os.path.getsize(local)
@@ -0,0 +1,93 @@
+import gzip
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+from sportsdataverse import response_cache
+from sportsdataverse.dl_utils import download
+from sportsdataverse.response_cache import ResponseCache, cache_key, game_completed
+
+
+class _SummaryHandler(http.server.BaseHTTPRequestHandler):
+    completed = True
+    requests_seen = 0
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        status = {"type": {"completed": self.completed}}
+        body = json.dumps({"header": {"competitions": [{"status": status}]}, "plays": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def summary_server(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "_response_cache", ResponseCache(cache_dir=str(tmp_path), ttl=0))
+    _SummaryHandler.requests_seen = 0
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SummaryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/summary"
+    server.shutdown()
+
+
+def test_cache_key_drops_cache_buster():
+    assert cache_key("http://x.com/summary?event=1&1697654321000") == cache_key("http://x.com/summary?event=1")
+    assert cache_key("http://x.com/s", {"b": 2, "a": 1}) == cache_key("http://x.com/s?a=1&b=2")
+    assert cache_key("http://x.com/summary?event=1") != cache_key("http://x.com/summary?event=2")
+
+
+def test_game_completed():
+    final = {"type": {"completed": True}}
+    live = {"type": {"completed": False}}
+    assert game_completed({"header": {"competitions": [{"status": final}]}})
+    assert not game_completed({"header": {"competitions": [{"status": live}]}})
+    assert game_completed({"events": [{"status": final}, {"status": final}]})
+    assert not game_completed({"events": [{"status": final}, {"status": live}]})
+    assert not game_completed([1, 2])
+
+
+def test_completed_games_are_cached_indefinitely(summary_server):
+    _SummaryHandler.completed = True
+    first = download(f"{summary_server}?event=1&1000", backoff_factor=0)
+    second = download(f"{summary_server}?event=1&2000", backoff_factor=0)
+    assert second.json() == first.json()
+    assert _SummaryHandler.requests_seen == 1
+
+
+def test_live_games_expire(summary_server):
+    _SummaryHandler.completed = False
+    download(f"{summary_server}?event=2", backoff_factor=0)
+    download(f"{summary_server}?event=2", backoff_factor=0)
+    assert _SummaryHandler.requests_seen == 2
+
+
+def test_completed_games_fetched_with_json_keys_are_cached_indefinitely(summary_server, tmp_path):
+    _SummaryHandler.completed = True
+    first = download(f"{summary_server}?event=3", backoff_factor=0, json_keys=["plays"])
+    assert first.json() == {"plays": []}
+    meta = json.loads(next(tmp_path.glob("*.gz.json")).read_text())
+    assert meta["completed"] and meta["expires_at"] is None
+    download(f"{summary_server}?event=3", backoff_factor=0)
+    assert _SummaryHandler.requests_seen == 1
+
+
+def test_body_replaced_under_stale_meta_is_a_miss(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "http://x.com/summary?event=1"
+    response._content = b'{"plays": [1]}'
+    cache.put(response.url, None, response)
+    assert cache.get(response.url).content == b'{"plays": [1]}'
+    with gzip.open(cache.path_for(cache_key(response.url)), "wb") as f:
+        f.write(b'{"plays": [2]}')
+    assert cache.get(response.url) is None